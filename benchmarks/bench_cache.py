@@ -0,0 +1,64 @@
+"""
+Read cache benchmark for the SQLite backend at several cache sizes.
+
+Runs a mix of status changes and renames through the service against a
+store of COUNT tasks, where 80% of operations touch the hottest 10% of
+tasks. Each operation reads the task before writing it, so the hit rate
+shows how much of that working set a cache size holds.
+
+Usage:
+    python -m benchmarks.bench_cache [COUNT] [OPERATIONS]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from src.interfaces.repository_factory import create_repository
+from src.use_cases.task_service import TaskService
+
+
+CACHE_SIZES = (0, 100, 1_000, 10_000)
+
+
+def run(path: str, cache_entries: int, task_ids, operations: int) -> tuple:
+    """Return (operations per second, cache stats or None) for one cache size."""
+    repository = create_repository("sqlite", path, cache_entries=cache_entries)
+    service = TaskService(repository)
+    rng = random.Random(7)
+    hot = task_ids[:len(task_ids) // 10]
+    started = time.perf_counter()
+    for i in range(operations):
+        task_id = rng.choice(hot) if rng.random() < 0.8 else rng.choice(task_ids)
+        if i % 3 == 0:
+            service.update_task(task_id, title=f"Renamed {i}")
+        elif i % 3 == 1:
+            service.mark_task_complete(task_id)
+        else:
+            service.mark_task_incomplete(task_id)
+    elapsed = time.perf_counter() - started
+    stats = repository.stats() if cache_entries else None
+    repository.close()
+    return operations / elapsed, stats
+
+
+def main(count: int = 100_000, operations: int = 20_000) -> None:
+    """Print throughput and cache counters for each cache size."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "todo.db")
+        repository = create_repository("sqlite", path)
+        task_ids = [task.id for task in TaskService(repository).add_tasks((f"Task {i}", None) for i in range(count))]
+        repository.close()
+        print(f"{'Cache size':>10} {'Ops/s':>10} {'Hit rate':>9} {'Evictions':>10}  ({count} tasks)")
+        for cache_entries in CACHE_SIZES:
+            rate, stats = run(path, cache_entries, task_ids, operations)
+            if stats is None:
+                print(f"{'off':>10} {rate:>10,.0f} {'-':>9} {'-':>10}")
+            else:
+                hit_rate = stats.hits / max(stats.hits + stats.misses, 1)
+                print(f"{cache_entries:>10} {rate:>10,.0f} {hit_rate:>9.1%} {stats.evictions:>10}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 20_000)
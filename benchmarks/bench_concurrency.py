@@ -0,0 +1,81 @@
+"""
+Concurrency stress benchmark recording ops per second as threads are added.
+
+Each thread runs a mix of read-modify-write increments (80%), point reads
+(19%) and full snapshot scans (1%) against shared tasks. Every increment
+adds one to a counter held in a task's title, so the final sum of counters
+must equal the number of increments; any shortfall is reported as lost
+updates. The unsynchronized in-memory repository runs the same mix for
+comparison. On a build with the GIL, threads cannot add throughput; the
+numbers show what the locks cost and that no update is lost.
+
+Usage:
+    python -m benchmarks.bench_concurrency [OPS_PER_THREAD]
+"""
+import random
+import sys
+import threading
+import time
+from src.entities.task import Task
+from src.interfaces.concurrent_task_repository import ConcurrentTaskRepository
+from src.interfaces.task_repository import TaskRepository
+
+
+TASKS = 1000
+THREAD_COUNTS = (1, 2, 4, 8, 16)
+
+
+def increment(task: Task) -> None:
+    """Add one to the counter kept in the task's title."""
+    task.title = str(int(task.title) + 1)
+
+
+def worker(repository, task_ids, ops: int, seed: int, increments: list) -> None:
+    """Run ``ops`` mixed operations and record how many were increments."""
+    rng = random.Random(seed)
+    count = 0
+    for _ in range(ops):
+        roll = rng.random()
+        task_id = task_ids[rng.randrange(len(task_ids))]
+        if roll < 0.80:
+            repository.modify(task_id, increment)
+            count += 1
+        elif roll < 0.99:
+            repository.get_by_id(task_id)
+        else:
+            repository.get_all()
+    increments.append(count)
+
+
+def run(factory, threads: int, ops: int):
+    """Return ops per second and lost updates for one thread count."""
+    repository = factory()
+    task_ids = [f"task-{i:05d}" for i in range(TASKS)]
+    for task_id in task_ids:
+        repository.add(Task(id=task_id, title="0"))
+    increments: list = []
+    workers = [threading.Thread(target=worker, args=(repository, task_ids, ops, seed, increments))
+               for seed in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    total = sum(int(task.title) for task in repository.get_all())
+    return threads * ops / elapsed, sum(increments) - total
+
+
+def main(ops: int = 20_000) -> None:
+    """Print ops per second and lost updates for each repository and thread count."""
+    # Switch threads often so unsynchronized read-modify-writes interleave.
+    sys.setswitchinterval(1e-5)
+    print(f"{'Repository':<12} {'Threads':>8} {'Ops/s':>12} {'Lost':>8}  ({ops} ops per thread)")
+    for name, factory in (("unlocked", TaskRepository), ("striped", ConcurrentTaskRepository)):
+        for threads in THREAD_COUNTS:
+            rate, lost = run(factory, threads, ops)
+            print(f"{name:<12} {threads:>8} {rate:>12,.0f} {lost:>8}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
@@ -0,0 +1,91 @@
+"""
+HTTP API benchmark recording requests per second against `todo api`.
+
+The server runs in its own process on the in-memory backend, so its single
+core is not shared with the load generator. Each client holds one
+keep-alive connection; with a pipeline depth above 1 it writes that many
+requests before reading the responses.
+
+Usage:
+    python -m benchmarks.bench_http [REQUESTS]
+"""
+import asyncio
+import os
+import re
+import subprocess
+import sys
+import time
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def start_server():
+    """Start `todo api` on a free port; return the process and its port."""
+    env = dict(os.environ, TODO_BACKEND="memory")
+    env.pop("TODO_DAEMON", None)
+    process = subprocess.Popen([sys.executable, "-m", "src.main", "api", "--port", "0"],
+                               cwd=ROOT, env=env, stderr=subprocess.PIPE, text=True)
+    match = re.search(r":(\d+)/", process.stderr.readline())
+    if match is None:
+        process.kill()
+        raise RuntimeError("todo api did not report its port")
+    return process, int(match.group(1))
+
+
+async def client(port: int, request: bytes, count: int, depth: int) -> None:
+    """Send ``count`` requests on one connection, ``depth`` at a time."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    for sent in range(0, count, depth):
+        batch = min(depth, count - sent)
+        writer.write(request * batch)
+        for _ in range(batch):
+            head = await reader.readuntil(b"\r\n\r\n")
+            match = re.search(rb"Content-Length: (\d+)", head)
+            if match is not None:
+                await reader.readexactly(int(match.group(1)))
+                continue
+            # A listing is sent in chunks, ending with an empty one.
+            size = -1
+            while size:
+                size = int(await reader.readuntil(b"\r\n"), 16)
+                await reader.readexactly(size + 2)
+    writer.close()
+    await writer.wait_closed()
+
+
+def requests_per_second(port: int, request: bytes, total: int, clients: int, depth: int) -> float:
+    """Time ``total`` requests spread across ``clients`` connections."""
+    async def run():
+        await asyncio.gather(*(client(port, request, total // clients, depth) for _ in range(clients)))
+    start = time.perf_counter()
+    asyncio.run(run())
+    return total / (time.perf_counter() - start)
+
+
+def main(total: int = 20_000) -> None:
+    """Print requests per second for creating and listing todos."""
+    body = b'{"title": "Benchmark todo", "description": "Created over HTTP"}'
+    post = (b"POST /api/todos HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+            b"Content-Length: %d\r\n\r\n%s" % (len(body), body))
+    get = b"GET /api/todos HTTP/1.1\r\nHost: localhost\r\n\r\n"
+    process, port = start_server()
+    try:
+        print(f"{'Request':<8} {'Clients':>8} {'Depth':>6} {'Req/s':>10}  ({total} requests)")
+        for clients, depth in ((1, 1), (8, 1), (8, 16)):
+            rate = requests_per_second(port, post, total, clients, depth)
+            print(f"{'POST':<8} {clients:>8} {depth:>6} {rate:>10,.0f}")
+        # The store now holds every todo posted above; list a small one instead.
+        process.terminate()
+        process.wait()
+        process, port = start_server()
+        for clients, depth in ((1, 1), (8, 1), (8, 16)):
+            rate = requests_per_second(port, get, total, clients, depth)
+            print(f"{'GET':<8} {clients:>8} {depth:>6} {rate:>10,.0f}")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
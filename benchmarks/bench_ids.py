@@ -0,0 +1,67 @@
+"""
+ID benchmark comparing random (uuid4) and time-ordered (uuid7) task IDs.
+
+Reports how fast each format is generated, and how fast COUNT tasks are
+inserted with it into the SQLite store (whose unique ID index is a B-tree)
+and into the sorted ID index used for prefix lookups. Time-ordered IDs
+always land at the end of both, instead of at a random position.
+
+Usage:
+    python -m benchmarks.bench_ids [COUNT]
+"""
+import os
+import sys
+import tempfile
+import time
+from src.entities.task import Task
+from src.entities.task_id import create_id_generator
+from src.interfaces.id_index import SortedIdIndex
+from src.interfaces.sqlite_task_repository import SqliteTaskRepository
+
+
+BATCH = 1000
+
+
+def generation_rate(id_format: str, count: int) -> float:
+    """IDs generated per second."""
+    generate = create_id_generator(id_format)
+    started = time.perf_counter()
+    for _ in range(count):
+        generate()
+    return count / (time.perf_counter() - started)
+
+
+def sqlite_insert_rate(directory: str, id_format: str, ids) -> float:
+    """Tasks inserted per second into a fresh SQLite store, in batches."""
+    path = os.path.join(directory, f"{id_format}.db")
+    repository = SqliteTaskRepository(path)
+    started = time.perf_counter()
+    for start in range(0, len(ids), BATCH):
+        repository.add_many(Task(id=task_id, title="Benchmark task") for task_id in ids[start:start + BATCH])
+    elapsed = time.perf_counter() - started
+    repository.close()
+    return len(ids) / elapsed
+
+
+def index_insert_rate(ids) -> float:
+    """IDs inserted per second into the sorted ID index, one at a time."""
+    index = SortedIdIndex()
+    started = time.perf_counter()
+    for task_id in ids:
+        index.add(task_id)
+    return len(ids) / (time.perf_counter() - started)
+
+
+def main(count: int = 200_000) -> None:
+    """Print generation and insert rates for both ID formats."""
+    print(f"{'Format':<8} {'Generated/s':>14} {'SQLite inserts/s':>18} {'Index inserts/s':>17}  ({count} tasks)")
+    with tempfile.TemporaryDirectory() as directory:
+        for id_format in ("uuid4", "uuid7"):
+            generate = create_id_generator(id_format)
+            ids = [generate() for _ in range(count)]
+            print(f"{id_format:<8} {generation_rate(id_format, count):>14,.0f} "
+                  f"{sqlite_insert_rate(directory, id_format, ids):>18,.0f} {index_insert_rate(ids):>17,.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
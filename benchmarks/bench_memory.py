@@ -0,0 +1,43 @@
+"""
+Memory benchmark comparing bytes per task across in-memory repository layouts.
+
+Usage:
+    python -m benchmarks.bench_memory [COUNT]
+"""
+import gc
+import sys
+import tracemalloc
+import uuid
+from src.entities.task import Task, TaskStatus
+from src.interfaces.task_repository import TaskRepository
+from src.interfaces.columnar_task_repository import ColumnarTaskRepository
+
+
+def measure(factory, count: int) -> float:
+    """Return the traced bytes per task retained by a repository holding ``count`` tasks."""
+    gc.collect()
+    tracemalloc.start()
+    repository = factory()
+    for i in range(count):
+        repository.add(Task(
+            id=str(uuid.uuid4()),
+            title=f"Task number {i}",
+            description="Imported from the legacy tracker" if i % 2 else None,
+            status=TaskStatus.COMPLETE if i % 20 else TaskStatus.INCOMPLETE
+        ))
+    gc.collect()
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del repository
+    return used / count
+
+
+def main(count: int = 100_000) -> None:
+    """Print bytes per task for the dict-of-dataclasses and columnar layouts."""
+    print(f"{'Layout':<12} {'Bytes/task':>12}  ({count} tasks)")
+    for name, factory in (("dict", TaskRepository), ("columnar", ColumnarTaskRepository)):
+        print(f"{name:<12} {measure(factory, count):>12.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,62 @@
+"""
+Rendering benchmark recording rows per second for each `list --format`.
+
+Output goes to the null device so the numbers include the cost of the
+write calls but not of a terminal.
+
+Usage:
+    python -m benchmarks.bench_render [COUNT]
+"""
+import os
+import sys
+import time
+import uuid
+from src.entities.task import Task, TaskStatus
+from src.interfaces.task_render import FORMATS, machine_writer, render_table
+
+
+def make_tasks(count: int):
+    """Build ``count`` tasks with a mix of short, long and missing descriptions."""
+    return [
+        Task(
+            id=str(uuid.uuid4()),
+            title=f"Task number {i}",
+            description=None if i % 3 == 0 else "Imported from the legacy tracker, needs triage" * (i % 3),
+            status=TaskStatus.COMPLETE if i % 4 == 0 else TaskStatus.INCOMPLETE
+        )
+        for i in range(count)
+    ]
+
+
+def print_per_row(tasks, out) -> None:
+    """The unbuffered baseline: one print call per row."""
+    for task in tasks:
+        summary = task.to_summary()
+        status = "DONE" if summary.status == TaskStatus.COMPLETE else "TODO"
+        print(f"{summary.id:<36} {status:<10} {summary.title:<30} {summary.description}", file=out, flush=True)
+
+
+def rows_per_second(render, tasks, out) -> float:
+    """Time one full render of ``tasks`` into ``out``."""
+    start = time.perf_counter()
+    render(tasks, out)
+    out.flush()
+    return len(tasks) / (time.perf_counter() - start)
+
+
+def main(count: int = 200_000) -> None:
+    """Print rows per second for the baseline and every output format."""
+    tasks = make_tasks(count)
+    renderers = {
+        "print/row": print_per_row,
+        "table": lambda tasks, out: render_table((task.to_summary() for task in tasks), out),
+    }
+    renderers.update((name, machine_writer(name)) for name in FORMATS if name != "table")
+    print(f"{'Format':<12} {'Rows/s':>12}  ({count} tasks)")
+    with open(os.devnull, "w", encoding="utf-8") as out:
+        for name, render in renderers.items():
+            print(f"{name:<12} {rows_per_second(render, tasks, out):>12,.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,81 @@
+"""
+Startup benchmark for the log backend as edits accumulate on a store.
+
+A store of TASKS tasks receives MUTATIONS random updates in stages. After
+each stage the store is closed and the time to open it again is recorded.
+The checkpointing store loads its latest snapshot plus the log written
+since, so its startup stays flat; the same history with checkpoints
+disabled replays every record ever written, as the log did before
+snapshots, and grows with the number of edits.
+
+Usage:
+    python -m benchmarks.bench_startup [TASKS] [MUTATIONS]
+
+The full-size run (1000000 tasks, 10000000 mutations) takes a while and
+needs a few GB of free disk space for the uncheckpointed log.
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+from typing import List, Tuple
+from src.entities.task import Task
+from src.interfaces.log_task_repository import LogTaskRepository
+
+
+STAGES = (0, 0.1, 0.25, 0.5, 1.0)
+BATCH = 1000
+
+
+def disk_bytes(path: str) -> int:
+    """Total size of the log, its segments and its snapshot."""
+    directory, name = os.path.split(path)
+    return sum(os.path.getsize(os.path.join(directory, entry))
+               for entry in os.listdir(directory) if entry.startswith(name))
+
+
+def run(directory: str, tasks: int, mutations: int, checkpointing: bool) -> List[Tuple[int, float, int]]:
+    """Build and edit one store, returning (mutations so far, startup seconds, bytes on disk) per stage."""
+    path = os.path.join(directory, "checkpointed.log" if checkpointing else "full-replay.log")
+    options = {"group_commit_size": BATCH}
+    if not checkpointing:
+        options["checkpoint_threshold"] = sys.maxsize
+    rng = random.Random(42)
+    repository = LogTaskRepository(path, **options)
+    task_ids = [str(uuid.UUID(int=rng.getrandbits(128), version=4)) for _ in range(tasks)]
+    for start in range(0, tasks, BATCH):
+        repository.add_many(Task(id=task_id, title=f"Task {start + i}")
+                            for i, task_id in enumerate(task_ids[start:start + BATCH]))
+    results = []
+    done = 0
+    for fraction in STAGES:
+        target = int(mutations * fraction)
+        while done < target:
+            count = min(BATCH, target - done)
+            repository.update_many(Task(id=task_ids[rng.randrange(tasks)], title=f"Edit {done + i}")
+                                   for i in range(count))
+            done += count
+        repository.close()
+        started = time.perf_counter()
+        repository = LogTaskRepository(path, **options)
+        results.append((done, time.perf_counter() - started, disk_bytes(path)))
+    repository.close()
+    return results
+
+
+def main(tasks: int = 100_000, mutations: int = 1_000_000) -> None:
+    """Print startup time with and without checkpoints as mutations accumulate."""
+    with tempfile.TemporaryDirectory() as directory:
+        checkpointed = run(directory, tasks, mutations, checkpointing=True)
+        full_replay = run(directory, tasks, mutations, checkpointing=False)
+    print(f"{tasks} tasks")
+    print(f"{'Mutations':>12} {'Checkpointed':>14} {'MB':>8} {'Full replay':>14} {'MB':>8}")
+    for (done, seconds, size), (_, replay_seconds, replay_size) in zip(checkpointed, full_replay):
+        print(f"{done:>12} {seconds:>13.2f}s {size / 1e6:>8.1f} {replay_seconds:>13.2f}s {replay_size / 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000)
@@ -0,0 +1,284 @@
+"""
+Benchmark suite for the service and CLI layers at increasing store sizes.
+
+For each size, a store is filled with that many tasks and then driven
+through add, list, update, complete and delete, either by calling
+TaskService directly or by running command lines through
+CLIController.handle_command with output sent to /dev/null. Every operation
+is timed on its own, giving ops per second and p50/p99 latency. Each layer
+and size runs in a fresh interpreter, so its peak resident memory is its own.
+
+Two operations check that status changes scale: complete_many marks a batch
+of BULK_BATCH tasks complete in one call, working through most of the store,
+and page_done then reads pages of the completed tasks. Both should cost the
+same per operation at every size; a status index that does O(n) work per
+change shows up as complete_many slowing down as the store grows.
+
+Results are written as JSON. Pass an earlier result file as ``--baseline``
+to flag throughput drops and memory growth beyond ``--tolerance``; the
+exit code is 1 when anything regressed.
+
+Usage:
+    python -m benchmarks.bench_suite [--sizes 1000,10000,100000,1000000] [--ops 1000]
+        [--backend memory] [--layers service,cli] [--output FILE]
+        [--baseline FILE] [--tolerance 0.25]
+
+Save a baseline with ``--output benchmarks/baseline.json`` on the machine
+the comparisons will run on; numbers from other machines do not compare.
+"""
+import argparse
+import contextlib
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+LAYERS = ("service", "cli")
+OPERATIONS = ("add", "list", "update", "complete", "complete_many", "page_done", "delete")
+# A list reads the whole store, so fewer are run on large stores: about this many tasks listed per run.
+LIST_BUDGET = 1_000_000
+MIN_LISTS = 3
+POPULATE_BATCH = 10_000
+# Tasks marked complete by one complete_many call, and tasks per page_done page.
+BULK_BATCH = 1_000
+PAGE_SIZE = 100
+
+
+def percentile(sorted_values: Sequence[int], fraction: float) -> int:
+    """Nearest-rank percentile of an ascending sequence."""
+    return sorted_values[max(math.ceil(fraction * len(sorted_values)) - 1, 0)]
+
+
+def measure(operation: Callable[[int], object], count: int) -> dict:
+    """Call ``operation(i)`` for i in range(count), timing each call; return throughput and latency."""
+    latencies: List[int] = []
+    clock = time.perf_counter_ns
+    started = clock()
+    for i in range(count):
+        before = clock()
+        operation(i)
+        latencies.append(clock() - before)
+    elapsed = clock() - started
+    latencies.sort()
+    return {
+        "ops": count,
+        "ops_per_sec": round(count / (elapsed / 1e9), 1),
+        "p50_us": round(percentile(latencies, 0.50) / 1000, 1),
+        "p99_us": round(percentile(latencies, 0.99) / 1000, 1),
+    }
+
+
+def bulk_batch(targets: List[str], i: int) -> List[str]:
+    """The i-th batch of tasks for complete_many, wrapping around the store."""
+    start = i * BULK_BATCH % len(targets)
+    return targets[start:start + BULK_BATCH]
+
+
+def page_walker(fetch: Callable[[Optional[str]], Optional[str]]) -> Callable[[int], object]:
+    """An operation that fetches the next page on each call, starting over after the last one."""
+    cursor: List[Optional[str]] = [None]
+
+    def operation(i: int) -> None:
+        cursor[0] = fetch(cursor[0])
+    return operation
+
+
+def service_workload(service, task_ids: List[str], rng: random.Random) -> Dict[str, Callable[[int], object]]:
+    """Operations that call the service directly."""
+    from src.entities.task import TaskStatus
+    targets = rng.sample(task_ids, len(task_ids))
+    return {
+        "add": lambda i: service.add_task(f"Added {i}", "Benchmark task"),
+        "list": lambda i: sum(1 for _ in service.list_summaries()),
+        "update": lambda i: service.update_task(targets[i % len(targets)], title=f"Updated {i}"),
+        "complete": lambda i: service.mark_task_complete(targets[-1 - i % len(targets)]),
+        "complete_many": lambda i: service.mark_complete_many(bulk_batch(targets, i)),
+        "page_done": page_walker(
+            lambda cursor: service.list_tasks_page(PAGE_SIZE, cursor, TaskStatus.COMPLETE).next_cursor),
+        "delete": lambda i: service.delete_task(targets[i]),
+    }
+
+
+def cli_workload(controller, task_ids: List[str], rng: random.Random) -> Dict[str, Callable[[int], object]]:
+    """The same operations as command lines, parsed and printed like the CLI does."""
+    targets = rng.sample(task_ids, len(task_ids))
+    handle = controller.handle_command
+    return {
+        "add": lambda i: handle(["add", f"Added {i}", "Benchmark task"]),
+        "list": lambda i: handle(["list"]),
+        "update": lambda i: handle(["update", targets[i % len(targets)], f"Updated {i}"]),
+        "complete": lambda i: handle(["complete", targets[-1 - i % len(targets)]]),
+        "complete_many": lambda i: handle(["complete", *bulk_batch(targets, i)]),
+        "page_done": lambda i: handle(["list", "--status", "done", "--limit", str(PAGE_SIZE)]),
+        "delete": lambda i: handle(["delete", targets[i]]),
+    }
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Peak resident memory of this process, or None where the platform cannot tell."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def run_one(layer: str, size: int, ops: int, backend: str) -> dict:
+    """Fill a store with ``size`` tasks and time every operation on one layer, in this process."""
+    from src.interfaces.cli_controller import CLIController
+    from src.interfaces.repository_factory import create_repository
+    from src.use_cases.task_service import TaskService
+
+    with tempfile.TemporaryDirectory() as directory:
+        repository = create_repository(backend, os.path.join(directory, f"bench.{backend}"))
+        service = TaskService(repository)
+        task_ids: List[str] = []
+        started = time.perf_counter()
+        for start in range(0, size, POPULATE_BATCH):
+            batch = ((f"Task {i}", f"Description {i}") for i in range(start, min(start + POPULATE_BATCH, size)))
+            task_ids.extend(task.id for task in service.add_tasks(batch))
+        populate_seconds = time.perf_counter() - started
+
+        rng = random.Random(size)
+        if layer == "service":
+            workload = service_workload(service, task_ids, rng)
+        else:
+            workload = cli_workload(CLIController(service), task_ids, rng)
+        counts = {operation: min(ops, size) for operation in OPERATIONS}
+        counts["list"] = max(MIN_LISTS, min(ops, LIST_BUDGET // size))
+        # Complete up to 90% of the store in batches, so bulk status changes are measured at scale.
+        counts["complete_many"] = max(1, min(ops, size * 9 // 10 // BULK_BATCH))
+        results = {}
+        with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+            for operation in OPERATIONS:
+                results[operation] = measure(workload[operation], counts[operation])
+        repository.close()
+    return {
+        "layer": layer,
+        "size": size,
+        "populate_seconds": round(populate_seconds, 2),
+        "peak_rss_bytes": peak_rss_bytes(),
+        "operations": results,
+    }
+
+
+def run_suite(sizes: Sequence[int], layers: Sequence[str], ops: int, backend: str) -> dict:
+    """Run every layer and size in its own interpreter and collect the results."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    results = []
+    for size in sizes:
+        for layer in layers:
+            print(f"Running {layer} with {size} tasks...", file=sys.stderr)
+            child = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_suite", "--child", layer, str(size),
+                 "--ops", str(ops), "--backend", backend],
+                cwd=root, capture_output=True, text=True, check=True
+            )
+            results.append(json.loads(child.stdout))
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "backend": backend,
+            "ops": ops,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> List[str]:
+    """Describe every result that is slower, or uses more memory, than the baseline by more than ``tolerance``."""
+    previous = {(result["layer"], result["size"]): result for result in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        before = previous.get((result["layer"], result["size"]))
+        if before is None:
+            continue
+        label = f"{result['layer']} {result['size']}"
+        for operation, stats in result["operations"].items():
+            old = before["operations"].get(operation)
+            if old is not None and stats["ops_per_sec"] < old["ops_per_sec"] * (1 - tolerance):
+                regressions.append(f"{label} {operation}: {stats['ops_per_sec']:,.0f} ops/s, "
+                                   f"was {old['ops_per_sec']:,.0f} ({stats['ops_per_sec'] / old['ops_per_sec'] - 1:+.0%})")
+        peak, old_peak = result.get("peak_rss_bytes"), before.get("peak_rss_bytes")
+        if peak and old_peak and peak > old_peak * (1 + tolerance):
+            regressions.append(f"{label} peak memory: {peak / 2**20:,.1f} MiB, "
+                               f"was {old_peak / 2**20:,.1f} MiB ({peak / old_peak - 1:+.0%})")
+    return regressions
+
+
+def print_summary(report: dict) -> None:
+    """Print a table of the results to stderr."""
+    print(f"{'Layer':<8} {'Tasks':>9} {'Operation':<9} {'Ops/s':>11} {'p50 us':>9} {'p99 us':>9} {'Peak MiB':>9}",
+          file=sys.stderr)
+    for result in report["results"]:
+        peak = result["peak_rss_bytes"]
+        for operation, stats in result["operations"].items():
+            print(f"{result['layer']:<8} {result['size']:>9} {operation:<9} {stats['ops_per_sec']:>11,.1f} "
+                  f"{stats['p50_us']:>9,.1f} {stats['p99_us']:>9,.1f} "
+                  f"{'-' if peak is None else format(peak / 2**20, '.1f'):>9}", file=sys.stderr)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the suite, write its JSON report and compare it with a baseline if one is given."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_suite", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)),
+                        help="Comma-separated store sizes (default: %(default)s)")
+    parser.add_argument("--layers", default=",".join(LAYERS), help="Layers to drive (default: %(default)s)")
+    parser.add_argument("--ops", type=int, default=1000, help="Operations of each kind per run (default: %(default)s)")
+    parser.add_argument("--backend", default="memory", help="Storage backend (default: %(default)s)")
+    parser.add_argument("--output", default="-", help="File for the JSON report, or '-' for stdout (default)")
+    parser.add_argument("--baseline", default=None, help="Earlier JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Relative change that counts as a regression (default: %(default)s)")
+    parser.add_argument("--child", nargs=2, metavar=("LAYER", "SIZE"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        layer, size = args.child
+        json.dump(run_one(layer, int(size), args.ops, args.backend), sys.stdout)
+        return 0
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    layers = [layer for layer in args.layers.split(",") if layer]
+    unknown = sorted(set(layers) - set(LAYERS))
+    if unknown:
+        parser.error(f"unknown layer: {', '.join(unknown)}")
+    report = run_suite(sizes, layers, args.ops, args.backend)
+    print_summary(report)
+    text = json.dumps(report, indent=2) + "\n"
+    if args.output == "-":
+        sys.stdout.write(text)
+    else:
+        with open(args.output, "w", encoding="utf-8") as out:
+            out.write(text)
+
+    if args.baseline is None:
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline["meta"].get("backend") != args.backend:
+        print(f"Warning: The baseline was recorded with the {baseline['meta'].get('backend')} backend", file=sys.stderr)
+    regressions = compare(report, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"Regression: {regression}", file=sys.stderr)
+    if not regressions:
+        print(f"No regressions beyond {args.tolerance:.0%} of {args.baseline}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""
+Runtime configuration for the Todo CLI application.
+"""
+from dataclasses import dataclass
+from typing import Mapping, Optional
+import os
+
+
+@dataclass
+class Config:
+    """Application settings, read from ``TODO_*`` environment variables."""
+
+    backend: str = "memory"
+    data_path: Optional[str] = None
+    # How new task IDs are generated: random `uuid4`, or time-ordered `uuid7`.
+    id_format: str = "uuid4"
+    # Bounds of the LRU read cache in front of the backend; the cache is off while both are unset.
+    cache_entries: int = 0
+    cache_bytes: Optional[int] = None
+    # Run commands through a resident daemon (`todo serve`), starting one when needed.
+    daemon: bool = False
+    socket_path: Optional[str] = None
+    # Count calls, errors and latency of each service operation, for `todo stats` and the API's /metrics.
+    metrics: bool = False
+
+    @classmethod
+    def from_env(cls, environ: Optional[Mapping[str, str]] = None) -> "Config":
+        """Build a configuration from the given mapping, defaulting to ``os.environ``."""
+        environ = os.environ if environ is None else environ
+        return cls(
+            backend=environ.get("TODO_BACKEND", cls.backend),
+            data_path=environ.get("TODO_DATA_PATH") or None,
+            id_format=environ.get("TODO_ID_FORMAT", cls.id_format),
+            cache_entries=_whole_number(environ, "TODO_CACHE_SIZE") or 0,
+            cache_bytes=_whole_number(environ, "TODO_CACHE_BYTES"),
+            daemon=_flag(environ, "TODO_DAEMON"),
+            socket_path=environ.get("TODO_SOCKET") or None,
+            metrics=_flag(environ, "TODO_METRICS")
+        )
+
+
+def _flag(environ: Mapping[str, str], name: str) -> bool:
+    """Read an on/off setting; it is on for 1, true, yes or on."""
+    return environ.get(name, "").lower() in ("1", "true", "yes", "on")
+
+
+def _whole_number(environ: Mapping[str, str], name: str) -> Optional[int]:
+    """Read a non-negative integer setting, or None when it is unset or empty."""
+    value = environ.get(name)
+    if not value:
+        return None
+    if not value.isdigit():
+        raise ValueError(f"{name} must be a whole number, not {value!r}")
+    return int(value)
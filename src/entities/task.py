@@ -2,10 +2,12 @@
 Task entity representing a todo item in the system.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
-import uuid
+from typing import List, NamedTuple, Optional
+
+
+SUMMARY_LENGTH = 30
 
 
 class TaskStatus(Enum):
@@ -14,7 +16,35 @@ class TaskStatus(Enum):
     COMPLETE = "complete"
 
 
-@dataclass
+def summarize_text(text: Optional[str], truncated: Optional[bool] = None) -> str:
+    """Shorten text to SUMMARY_LENGTH characters for listings.
+
+    ``truncated`` may be passed when the caller only holds the first
+    SUMMARY_LENGTH characters and knows whether the full text was longer.
+    """
+    text = text or ""
+    if truncated is None:
+        truncated = len(text) > SUMMARY_LENGTH
+    return text[:SUMMARY_LENGTH - 3] + "..." if truncated else text
+
+
+class TaskSummary(NamedTuple):
+    """Lightweight listing view of a task with shortened title and description."""
+
+    id: str
+    status: "TaskStatus"
+    title: str
+    description: str
+
+
+class TaskPage(NamedTuple):
+    """One page of tasks plus the opaque cursor for the next page, or None on the last page."""
+
+    tasks: List["Task"]
+    next_cursor: Optional[str]
+
+
+@dataclass(slots=True)
 class Task:
     """Represents a todo task with ID, title, description, and status."""
 
@@ -22,13 +52,26 @@ class Task:
     title: str
     description: Optional[str] = None
     status: TaskStatus = TaskStatus.INCOMPLETE
+    # Set by the repository on every write; 0 until the task is first stored.
+    # Not part of equality, since two tasks with the same fields are the same task.
+    version: int = field(default=0, compare=False)
 
     def __post_init__(self):
         """Validate task after initialization."""
+        self.validate()
+
+    def validate(self) -> None:
+        """Raise ValueError unless the ID and title are non-empty strings and the description is a string or None."""
         if not self.id:
             raise ValueError("Task ID cannot be empty")
+        if not isinstance(self.id, str):
+            raise ValueError("Task ID must be a string")
         if not self.title:
             raise ValueError("Task title cannot be empty")
+        if not isinstance(self.title, str):
+            raise ValueError("Task title must be a string")
+        if self.description is not None and not isinstance(self.description, str):
+            raise ValueError("Task description must be a string")
 
     def mark_complete(self):
         """Mark the task as complete."""
@@ -38,6 +81,10 @@ class Task:
         """Mark the task as incomplete."""
         self.status = TaskStatus.INCOMPLETE
 
+    def copy(self) -> "Task":
+        """Return an independent copy of the task, validated like a new one."""
+        return Task(self.id, self.title, self.description, self.status, self.version)
+
     def to_dict(self) -> dict:
         """Convert task to dictionary representation."""
         return {
@@ -45,4 +92,18 @@ class Task:
             "title": self.title,
             "description": self.description,
             "status": self.status.value
-        }
\ No newline at end of file
+        }
+
+    def to_summary(self) -> TaskSummary:
+        """Convert task to its listing summary."""
+        return TaskSummary(self.id, self.status, summarize_text(self.title), summarize_text(self.description))
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Task":
+        """Create a task from its dictionary representation."""
+        return cls(
+            id=data["id"],
+            title=data["title"],
+            description=data.get("description"),
+            status=TaskStatus(data.get("status", TaskStatus.INCOMPLETE.value))
+        )
\ No newline at end of file
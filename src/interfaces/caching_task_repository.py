@@ -0,0 +1,233 @@
+"""
+Bounded LRU read cache in front of another TaskRepository.
+"""
+from collections import OrderedDict
+import sys
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+from src.entities.task import Task, TaskStatus, TaskSummary
+from src.interfaces.change_feed import ChangeFeed
+from src.interfaces.task_repository import TaskRepository, VersionConflictError
+
+
+# Rough bytes a cached task costs besides its text: the Task object, its strings' headers and the cache entry.
+ENTRY_OVERHEAD = 300
+
+
+class CacheStats(NamedTuple):
+    """Counters and current size of a repository cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+
+
+class CachingTaskRepository(TaskRepository):
+    """Repository wrapper that serves ``get_by_id`` and ``get_many`` from a bounded LRU cache.
+
+    Everything else is passed straight to the wrapped repository. Writes go
+    through to it: single-task writes store the new state in the cache,
+    bulk writes and deletes drop the affected entries. The cache holds at
+    most ``max_entries`` tasks and about ``max_bytes`` of them (either may
+    be None for no limit), evicting the least recently used. Tasks are
+    copied in and out, so callers never change a cached task in place.
+
+    The cache assumes it sees every write to the wrapped store. A task
+    written by someone else is served stale until evicted, except that a
+    version conflict drops the entry, so a retried ``modify`` reads afresh.
+    """
+
+    def __init__(self, repository: TaskRepository, max_entries: Optional[int] = 10_000,
+                 max_bytes: Optional[int] = None):
+        """Wrap a repository with an empty cache of the given size."""
+        self._repository = repository
+        self._max_entries = sys.maxsize if max_entries is None else max_entries
+        self._max_bytes = sys.maxsize if max_bytes is None else max_bytes
+        self._cache: "OrderedDict[str, Tuple[Task, int]]" = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        """Expose backend-specific methods, such as ``flush``, of the wrapped repository."""
+        return getattr(self._repository, name)
+
+    @property
+    def wrapped(self) -> TaskRepository:
+        """The repository behind the cache."""
+        return self._repository
+
+    def stats(self) -> CacheStats:
+        """Return the hit, miss and eviction counters and the current size."""
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, len(self._cache), self._bytes)
+
+    def clear(self) -> None:
+        """Drop every cached task; the counters are kept."""
+        with self._lock:
+            self._cache.clear()
+            self._bytes = 0
+
+    def add(self, task: Task) -> Task:
+        """Add a task to the wrapped repository and cache it."""
+        task = self._repository.add(task)
+        self._put(task)
+        return task
+
+    def add_many(self, tasks: Iterable[Task]) -> List[Task]:
+        """Add several tasks, dropping any cached entries for their IDs."""
+        tasks = self._repository.add_many(tasks)
+        self._discard(task.id for task in tasks)
+        return tasks
+
+    def get_by_id(self, task_id: str) -> Optional[Task]:
+        """Retrieve a task from the cache, reading it from the wrapped repository on a miss."""
+        with self._lock:
+            entry = self._cache.get(task_id)
+            if entry is not None:
+                self._cache.move_to_end(task_id)
+                self._hits += 1
+                return entry[0].copy()
+            self._misses += 1
+        task = self._repository.get_by_id(task_id)
+        if task is not None:
+            self._put(task)
+        return task
+
+    def get_many(self, task_ids: Iterable[str]) -> Dict[str, Task]:
+        """Retrieve several tasks, reading only the uncached ones from the wrapped repository."""
+        found: Dict[str, Task] = {}
+        missing = []
+        with self._lock:
+            for task_id in task_ids:
+                entry = self._cache.get(task_id)
+                if entry is None:
+                    missing.append(task_id)
+                    continue
+                self._cache.move_to_end(task_id)
+                found[task_id] = entry[0].copy()
+            self._hits += len(found)
+            self._misses += len(missing)
+        if missing:
+            loaded = self._repository.get_many(missing)
+            for task in loaded.values():
+                self._put(task)
+            found.update(loaded)
+        return found
+
+    def get_all(self) -> List[Task]:
+        """Retrieve all tasks from the wrapped repository."""
+        return self._repository.get_all()
+
+    def iter_all(self) -> Iterator[Task]:
+        """Iterate over all tasks of the wrapped repository."""
+        return self._repository.iter_all()
+
+    def get_page(self, limit: int, after: Optional[int] = None,
+                 status: Optional[TaskStatus] = None) -> Tuple[List[Task], Optional[int]]:
+        """Return a page of tasks from the wrapped repository."""
+        return self._repository.get_page(limit, after, status)
+
+    def get_by_status(self, status: TaskStatus) -> List[Task]:
+        """Retrieve the tasks with the given status from the wrapped repository."""
+        return self._repository.get_by_status(status)
+
+    def iter_summaries(self, status: Optional[TaskStatus] = None) -> Iterator[TaskSummary]:
+        """Iterate over listing summaries from the wrapped repository."""
+        return self._repository.iter_summaries(status)
+
+    def ids_with_prefix(self, prefix: str, limit: int = 2) -> List[str]:
+        """Return task IDs starting with the prefix from the wrapped repository."""
+        return self._repository.ids_with_prefix(prefix, limit)
+
+    def iter_sorted_ids(self) -> Iterator[str]:
+        """Iterate over the wrapped repository's task IDs in sorted order."""
+        return self._repository.iter_sorted_ids()
+
+    def update(self, task: Task) -> Optional[Task]:
+        """Update a task in the wrapped repository and cache its new state."""
+        updated = self._repository.update(task)
+        if updated is None:
+            self._discard([task.id])
+        else:
+            self._put(updated)
+        return updated
+
+    def update_many(self, tasks: Iterable[Task]) -> List[Optional[Task]]:
+        """Update several tasks, dropping any cached entries for their IDs."""
+        tasks = list(tasks)
+        results = self._repository.update_many(tasks)
+        self._discard(task.id for task in tasks)
+        return results
+
+    def update_if_version(self, task: Task, expected_version: int) -> Optional[Task]:
+        """Compare-and-set a task in the wrapped repository, dropping the entry if it turns out stale."""
+        try:
+            updated = self._repository.update_if_version(task, expected_version)
+        except VersionConflictError:
+            self._discard([task.id])
+            raise
+        if updated is None:
+            self._discard([task.id])
+        else:
+            self._put(updated)
+        return updated
+
+    def modify_many(self, task_ids: Iterable[str], change: Callable[[Task], None]) -> List[Optional[Task]]:
+        """Apply ``change`` to several tasks through the wrapped repository, dropping their entries."""
+        task_ids = list(task_ids)
+        results = self._repository.modify_many(task_ids, change)
+        self._discard(task_ids)
+        return results
+
+    def delete(self, task_id: str) -> bool:
+        """Delete a task from the wrapped repository and the cache."""
+        deleted = self._repository.delete(task_id)
+        self._discard([task_id])
+        return deleted
+
+    def delete_many(self, task_ids: Iterable[str]) -> List[bool]:
+        """Delete several tasks from the wrapped repository and the cache."""
+        task_ids = list(task_ids)
+        results = self._repository.delete_many(task_ids)
+        self._discard(task_ids)
+        return results
+
+    @property
+    def changes(self) -> ChangeFeed:
+        """The wrapped repository's change feed, which every write passed through the cache reaches."""
+        return self._repository.changes
+
+    def close(self) -> None:
+        """Close the wrapped repository."""
+        self._repository.close()
+
+    def _put(self, task: Task) -> None:
+        """Cache a copy of a task as the most recently used entry, evicting to stay within budget."""
+        copy = task.copy()
+        size = ENTRY_OVERHEAD + len(copy.id) + len(copy.title) + len(copy.description or "")
+        with self._lock:
+            previous = self._cache.pop(copy.id, None)
+            if previous is not None:
+                if previous[0].version > copy.version:
+                    # A read that raced with a write must not replace the newer state.
+                    copy, size = previous
+                self._bytes -= previous[1]
+            self._cache[copy.id] = (copy, size)
+            self._bytes += size
+            while self._cache and (len(self._cache) > self._max_entries or self._bytes > self._max_bytes):
+                _, (_, evicted_size) = self._cache.popitem(last=False)
+                self._bytes -= evicted_size
+                self._evictions += 1
+
+    def _discard(self, task_ids: Iterable[str]) -> None:
+        """Drop any cached entries for the given IDs."""
+        with self._lock:
+            for task_id in task_ids:
+                entry = self._cache.pop(task_id, None)
+                if entry is not None:
+                    self._bytes -= entry[1]
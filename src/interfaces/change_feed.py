@@ -0,0 +1,176 @@
+"""
+Ordered feed of the changes made to a repository, for consumers that follow it incrementally.
+"""
+from collections import deque
+from enum import Enum
+from threading import Condition
+from typing import Deque, Iterable, List, NamedTuple, Optional, Tuple
+import os
+from src.entities.task import Task
+
+
+# Events a feed keeps for subscribers that fall behind or resume from an earlier position.
+DEFAULT_RETENTION = 10_000
+
+
+class ChangeKind(Enum):
+    """What a change did to a task"""
+    ADDED = "added"
+    UPDATED = "updated"
+    DELETED = "deleted"
+
+
+class ChangeEvent(NamedTuple):
+    """One change: its position in the feed, what happened, and the task's new state (None once deleted)."""
+
+    seq: int
+    kind: ChangeKind
+    task_id: str
+    task: Optional[Task]
+
+
+class MissedChangesError(ValueError):
+    """Raised when a subscriber asks for changes the feed no longer retains."""
+
+    def __init__(self, after: int, oldest: int):
+        super().__init__(f"Changes after {after} are no longer available; the oldest kept change is {oldest}")
+        self.after = after
+        self.oldest = oldest
+
+
+class StaleCursorError(ValueError):
+    """Raised for a cursor taken from another feed, such as one from before the daemon restarted."""
+
+    def __init__(self, cursor: str, epoch: str):
+        super().__init__(f"Cursor {cursor} is from another run of the change feed; "
+                         f"this one's cursors start with {epoch}:")
+        self.cursor = cursor
+        self.epoch = epoch
+
+
+class ChangeFeed:
+    """Thread-safe, bounded log of change events numbered from 1 in the order they were published.
+
+    The newest ``retention`` events are kept, so a subscriber can resume from
+    any sequence number it has seen as long as it has not fallen further
+    behind than that. Published tasks are copied, so an event always shows
+    the state the write stored.
+
+    Sequence numbers restart with every feed, so positions handed to other
+    processes are cursors of the form ``epoch:seq``, where ``epoch`` is
+    random per feed; ``parse_cursor`` refuses those of any other feed.
+    """
+
+    def __init__(self, retention: int = DEFAULT_RETENTION):
+        """Initialize an empty feed keeping up to ``retention`` events."""
+        self.epoch = os.urandom(4).hex()
+        self._events: Deque[ChangeEvent] = deque(maxlen=retention)
+        self._last_seq = 0
+        self._changed = Condition()
+        # Subscribers blocked in ``read``; publishing only notifies when there are any.
+        self._waiting = 0
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the newest event, or 0 before the first one."""
+        return self._last_seq
+
+    def publish(self, kind: ChangeKind, task_id: str, task: Optional[Task] = None) -> int:
+        """Append one event and wake waiting subscribers; returns its sequence number."""
+        event_task = None if task is None else task.copy()
+        with self._changed:
+            seq = self._last_seq = self._last_seq + 1
+            self._events.append(ChangeEvent(seq, kind, task_id, event_task))
+            if self._waiting:
+                self._changed.notify_all()
+        return seq
+
+    def publish_many(self, changes: Iterable[Tuple[ChangeKind, str, Optional[Task]]]) -> int:
+        """Append several events as one batch; returns the sequence number of the last one.
+
+        Events that the batch itself would push out of the retention window
+        are numbered but never built, so a bulk write costs no more than the
+        window it can leave behind.
+        """
+        changes = list(changes)
+        with self._changed:
+            skipped = max(len(changes) - self._events.maxlen, 0)
+            seq = self._last_seq + skipped
+            for kind, task_id, task in changes[skipped:]:
+                seq += 1
+                self._events.append(ChangeEvent(seq, kind, task_id, None if task is None else task.copy()))
+            self._last_seq = seq
+            if self._waiting:
+                self._changed.notify_all()
+        return seq
+
+    def read(self, after: int = 0, limit: Optional[int] = None, timeout: float = 0.0) -> List[ChangeEvent]:
+        """Return the events after sequence number ``after``, oldest first.
+
+        With a ``timeout``, waits up to that many seconds for an event when
+        none is available yet. Raises MissedChangesError when events after
+        ``after`` have already been dropped, and ValueError for a position
+        the feed has not reached.
+        """
+        with self._changed:
+            if after > self._last_seq:
+                raise ValueError(f"Change {after} has not happened yet; the newest change is {self._last_seq}")
+            if timeout > 0:
+                self._waiting += 1
+                try:
+                    self._changed.wait_for(lambda: self._last_seq > after, timeout)
+                finally:
+                    self._waiting -= 1
+            oldest = self._last_seq - len(self._events) + 1
+            if after < oldest - 1:
+                raise MissedChangesError(after, oldest)
+            start = after - oldest + 1
+            stop = len(self._events) if limit is None else min(start + limit, len(self._events))
+            return [self._events[index] for index in range(start, stop)]
+
+    def cursor(self, seq: int) -> str:
+        """The cursor naming sequence number ``seq`` of this feed."""
+        return f"{self.epoch}:{seq}"
+
+    def parse_cursor(self, cursor: str) -> int:
+        """Return the sequence number a cursor of this feed names.
+
+        Raises StaleCursorError for a cursor of another feed, and ValueError
+        for one that is not of the form ``epoch:seq``.
+        """
+        epoch, separator, seq = cursor.partition(":")
+        if not separator or not seq.isdigit():
+            raise ValueError(f"Invalid change cursor '{cursor}'; expected EPOCH:SEQ as printed by watch")
+        if epoch != self.epoch:
+            raise StaleCursorError(cursor, self.epoch)
+        return int(seq)
+
+    def subscribe(self, after: Optional[int] = None) -> "ChangeSubscription":
+        """Start a subscription after sequence number ``after``, or at the newest event when omitted."""
+        return ChangeSubscription(self, self._last_seq if after is None else after)
+
+
+class ChangeSubscription:
+    """A subscriber's cursor into a change feed, handing out every event once and in order.
+
+    ``position`` is the sequence number of the last event handed out; pass it
+    to ``ChangeFeed.subscribe`` to resume from the same place later, or hand
+    out ``cursor`` to resume through ``ChangeFeed.parse_cursor``.
+    """
+
+    def __init__(self, feed: ChangeFeed, after: int):
+        """Position a new subscription after sequence number ``after``."""
+        self._feed = feed
+        self.position = after
+
+    @property
+    def cursor(self) -> str:
+        """The cursor of the last event handed out."""
+        return self._feed.cursor(self.position)
+
+    def poll(self, limit: Optional[int] = None, timeout: float = 0.0) -> List[ChangeEvent]:
+        """Return the events published since the last poll, waiting up to ``timeout`` seconds for one."""
+        events = self._feed.read(self.position, limit, timeout)
+        if events:
+            self.position = events[-1].seq
+        return events
@@ -2,76 +2,256 @@
 CLI controller for handling command-line interface operations.
 """
 import argparse
-from typing import Optional
+import os
+import sys
+import time
+from typing import IO, Callable, Dict, Iterable, Optional
 from src.use_cases.task_service import TaskService
-from src.entities.task import Task
+from src.entities.task import Task, TaskStatus, TaskSummary
+from src.interfaces.change_feed import ChangeSubscription
+from src.interfaces.id_index import AmbiguousIdError, PrefixTooShortError
+
+
+# CLI spellings of task statuses, matching the labels shown by `list`.
+STATUS_CHOICES = {
+    "todo": TaskStatus.INCOMPLETE,
+    "done": TaskStatus.COMPLETE,
+}
+
+
+# Page size used by `list --after` when no --limit is given.
+DEFAULT_PAGE_SIZE = 50
+
+
+# Minimum seconds between progress lines printed by long-running commands.
+PROGRESS_INTERVAL = 1.0
+
+
+# Seconds `watch` waits for a change before checking whether it should stop.
+WATCH_POLL_INTERVAL = 0.5
+
+
+# Options given before the subcommand that take a value, skipped when looking for the subcommand's name.
+_GLOBAL_VALUE_OPTIONS = ('--profile-output', '--profile-top')
+
+
+# Subcommands in help order, with their one-line help.
+COMMANDS = {
+    "add": "Add a new task",
+    "list": "List all tasks",
+    "search": "Search task titles and descriptions",
+    "update": "Update an existing task",
+    "delete": "Delete a task",
+    "complete": "Mark a task as complete",
+    "incomplete": "Mark a task as incomplete",
+    "import": "Import tasks from an NDJSON or CSV file",
+    "export": "Export all tasks as NDJSON, CSV or JSON",
+    "shell": "Run commands interactively against one open store",
+    "serve": "Keep the store open in a daemon that serves CLI commands on a Unix socket",
+    "api": "Serve the web front end's JSON API over HTTP",
+    "watch": "Print changes to tasks as the daemon makes them",
+    "stats": "Show call counts, errors and latency of task operations",
+}
+
+
+def positive_int(value: str) -> int:
+    """Argparse type for counts that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, not {number}")
+    return number
 
 
 class CLIController:
-    """Controller for CLI operations."""
+    """Controller for CLI operations.
+
+    Only the arguments of the requested subcommand are registered before
+    parsing; the full parser tree is built only for top-level help and the shell.
+    """
 
     def __init__(self, task_service: TaskService):
         """Initialize the CLI controller with a task service."""
         self.task_service = task_service
-        self.parser = self._create_parser()
+        self._parser: Optional[argparse.ArgumentParser] = None
+        self._command_parsers: Dict[str, argparse.ArgumentParser] = {}
+        self._commands: Dict[str, argparse.ArgumentParser] = {}
+
+    @property
+    def parser(self) -> argparse.ArgumentParser:
+        """The argument parser with every subcommand, built on first use."""
+        if self._parser is None:
+            self._parser = self._create_parser()
+        return self._parser
 
-    def _create_parser(self) -> argparse.ArgumentParser:
-        """Create the argument parser with all available commands."""
+    @property
+    def commands(self) -> Dict[str, argparse.ArgumentParser]:
+        """Fully built subcommand parsers by name, used by the shell for completion."""
+        self.parser  # Building the full tree records the subcommand parsers.
+        return self._commands
+
+    def _create_parser(self, command: Optional[str] = None) -> argparse.ArgumentParser:
+        """Create the argument parser, registering arguments for one command or all of them."""
         parser = argparse.ArgumentParser(
             prog='todo',
             description='Todo CLI Application',
             formatter_class=argparse.RawDescriptionHelpFormatter
         )
 
+        parser.add_argument('--profile', action='store_true',
+                            help='Run the command under cProfile, save the stats and print the top functions '
+                                 'by cumulative time to stderr')
+        parser.add_argument('--profile-output', default=None, metavar='FILE',
+                            help='Where --profile saves its stats (default: todo-<command>.prof)')
+        parser.add_argument('--trace-alloc', action='store_true',
+                            help='Trace memory allocations and print the top allocation sites to stderr')
+        parser.add_argument('--profile-top', type=positive_int, default=20, metavar='N',
+                            help='Number of entries in each report (default: 20)')
+
         subparsers = parser.add_subparsers(dest='command', help='Available commands')
+        for name, help_text in COMMANDS.items():
+            subparser = subparsers.add_parser(name, help=help_text)
+            if command is None or command == name:
+                getattr(self, f'_build_{name}_parser')(subparser)
+        if command is None:
+            self._commands = subparsers.choices
+        return parser
 
-        # Add command
-        add_parser = subparsers.add_parser('add', help='Add a new task')
-        add_parser.add_argument('title', help='Title of the task')
-        add_parser.add_argument('description', nargs='?', default=None, help='Description of the task (optional)')
+    def _parser_for(self, args) -> argparse.ArgumentParser:
+        """Return a parser able to parse ``args``, building as little of the tree as possible."""
+        argv = sys.argv[1:] if args is None else args
+        index = 0
+        while index < len(argv) and argv[index].startswith('-'):
+            index += 2 if argv[index] in _GLOBAL_VALUE_OPTIONS else 1
+        command = argv[index] if index < len(argv) and argv[index] in COMMANDS else None
+        if self._parser is not None or command is None:
+            return self.parser
+        parser = self._command_parsers.get(command)
+        if parser is None:
+            parser = self._command_parsers[command] = self._create_parser(command)
+        return parser
 
-        # List command
-        list_parser = subparsers.add_parser('list', help='List all tasks')
+    def _build_add_parser(self, parser: argparse.ArgumentParser) -> None:
+        """Register the arguments of the add command."""
+        parser.add_argument('title', help='Title of the task')
+        parser.add_argument('description', nargs='?', default=None, help='Description of the task (optional)')
 
-        # Update command
-        update_parser = subparsers.add_parser('update', help='Update an existing task')
-        update_parser.add_argument('id', help='ID of the task to update')
-        update_parser.add_argument('title', nargs='?', default=None, help='New title of the task (optional)')
-        update_parser.add_argument('description', nargs='?', default=None, help='New description of the task (optional)')
+    def _build_list_parser(self, parser: argparse.ArgumentParser) -> None:
+        """Register the arguments of the list command."""
+        from src.interfaces.task_render import FORMATS
+        parser.add_argument('--status', choices=sorted(STATUS_CHOICES), default=None,
+                            help='Only list tasks with this status')
+        parser.add_argument('--short', action='store_true',
+                            help='Show the shortest unique prefix of each ID instead of the full ID')
+        parser.add_argument('--format', choices=FORMATS, default='table',
+                            help='Output format; tsv, json and ndjson print full, untruncated tasks (default: table)')
+        parser.add_argument('--limit', type=positive_int, default=None,
+                            help='Show at most this many tasks and print a cursor for the next page')
+        parser.add_argument('--after', default=None, metavar='CURSOR',
+                            help=f'Continue from a cursor printed by a previous page (default page size: {DEFAULT_PAGE_SIZE})')
 
-        # Delete command
-        delete_parser = subparsers.add_parser('delete', help='Delete a task')
-        delete_parser.add_argument('id', help='ID of the task to delete')
+    def _build_search_parser(self, parser: argparse.ArgumentParser) -> None:
+        """Register the arguments of the search command."""
+        parser.add_argument('query', nargs='+', help='Terms that must all match; separate alternatives with OR')
+        parser.add_argument('--limit', type=positive_int, default=20,
+                            help='Maximum number of results (default: 20)')
 
-        # Complete command
-        complete_parser = subparsers.add_parser('complete', help='Mark a task as complete')
-        complete_parser.add_argument('id', help='ID of the task to mark complete')
+    def _build_update_parser(self, parser: argparse.ArgumentParser) -> None:
+        """Register the arguments of the update command."""
+        parser.add_argument('id', help='ID (or unique ID prefix) of the task to update')
+        parser.add_argument('title', nargs='?', default=None, help='New title of the task (optional)')
+        parser.add_argument('description', nargs='?', default=None, help='New description of the task (optional)')
+        parser.add_argument('--if-version', type=int, default=None, metavar='VERSION',
+                            help='Only update if the task is still at this version; fails if it changed since')
 
-        # Incomplete command
-        incomplete_parser = subparsers.add_parser('incomplete', help='Mark a task as incomplete')
-        incomplete_parser.add_argument('id', help='ID of the task to mark incomplete')
+    def _build_delete_parser(self, parser: argparse.ArgumentParser) -> None:
+        """Register the arguments of the delete command."""
+        parser.add_argument('id', nargs='+', help='IDs (or unique ID prefixes) of the tasks to delete')
 
-        return parser
+    def _build_complete_parser(self, parser: argparse.ArgumentParser) -> None:
+        """Register the arguments of the complete command."""
+        parser.add_argument('id', nargs='+', help='IDs (or unique ID prefixes) of the tasks to mark complete')
+
+    def _build_incomplete_parser(self, parser: argparse.ArgumentParser) -> None:
+        """Register the arguments of the incomplete command."""
+        parser.add_argument('id', nargs='+', help='IDs (or unique ID prefixes) of the tasks to mark incomplete')
+
+    def _build_import_parser(self, parser: argparse.ArgumentParser) -> None:
+        """Register the arguments of the import command."""
+        from src.interfaces.task_import import PARSERS
+        parser.add_argument('file', help="File to import, or '-' for standard input")
+        parser.add_argument('--format', choices=sorted(PARSERS), default=None,
+                            help='Input format (default: csv for .csv files, otherwise ndjson)')
+        parser.add_argument('--batch-size', type=positive_int, default=1000,
+                            help='Number of tasks written to storage at a time (default: 1000)')
+
+    def _build_export_parser(self, parser: argparse.ArgumentParser) -> None:
+        """Register the arguments of the export command."""
+        from src.interfaces.task_export import WRITERS
+        parser.add_argument('--format', choices=sorted(WRITERS), default='ndjson',
+                            help='Output format (default: ndjson)')
+        parser.add_argument('--output', '-o', default='-',
+                            help="File to write, or '-' for standard output (default)")
+
+    def _build_shell_parser(self, parser: argparse.ArgumentParser) -> None:
+        """Register the arguments of the shell command."""
+        parser.add_argument('--history', default=os.path.join(os.path.expanduser('~'), '.todo_history'),
+                            help="Command history file, or '' to keep no history (default: ~/.todo_history)")
+
+    def _build_serve_parser(self, parser: argparse.ArgumentParser) -> None:
+        """Register the arguments of the serve command."""
+        parser.add_argument('--socket', default=None,
+                            help='Socket path (default: TODO_SOCKET, or one derived from the backend and data path)')
+        parser.add_argument('--idle-timeout', type=float, default=0.0,
+                            help='Exit after this many seconds without a command; 0 runs until interrupted (default: 0)')
+
+    def _build_api_parser(self, parser: argparse.ArgumentParser) -> None:
+        """Register the arguments of the api command."""
+        parser.add_argument('--host', default='127.0.0.1', help='Address to listen on (default: 127.0.0.1)')
+        parser.add_argument('--port', type=int, default=8000, help='Port to listen on; 0 picks a free one (default: 8000)')
+
+    def _build_watch_parser(self, parser: argparse.ArgumentParser) -> None:
+        """Register the arguments of the watch command."""
+        from src.interfaces.task_render import CHANGE_FORMATS
+        parser.add_argument('--after', default=None, metavar='CURSOR',
+                            help='Start after this change cursor (EPOCH:SEQ, as printed by watch) '
+                                 'instead of with the next change')
+        parser.add_argument('--format', choices=CHANGE_FORMATS, default='text',
+                            help='Output format; ndjson prints the full new state of each task (default: text)')
+
+    def _build_stats_parser(self, parser: argparse.ArgumentParser) -> None:
+        """Register the arguments of the stats command."""
+        from src.interfaces.task_render import STATS_FORMATS
+        parser.add_argument('--format', choices=STATS_FORMATS, default='table',
+                            help='Output format (default: table)')
+
+    def parse_args(self, args=None) -> argparse.Namespace:
+        """Parse a command line; argparse prints usage errors and exits."""
+        return self._parser_for(args).parse_args(args)
 
     def handle_command(self, args=None):
         """Handle the command based on parsed arguments."""
-        parsed_args = self.parser.parse_args(args)
-
-        if parsed_args.command == 'add':
-            return self._handle_add(parsed_args)
-        elif parsed_args.command == 'list':
-            return self._handle_list()
-        elif parsed_args.command == 'update':
-            return self._handle_update(parsed_args)
-        elif parsed_args.command == 'delete':
-            return self._handle_delete(parsed_args)
-        elif parsed_args.command == 'complete':
-            return self._handle_complete(parsed_args)
-        elif parsed_args.command == 'incomplete':
-            return self._handle_incomplete(parsed_args)
-        else:
+        parsed_args = self.parse_args(args)
+        if parsed_args.command is None:
             self.parser.print_help()
             return 0
+        handler = getattr(self, f'_handle_{parsed_args.command}')
+        if parsed_args.profile or parsed_args.trace_alloc:
+            from src.interfaces.profiling import profile_call
+            output_path = None
+            if parsed_args.profile:
+                output_path = parsed_args.profile_output or f'todo-{parsed_args.command}.prof'
+                # Checked up front so a command that changes tasks does not run when its profile cannot be saved.
+                directory = os.path.dirname(os.path.abspath(output_path))
+                if not os.path.isdir(directory) or not os.access(directory, os.W_OK):
+                    print(f"Error: Cannot write the profile to {output_path}: "
+                          f"{directory} is not a writable directory")
+                    return 1
+            return profile_call(lambda: handler(parsed_args), output_path, parsed_args.trace_alloc,
+                                parsed_args.profile_top)
+        return handler(parsed_args)
 
     def _handle_add(self, args) -> int:
         """Handle the add command."""
@@ -83,33 +263,91 @@ class CLIController:
             print(f"Error: {e}")
             return 1
 
-    def _handle_list(self) -> int:
+    def _handle_list(self, args=None) -> int:
         """Handle the list command."""
-        tasks = self.task_service.list_tasks()
-        if not tasks:
-            print("No tasks found.")
+        status = getattr(args, 'status', None)
+        status = STATUS_CHOICES[status] if status else None
+        output_format = getattr(args, 'format', 'table')
+        limit = getattr(args, 'limit', None)
+        after = getattr(args, 'after', None)
+        next_cursor = None
+        if limit is None and after is None:
+            tasks = None
+        else:
+            try:
+                page = self.task_service.list_tasks_page(DEFAULT_PAGE_SIZE if limit is None else limit, after, status)
+            except ValueError as e:
+                print(f"Error: {e}")
+                return 1
+            tasks = page.tasks
+            next_cursor = page.next_cursor
+
+        if output_format != 'table':
+            from src.interfaces.task_render import machine_writer
+            writer = machine_writer(output_format)
+            writer(self.task_service.iter_tasks(status) if tasks is None else tasks, sys.stdout)
+            sys.stdout.flush()
+            if next_cursor is not None:
+                # Keep the cursor out of the machine-readable stream.
+                print(f"Next page: --after {next_cursor}", file=sys.stderr)
             return 0
 
-        print(f"{'ID':<36} {'Status':<10} {'Title':<30} {'Description'}")
-        print("-" * 80)
-        for task in tasks:
-            status = "DONE" if task.status.value == "complete" else "TODO"
-            title = task.title[:27] + "..." if len(task.title) > 30 else task.title
-            description = task.description or ""
-            if len(description) > 30:
-                description = description[:27] + "..."
-            print(f"{task.id:<36} {status:<10} {title:<30} {description}")
+        if tasks is None:
+            summaries = self.task_service.list_summaries(status)
+        else:
+            summaries = (task.to_summary() for task in tasks)
+        short_ids = self.task_service.short_ids() if getattr(args, 'short', False) else None
+        if not self._print_summaries(summaries, short_ids):
+            print("No tasks found.")
+        if next_cursor is not None:
+            print(f"\nNext page: --after {next_cursor}")
         return 0
 
+    def _handle_search(self, args) -> int:
+        """Handle the search command."""
+        tasks = self.task_service.search_tasks(' '.join(args.query), args.limit)
+        if not self._print_summaries(task.to_summary() for task in tasks):
+            print("No matching tasks found.")
+        return 0
+
+    def _print_summaries(self, summaries: Iterable[TaskSummary], short_ids: Optional[Dict[str, str]] = None) -> bool:
+        """Print summaries as a table; return False without printing if there are none.
+
+        When ``short_ids`` is given, each ID is replaced by its shortest unique prefix.
+        """
+        from src.interfaces.task_render import render_table
+        count = render_table(summaries, sys.stdout, short_ids)
+        sys.stdout.flush()
+        return count > 0
+
+    def _resolve_id(self, task_id: str) -> Optional[str]:
+        """Resolve a full ID or unique prefix, printing an error when it cannot be resolved."""
+        try:
+            resolved = self.task_service.resolve_task_id(task_id)
+        except (AmbiguousIdError, PrefixTooShortError) as e:
+            print(f"Error: {e}")
+            return None
+        if resolved is None:
+            print(f"Error: Task with ID {task_id} not found")
+        return resolved
+
     def _handle_update(self, args) -> int:
         """Handle the update command."""
+        task_id = self._resolve_id(args.id)
+        if task_id is None:
+            return 1
+        expected_version = getattr(args, 'if_version', None)
         try:
-            task = self.task_service.update_task(args.id, args.title, args.description)
+            task = self.task_service.update_task(task_id, args.title, args.description,
+                                                  expected_version=expected_version)
             if task:
-                print(f"Task {args.id} updated successfully")
+                if expected_version is None:
+                    print(f"Task {task_id} updated successfully")
+                else:
+                    print(f"Task {task_id} updated successfully (now version {task.version})")
                 return 0
             else:
-                print(f"Error: Task with ID {args.id} not found")
+                print(f"Error: Task with ID {task_id} not found")
                 return 1
         except ValueError as e:
             print(f"Error: {e}")
@@ -117,30 +355,170 @@ class CLIController:
 
     def _handle_delete(self, args) -> int:
         """Handle the delete command."""
-        success = self.task_service.delete_task(args.id)
-        if success:
-            print(f"Task {args.id} deleted successfully")
-            return 0
-        else:
-            print(f"Error: Task with ID {args.id} not found")
-            return 1
+        return self._handle_many(args, self.task_service.delete_tasks, "Task {} deleted successfully")
 
     def _handle_complete(self, args) -> int:
         """Handle the complete command."""
-        task = self.task_service.mark_task_complete(args.id)
-        if task:
-            print(f"Task {args.id} marked as complete")
-            return 0
-        else:
-            print(f"Error: Task with ID {args.id} not found")
-            return 1
+        return self._handle_many(args, self.task_service.mark_complete_many, "Task {} marked as complete")
 
     def _handle_incomplete(self, args) -> int:
         """Handle the incomplete command."""
-        task = self.task_service.mark_task_incomplete(args.id)
-        if task:
-            print(f"Task {args.id} marked as incomplete")
-            return 0
+        return self._handle_many(args, self.task_service.mark_incomplete_many, "Task {} marked as incomplete")
+
+    def _handle_import(self, args) -> int:
+        """Handle the import command, streaming records into storage batch by batch."""
+        from src.interfaces.task_import import PARSERS
+        input_format = args.format or ('csv' if args.file.lower().endswith('.csv') else 'ndjson')
+        try:
+            stream = sys.stdin if args.file == '-' else open(args.file, newline='', encoding='utf-8')
+        except OSError as e:
+            print(f"Error: {e}")
+            return 1
+
+        imported = 0
+        start = last_report = time.perf_counter()
+        try:
+            for count in self.task_service.import_tasks(PARSERS[input_format](stream), args.batch_size):
+                imported += count
+                now = time.perf_counter()
+                if now - last_report >= PROGRESS_INTERVAL:
+                    print(f"Imported {imported} tasks ({imported / (now - start):.0f} tasks/s)", file=sys.stderr)
+                    last_report = now
+        except ValueError as e:
+            print(f"Error: {e}")
+            print(f"Imported {imported} tasks before the error")
+            return 1
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+        elapsed = time.perf_counter() - start
+        rate = imported / elapsed if elapsed > 0 else 0
+        print(f"Imported {imported} tasks in {elapsed:.2f}s ({rate:.0f} tasks/s)")
+        return 0
+
+    def _handle_export(self, args) -> int:
+        """Handle the export command, streaming tasks to the output in buffered chunks."""
+        from src.interfaces.task_export import WRITERS
+        try:
+            out = sys.stdout if args.output == '-' else open(args.output, 'w', newline='', encoding='utf-8')
+        except OSError as e:
+            print(f"Error: {e}")
+            return 1
+        try:
+            count = WRITERS[args.format](self.task_service.iter_tasks(), out)
+        finally:
+            if out is sys.stdout:
+                out.flush()
+            else:
+                out.close()
+        if out is not sys.stdout:
+            print(f"Exported {count} tasks to {args.output}")
+        return 0
+
+    def _handle_shell(self, args) -> int:
+        """Handle the shell command, reading commands until exit or end of input."""
+        from src.interfaces.shell import TaskShell
+        return TaskShell(self, history_path=args.history or None).run()
+
+    def _handle_serve(self, args) -> int:
+        """Handle the serve command, running client commands until interrupted or idle."""
+        from src.config import Config
+        from src.interfaces.daemon import TaskDaemon, daemon_supported, default_socket_path
+        if not daemon_supported():
+            print("Error: The daemon needs Unix domain sockets, which this platform does not support")
+            return 1
+        config = Config.from_env()
+        try:
+            socket_path = args.socket or config.socket_path or default_socket_path(config)
+        except OSError as e:
+            print(f"Error: {e}")
+            return 1
+        self.task_service.changes  # Start the feed now, so watchers can resume from any change the daemon made.
+        print(f"Serving tasks on {socket_path}", file=sys.stderr)
+        return TaskDaemon(self, socket_path, args.idle_timeout).serve()
+
+    def _handle_api(self, args) -> int:
+        """Handle the api command, answering HTTP requests until interrupted."""
+        import asyncio
+        from src.interfaces.http_api import serve
+        try:
+            asyncio.run(serve(self.task_service, args.host, args.port))
+        except OSError as e:
+            print(f"Error: {e}")
+            return 1
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    def _handle_watch(self, args) -> int:
+        """Handle the watch command in-process, where no other command's changes can be seen."""
+        print("Error: The watch command follows changes made through the daemon; run it with TODO_DAEMON=1")
+        return 1
+
+    def subscribe(self, args) -> ChangeSubscription:
+        """Start following changes from where a parsed watch command asks: after ``--after``, or from now on.
+
+        Raises ValueError for a cursor that is malformed or from another run of the feed.
+        """
+        changes = self.task_service.changes
+        return changes.subscribe(None if args.after is None else changes.parse_cursor(args.after))
+
+    def follow_changes(self, subscription: ChangeSubscription, output_format: str, out: IO[str],
+                       stopped: Callable[[], bool]) -> int:
+        """Write each change to ``out`` as it happens, until ``stopped`` returns true.
+
+        The daemon runs this on a thread of its own for each watching client.
+        """
+        from src.interfaces.task_render import render_changes
+        epoch = self.task_service.changes.epoch
+        try:
+            while not stopped():
+                events = subscription.poll(timeout=WATCH_POLL_INTERVAL)
+                if events:
+                    render_changes(events, out, epoch, output_format)
+                    out.flush()
+        except ValueError as e:
+            print(f"Error: {e}", file=out)
+            return 1
+        return 0
+
+    def _handle_stats(self, args) -> int:
+        """Handle the stats command, printing the metrics recorded since the service started."""
+        snapshot = getattr(self.task_service.metrics, "snapshot", None)
+        if snapshot is None:
+            print("Error: Metrics are off; run the daemon, shell or API with TODO_METRICS=1")
+            return 1
+        from src.interfaces.task_render import render_prometheus, render_stats
+        stats = snapshot()
+        if args.format == 'prometheus':
+            sys.stdout.write(render_prometheus(stats))
+        elif stats:
+            render_stats(stats, sys.stdout)
         else:
-            print(f"Error: Task with ID {args.id} not found")
-            return 1
\ No newline at end of file
+            print("No operations recorded yet")
+        return 0
+
+    def _handle_many(self, args, operation, success_message: str) -> int:
+        """Resolve one or more IDs and apply a bulk service operation to them as one batch.
+
+        ``operation`` takes a list of task IDs and returns one result per ID,
+        falsy where the task was not found.
+        """
+        requested = [args.id] if isinstance(args.id, str) else list(args.id)
+        try:
+            resolved = self.task_service.resolve_task_ids(requested)
+        except (AmbiguousIdError, PrefixTooShortError) as e:
+            print(f"Error: {e}")
+            return 1
+
+        found = list(dict.fromkeys(task_id for task_id in resolved if task_id is not None))
+        results = dict(zip(found, operation(found)))
+        exit_code = 0
+        for value, task_id in zip(requested, resolved):
+            if task_id is not None and results.get(task_id):
+                print(success_message.format(task_id))
+            else:
+                print(f"Error: Task with ID {value if task_id is None else task_id} not found")
+                exit_code = 1
+        return exit_code
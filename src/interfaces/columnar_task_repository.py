@@ -0,0 +1,343 @@
+"""
+Compact columnar in-memory repository for Task entities.
+"""
+from array import array
+from bisect import bisect_right
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple
+from src.entities.task import Task, TaskStatus, TaskSummary, summarize_text
+from src.entities.task_id import id_from_bytes, id_to_bytes
+from src.interfaces.task_repository import TaskRepository
+
+
+_EMPTY = -1
+_TOMBSTONE = -2
+# Bytes of each bitset combined at a time when scanning a status.
+_SCAN_BYTES = 4096
+
+
+class ColumnarTaskRepository(TaskRepository):
+    """In-memory repository that stores tasks as columns instead of objects.
+
+    IDs are packed as 16-byte UUIDs and looked up through an open-addressing
+    hash table of slot numbers, status and liveness are bitsets, and all
+    titles and descriptions share one UTF-8 buffer addressed by offset arrays.
+    ``Task`` objects are only built when a task leaves the repository. Deleted
+    slots and overwritten text are reclaimed by compaction once they outweigh
+    the live data.
+    """
+
+    def __init__(self):
+        """Initialize the repository with empty columns."""
+        self._next_seq = 1
+        self._reset()
+
+    def _reset(self) -> None:
+        """Replace every column with an empty one."""
+        self._table = array("q", [_EMPTY]) * 8
+        self._table_used = 0
+        self._count = 0
+        self._ids = bytearray()
+        # Insertion sequence numbers, ascending by slot and kept across compaction.
+        self._seq_column = array("Q")
+        self._versions = array("I")
+        self._live = bytearray()
+        self._complete = bytearray()
+        self._text = bytearray()
+        self._title_offsets = array("Q")
+        self._title_lengths = array("I")
+        self._description_offsets = array("Q")
+        # -1 marks a missing description, as opposed to an empty one.
+        self._description_lengths = array("i")
+        self._dead_slots = 0
+        self._dead_bytes = 0
+        self._id_index = None
+
+    def add(self, task: Task) -> Task:
+        """Add a new task, overwriting an existing ID in place."""
+        self._insert(task)
+        self._publish_stored(task)
+        return task
+
+    def _insert(self, task: Task, seq: Optional[int] = None, version: Optional[int] = None) -> Task:
+        """Store a task, giving a new ID the next (or the given) sequence number.
+
+        The task's version is bumped unless one is given, as when compaction moves it.
+        """
+        key = self._pack_id(task.id)
+        index, slot = self._probe(key)
+        if slot is None:
+            slot = len(self._title_offsets)
+            if self._table[index] == _EMPTY:
+                self._table_used += 1
+            self._table[index] = slot
+            self._count += 1
+            self._ids += key
+            self._seq_column.append(self._next_seq if seq is None else seq)
+            self._next_seq = max(self._next_seq, self._seq_column[slot] + 1)
+            if self._id_index is not None:
+                self._id_index.add(task.id)
+            if slot % 8 == 0:
+                self._live.append(0)
+                self._complete.append(0)
+            self._versions.append(0)
+            self._title_offsets.append(0)
+            self._title_lengths.append(0)
+            self._description_offsets.append(0)
+            self._description_lengths.append(-1)
+            self._set_bit(self._live, slot, True)
+            if self._table_used * 3 > len(self._table) * 2:
+                self._rehash()
+        task.version = self._versions[slot] + 1 if version is None else version
+        self._store(slot, task)
+        return task
+
+    def get_by_id(self, task_id: str) -> Optional[Task]:
+        """Retrieve a task by its ID."""
+        slot = self._lookup(task_id)
+        return None if slot is None else self._materialize(slot)
+
+    def get_all(self) -> List[Task]:
+        """Retrieve all tasks in insertion order."""
+        return [self._materialize(slot) for slot in self._live_slots()]
+
+    def iter_all(self) -> Iterator[Task]:
+        """Iterate over all tasks in insertion order, building each Task on demand."""
+        return (self._materialize(slot) for slot in self._live_slots())
+
+    def get_page(self, limit: int, after: Optional[int] = None,
+                 status: Optional[TaskStatus] = None) -> Tuple[List[Task], Optional[int]]:
+        """Return up to ``limit`` tasks after the given sequence key, seeking by bisection.
+
+        With a status, the slots are read from that status's bitset starting at
+        the seek position, so whole bytes of other tasks are skipped at once.
+        """
+        page: List[Task] = []
+        slot = 0 if after is None else bisect_right(self._seq_column, after)
+        if status is not None:
+            slots = list(islice(self._status_slots(status, slot), limit + 1))
+            page = [self._materialize(found) for found in slots[:limit]]
+            return page, self._seq_column[slots[limit - 1]] if len(slots) > limit else None
+        while slot < len(self._seq_column):
+            if self._get_bit(self._live, slot):
+                if len(page) == limit:
+                    return page, self._seq_column[previous]
+                page.append(self._materialize(slot))
+                previous = slot
+            slot += 1
+        return page, None
+
+    def get_by_status(self, status: TaskStatus) -> List[Task]:
+        """Retrieve all tasks with the given status from the status bitset."""
+        return [self._materialize(slot) for slot in self._status_slots(status)]
+
+    def iter_summaries(self, status: Optional[TaskStatus] = None) -> Iterator[TaskSummary]:
+        """Iterate over listing summaries without building Task objects."""
+        slots = self._live_slots() if status is None else self._status_slots(status)
+        for slot in slots:
+            yield TaskSummary(
+                self._task_id(slot),
+                self._status(slot),
+                summarize_text(self._title(slot)),
+                summarize_text(self._description(slot))
+            )
+
+    def update(self, task: Task) -> Optional[Task]:
+        """Update an existing task."""
+        slot = self._lookup(task.id)
+        if slot is None:
+            return None
+        task.version = self._versions[slot] + 1
+        self._store(slot, task)
+        self._publish_stored(task)
+        return task
+
+    def delete(self, task_id: str) -> bool:
+        """Delete a task by its ID."""
+        try:
+            index, slot = self._probe(self._pack_id(task_id))
+        except ValueError:
+            return False
+        if slot is None:
+            return False
+        self._table[index] = _TOMBSTONE
+        self._count -= 1
+        if self._id_index is not None:
+            self._id_index.remove(task_id)
+        self._set_bit(self._live, slot, False)
+        self._dead_slots += 1
+        self._dead_bytes += self._text_size(slot)
+        self._maybe_compact()
+        self._publish_deleted(task_id)
+        return True
+
+    def _all_ids(self) -> Iterable[str]:
+        """All live task IDs, used to build the sorted ID index."""
+        return (self._task_id(slot) for slot in self._live_slots())
+
+    @staticmethod
+    def _pack_id(task_id: str) -> bytes:
+        """Pack a canonical UUID string into its 16-byte form."""
+        try:
+            packed = id_to_bytes(task_id)
+        except ValueError:
+            raise ValueError(f"Task ID must be a UUID in the columnar store: {task_id}") from None
+        if task_id != task_id.lower():
+            raise ValueError(f"Task ID must be a canonical UUID in the columnar store: {task_id}")
+        return packed
+
+    def _lookup(self, task_id: str) -> Optional[int]:
+        """Find the slot of a task ID, treating malformed IDs as missing."""
+        try:
+            return self._probe(self._pack_id(task_id))[1]
+        except ValueError:
+            return None
+
+    def _probe(self, key: bytes) -> Tuple[int, Optional[int]]:
+        """Find a packed ID in the hash table with linear probing.
+
+        Returns the table index holding the ID and its slot, or the index where
+        it should be inserted and None.
+        """
+        table = self._table
+        ids = self._ids
+        mask = len(table) - 1
+        index = hash(key) & mask
+        free = None
+        while True:
+            slot = table[index]
+            if slot == _EMPTY:
+                return (index if free is None else free), None
+            if slot == _TOMBSTONE:
+                if free is None:
+                    free = index
+            elif ids[slot * 16:slot * 16 + 16] == key:
+                return index, slot
+            index = (index + 1) & mask
+
+    def _rehash(self) -> None:
+        """Rebuild the hash table at a size that keeps it at most half full."""
+        size = 8
+        while size < self._count * 2:
+            size *= 2
+        self._table = array("q", [_EMPTY]) * size
+        self._table_used = 0
+        for slot in self._live_slots():
+            index, _ = self._probe(bytes(self._ids[slot * 16:slot * 16 + 16]))
+            self._table[index] = slot
+            self._table_used += 1
+
+    @staticmethod
+    def _set_bit(bits: bytearray, slot: int, value: bool) -> None:
+        """Set or clear one bit of a bitset."""
+        if value:
+            bits[slot >> 3] |= 1 << (slot & 7)
+        else:
+            bits[slot >> 3] &= ~(1 << (slot & 7)) & 0xFF
+
+    @staticmethod
+    def _get_bit(bits: bytearray, slot: int) -> bool:
+        """Read one bit of a bitset."""
+        return bool(bits[slot >> 3] & (1 << (slot & 7)))
+
+    def _live_slots(self) -> Iterator[int]:
+        """Iterate over live slots in insertion order."""
+        return self._iter_bits(self._live)
+
+    def _status_slots(self, status: TaskStatus, start: int = 0) -> Iterator[int]:
+        """Iterate over live slots from ``start`` on with the given status by combining the bitsets.
+
+        The bitsets are combined a block at a time, so a caller that stops early,
+        like a page, only pays for the blocks it reached.
+        """
+        live_bits, complete_bits = self._live, self._complete
+        first = start >> 3
+        while first < len(live_bits):
+            end = first + _SCAN_BYTES
+            live = int.from_bytes(live_bits[first:end], "little")
+            complete = int.from_bytes(complete_bits[first:end], "little")
+            bits = live & complete if status == TaskStatus.COMPLETE else live & ~complete
+            base = first << 3
+            if base < start:
+                # Slots before ``start`` in its first byte are cleared.
+                bits = (bits >> (start & 7)) << (start & 7)
+            for slot in self._iter_bits(bits.to_bytes(min(end, len(live_bits)) - first, "little")):
+                yield base + slot
+            first = end
+
+    @staticmethod
+    def _iter_bits(bits: bytes) -> Iterator[int]:
+        """Iterate over the set bit positions of a bitset, skipping empty bytes."""
+        for index, byte in enumerate(bits):
+            if not byte:
+                continue
+            base = index << 3
+            for bit in range(8):
+                if byte & (1 << bit):
+                    yield base + bit
+
+    def _store(self, slot: int, task: Task) -> None:
+        """Write a task's fields into the columns of a slot."""
+        self._dead_bytes += self._text_size(slot)
+        self._versions[slot] = task.version
+        self._set_bit(self._complete, slot, task.status == TaskStatus.COMPLETE)
+        title = task.title.encode("utf-8")
+        self._title_offsets[slot] = len(self._text)
+        self._title_lengths[slot] = len(title)
+        self._text += title
+        if task.description is None:
+            self._description_lengths[slot] = -1
+        else:
+            description = task.description.encode("utf-8")
+            self._description_offsets[slot] = len(self._text)
+            self._description_lengths[slot] = len(description)
+            self._text += description
+        self._maybe_compact()
+
+    def _text_size(self, slot: int) -> int:
+        """Bytes of shared text buffer referenced by a slot."""
+        return self._title_lengths[slot] + max(self._description_lengths[slot], 0)
+
+    def _task_id(self, slot: int) -> str:
+        """Unpack the ID of a slot back into its string form."""
+        return id_from_bytes(self._ids[slot * 16:slot * 16 + 16])
+
+    def _title(self, slot: int) -> str:
+        """Decode the title of a slot from the shared buffer."""
+        start = self._title_offsets[slot]
+        return self._text[start:start + self._title_lengths[slot]].decode("utf-8")
+
+    def _description(self, slot: int) -> Optional[str]:
+        """Decode the description of a slot from the shared buffer."""
+        length = self._description_lengths[slot]
+        if length < 0:
+            return None
+        start = self._description_offsets[slot]
+        return self._text[start:start + length].decode("utf-8")
+
+    def _status(self, slot: int) -> TaskStatus:
+        """Read the status bit of a slot."""
+        return TaskStatus.COMPLETE if self._get_bit(self._complete, slot) else TaskStatus.INCOMPLETE
+
+    def _materialize(self, slot: int) -> Task:
+        """Build a Task object from the columns of a slot."""
+        return Task(
+            id=self._task_id(slot),
+            title=self._title(slot),
+            description=self._description(slot),
+            status=self._status(slot),
+            version=self._versions[slot]
+        )
+
+    def _maybe_compact(self) -> None:
+        """Compact once dead slots or dead text outweigh the live data."""
+        if self._dead_slots > max(self._count, 1024) or \
+                self._dead_bytes > max(len(self._text) - self._dead_bytes, 1 << 16):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Rebuild every column with only the live slots, in insertion order."""
+        entries = [(self._seq_column[slot], self._materialize(slot)) for slot in self._live_slots()]
+        self._reset()
+        for seq, task in entries:
+            self._insert(task, seq, task.version)
@@ -0,0 +1,152 @@
+"""
+Thread-safe in-memory repository for Task entities using lock striping.
+"""
+from contextlib import contextmanager
+from threading import Lock
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+from src.entities.task import Task, TaskStatus, TaskSummary
+from src.interfaces.task_repository import TaskRepository, VersionConflictError
+
+
+# Number of stripe locks task IDs are hashed onto.
+STRIPES = 64
+
+
+class ConcurrentTaskRepository(TaskRepository):
+    """In-memory repository that can be shared between threads.
+
+    Each task ID hashes to one of a fixed set of stripe locks, so writes to
+    unrelated tasks do not wait on each other. Adds, deletes and status
+    changes also take a structure lock guarding the insertion order, the
+    status indexes and the ID index. Full scans
+    take every lock and copy what they return, so they see a consistent
+    snapshot. Tasks are copied on the way in and out, so no caller ever holds
+    a stored object. Read-modify-writes are optimistic: ``modify`` reads a
+    copy, changes it without holding any lock and stores it with
+    ``update_if_version``, retrying if another write got there first.
+
+    Stored tasks are never changed in place, only replaced, so a scan only
+    collects references while it holds the locks and copies them afterwards.
+    """
+
+    def __init__(self, stripes: int = STRIPES):
+        """Initialize the repository with empty storage and its locks."""
+        super().__init__()
+        self._stripes = [Lock() for _ in range(stripes)]
+        self._structure_lock = Lock()
+
+    def add(self, task: Task) -> Task:
+        """Add a new task to the repository."""
+        copy = task.copy()
+        with self._stripe(task.id), self._structure_lock:
+            super().add(copy)
+        task.version = copy.version
+        return task
+
+    def get_by_id(self, task_id: str) -> Optional[Task]:
+        """Retrieve a copy of a task by its ID."""
+        with self._stripe(task_id):
+            task = self._tasks.get(task_id)
+        return None if task is None else task.copy()
+
+    def get_all(self) -> List[Task]:
+        """Retrieve a consistent snapshot of all tasks."""
+        with self._snapshot():
+            tasks = list(self._tasks.values())
+        return [task.copy() for task in tasks]
+
+    def iter_all(self) -> Iterator[Task]:
+        """Iterate over a consistent snapshot of all tasks."""
+        return iter(self.get_all())
+
+    def get_page(self, limit: int, after: Optional[int] = None,
+                 status: Optional[TaskStatus] = None) -> Tuple[List[Task], Optional[int]]:
+        """Return up to ``limit`` tasks in insertion order after the given sequence key."""
+        with self._snapshot():
+            page, next_key = super().get_page(limit, after, status)
+        return [task.copy() for task in page], next_key
+
+    def get_by_status(self, status: TaskStatus) -> List[Task]:
+        """Retrieve a consistent snapshot of the tasks with the given status."""
+        with self._snapshot():
+            tasks = [self._tasks[task_id] for task_id in self._status_index[status]]
+        return [task.copy() for task in tasks]
+
+    def iter_summaries(self, status: Optional[TaskStatus] = None) -> Iterator[TaskSummary]:
+        """Iterate over listing summaries taken from one consistent snapshot."""
+        with self._snapshot():
+            if status is None:
+                tasks = list(self._tasks.values())
+            else:
+                tasks = [self._tasks[task_id] for task_id in self._status_index[status]]
+        return (task.to_summary() for task in tasks)
+
+    def ids_with_prefix(self, prefix: str, limit: int = 2) -> List[str]:
+        """Return up to ``limit`` task IDs starting with the prefix, in sorted order."""
+        with self._structure_lock:
+            return super().ids_with_prefix(prefix, limit)
+
+    def iter_sorted_ids(self) -> Iterator[str]:
+        """Iterate over a snapshot of all task IDs in sorted order."""
+        with self._structure_lock:
+            return iter(list(super().iter_sorted_ids()))
+
+    def update(self, task: Task) -> Optional[Task]:
+        """Replace an existing task with a copy of the given one."""
+        copy = task.copy()
+        with self._stripe(task.id):
+            if self._update_striped(copy) is None:
+                return None
+        task.version = copy.version
+        return task
+
+    def update_if_version(self, task: Task, expected_version: int) -> Optional[Task]:
+        """Replace an existing task only if its stored version is still ``expected_version``."""
+        copy = task.copy()
+        with self._stripe(task.id):
+            stored = self._tasks.get(task.id)
+            if stored is None:
+                return None
+            if stored.version != expected_version:
+                raise VersionConflictError(task.id, expected_version, stored.version)
+            self._update_striped(copy)
+        task.version = copy.version
+        return task
+
+    def modify_many(self, task_ids: Iterable[str], change: Callable[[Task], None]) -> List[Optional[Task]]:
+        """Apply ``change`` to several tasks, each with its own compare-and-set."""
+        return [self.modify(task_id, change) for task_id in task_ids]
+
+    def delete(self, task_id: str) -> bool:
+        """Delete a task by its ID."""
+        with self._stripe(task_id), self._structure_lock:
+            return super().delete(task_id)
+
+    def _update_striped(self, copy: Task) -> Optional[Task]:
+        """Store an updated copy while its stripe is held.
+
+        A status change moves the task in the status indexes every stripe
+        shares, so it also takes the structure lock.
+        """
+        stored = self._tasks.get(copy.id)
+        if stored is not None and stored.status != copy.status:
+            with self._structure_lock:
+                return super().update(copy)
+        return super().update(copy)
+
+    def _stripe(self, task_id: str) -> Lock:
+        """The lock guarding a task ID."""
+        return self._stripes[hash(task_id) % len(self._stripes)]
+
+    @contextmanager
+    def _snapshot(self):
+        """Hold every lock, in a fixed order, so no write is in progress."""
+        for lock in self._stripes:
+            lock.acquire()
+        self._structure_lock.acquire()
+        try:
+            yield
+        finally:
+            self._structure_lock.release()
+            for lock in self._stripes:
+                lock.release()
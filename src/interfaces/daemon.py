@@ -0,0 +1,427 @@
+"""
+Local daemon that runs CLI commands against one resident task service, and its thin client.
+"""
+from typing import Callable, List, Optional, Sequence
+import os
+import select
+import signal
+import socket
+import stat
+import struct
+import sys
+import threading
+import time
+import zlib
+from src.config import Config
+from src.interfaces.repository_factory import DEFAULT_PATHS
+
+
+# Request: payload length, then the client's working directory and argv joined by NUL bytes.
+# The client's stdin, stdout and stderr travel alongside as SCM_RIGHTS file descriptors.
+_LENGTH = struct.Struct("!I")
+# Reply: one byte once the request has been accepted, then the command's exit code.
+_ACCEPTED = b"\x01"
+_EXIT = struct.Struct("!i")
+# SO_PEERCRED answer on Linux: the peer's pid, uid and gid.
+_PEER_CREDENTIALS = struct.Struct("3i")
+
+_MAX_REQUEST = 1 << 20
+# Seconds a client may take to send its request before the daemon moves on.
+_REQUEST_TIMEOUT = 5.0
+# Seconds between checks for shutdown and idle timeout while waiting for clients.
+_POLL_INTERVAL = 0.5
+
+# Idle seconds after which an auto-started daemon exits.
+AUTO_IDLE_TIMEOUT = 600.0
+# Seconds a client waits for an auto-started daemon before running in-process.
+START_TIMEOUT = 10.0
+
+# Commands that always run in the calling process.
+LOCAL_COMMANDS = ("serve", "shell", "api")
+# Commands that last until the client goes away, so each runs on a thread of its own.
+WATCH_COMMAND = "watch"
+
+
+class DaemonConnectionError(ConnectionError):
+    """Raised when the daemon accepted a command but closed the connection before finishing it."""
+
+
+class DaemonPeerError(PermissionError):
+    """Raised when the process at the other end of a daemon socket belongs to another user."""
+
+
+def resolve_data_path(config: Config) -> Optional[str]:
+    """Absolute path of the store, or None for in-memory backends."""
+    if config.data_path is None and config.backend not in DEFAULT_PATHS:
+        return None
+    return os.path.abspath(config.data_path or DEFAULT_PATHS[config.backend])
+
+
+def default_socket_path(config: Config) -> str:
+    """Socket path for a store: one daemon per user, backend and data file, in a directory only the user can use."""
+    key = f"{config.backend}:{resolve_data_path(config) or ''}".encode("utf-8")
+    return os.path.join(socket_directory(), f"todo-{zlib.crc32(key):08x}.sock")
+
+
+def socket_directory() -> str:
+    """The user's private directory for daemon sockets, created if needed.
+
+    This is ``$XDG_RUNTIME_DIR`` when it is set, or ``todo-<uid>`` in the
+    temporary directory. Raises PermissionError unless the directory is a
+    real directory owned by the user that no one else can enter, so another
+    local user cannot put a socket where clients will look for one.
+    """
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime:
+        directory = os.path.join(runtime, "todo")
+    else:
+        directory = os.path.join(os.environ.get("TMPDIR") or "/tmp", f"todo-{os.getuid()}")
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(directory)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or stat.S_IMODE(info.st_mode) & 0o077:
+        raise PermissionError(f"{directory} must be a directory owned by you with mode 0700")
+    return directory
+
+
+def peer_uid(connection: socket.socket) -> Optional[int]:
+    """User ID of the process at the other end of a Unix socket, or None where the platform cannot tell."""
+    if hasattr(socket, "SO_PEERCRED"):
+        credentials = connection.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, _PEER_CREDENTIALS.size)
+        return _PEER_CREDENTIALS.unpack(credentials)[1]
+    return None
+
+
+def _check_peer(connection: socket.socket) -> None:
+    """Raise DaemonPeerError unless the peer runs as this process's user."""
+    uid = peer_uid(connection)
+    if uid is not None and uid != os.getuid():
+        raise DaemonPeerError(f"The todo daemon socket is held by user {uid}, not by you")
+
+
+def daemon_supported() -> bool:
+    """Whether this platform can pass file descriptors over Unix sockets."""
+    return hasattr(socket, "AF_UNIX") and hasattr(socket, "send_fds")
+
+
+class TaskDaemon:
+    """Serve CLI commands on a Unix socket with one long-lived CLI controller.
+
+    Clients are handled one at a time, so commands from concurrent terminals
+    are serialized. Each command runs with the client's working directory and
+    writes straight to the client's own stdout and stderr. The exception is
+    ``watch``: once its arguments are parsed, it follows the change feed on a
+    thread of its own until its client disconnects, while other commands
+    carry on. The daemon does not count as idle while anyone is watching.
+    """
+
+    def __init__(self, cli_controller, socket_path: str, idle_timeout: float = 0.0):
+        """Initialize the daemon; an idle timeout of 0 keeps it running until stopped."""
+        self.cli_controller = cli_controller
+        self.socket_path = socket_path
+        self.idle_timeout = idle_timeout
+        self._stopping = False
+        self._watchers: List[threading.Thread] = []
+
+    def serve(self) -> int:
+        """Accept and run commands until stopped, idle for too long, or replaced by another daemon."""
+        try:
+            running = call_daemon(self.socket_path, None) is not None
+        except DaemonPeerError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        if running:
+            print(f"Error: A daemon is already serving {self.socket_path}", file=sys.stderr)
+            return 1
+        listener, inode = self._listen()
+        try:
+            # Exit cleanly on SIGTERM so the store is closed; only possible from the main thread.
+            signal.signal(signal.SIGTERM, lambda signum, frame: self.stop())
+        except ValueError:
+            pass
+        last_request = time.monotonic()
+        try:
+            while not self._stopping:
+                try:
+                    connection, _ = listener.accept()
+                except socket.timeout:
+                    self._watchers = [thread for thread in self._watchers if thread.is_alive()]
+                    if self._watchers:
+                        last_request = time.monotonic()
+                    elif self.idle_timeout and time.monotonic() - last_request >= self.idle_timeout:
+                        break
+                    if not self._owns_socket(inode):
+                        break
+                    continue
+                with connection:
+                    self._handle(connection)
+                last_request = time.monotonic()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            listener.close()
+            if self._owns_socket(inode):
+                os.unlink(self.socket_path)
+            # Watchers notice within a poll interval and must be done before the store is closed.
+            self._stopping = True
+            for thread in self._watchers:
+                thread.join()
+        return 0
+
+    def stop(self) -> None:
+        """Ask a running daemon to exit after the current command."""
+        self._stopping = True
+        try:
+            # Wake the accept loop instead of waiting for its next poll.
+            call_daemon(self.socket_path, None)
+        except OSError:
+            pass
+
+    def _listen(self):
+        """Bind under a temporary name and rename into place, so the path only ever names a listening socket."""
+        temporary = f"{self.socket_path}.{os.getpid()}"
+        if os.path.exists(temporary):
+            os.unlink(temporary)
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(temporary)
+        os.chmod(temporary, 0o600)
+        listener.listen(64)
+        listener.settimeout(_POLL_INTERVAL)
+        os.replace(temporary, self.socket_path)
+        return listener, os.stat(self.socket_path).st_ino
+
+    def _owns_socket(self, inode: int) -> bool:
+        """Whether the socket path still refers to this daemon's socket."""
+        try:
+            return os.stat(self.socket_path).st_ino == inode
+        except FileNotFoundError:
+            return False
+
+    def _handle(self, connection: socket.socket) -> None:
+        """Run one client's command and send back its exit code."""
+        connection.settimeout(_REQUEST_TIMEOUT)
+        try:
+            # Only the daemon's own user may hand it streams and commands.
+            _check_peer(connection)
+            request = _receive_request(connection)
+        except (OSError, ValueError):
+            # DaemonPeerError is an OSError, so another user's connection is closed unanswered.
+            return
+        if request is None:
+            # A probe from a starting daemon checking whether this one is alive.
+            return
+        cwd, argv, fds = request
+        streams = [open(fds[0], "r", closefd=True), open(fds[1], "w", closefd=True), open(fds[2], "w", closefd=True)]
+        connection.settimeout(None)
+        watch = None
+        exit_code = None
+        try:
+            connection.sendall(_ACCEPTED)
+            if argv and argv[0] == WATCH_COMMAND:
+                watch = []
+                exit_code = self._run(cwd, argv, *streams, command=lambda: watch.append(self._subscribe(argv)))
+            else:
+                exit_code = self._run(cwd, argv, *streams)
+        except OSError:
+            # The client went away before its command started.
+            pass
+        if watch:
+            # The thread takes over the connection, so the accept loop closing its socket object leaves it open.
+            watcher = socket.socket(fileno=connection.detach())
+            thread = threading.Thread(target=self._watch, args=(watcher, *watch[0], streams), daemon=True)
+            self._watchers.append(thread)
+            thread.start()
+            return
+        self._finish(connection, streams, exit_code)
+
+    def _subscribe(self, argv: Sequence[str]):
+        """Parse a watch command and subscribe to the feed, in order with the commands around it."""
+        args = self.cli_controller.parse_args(list(argv))
+        return self.cli_controller.subscribe(args), args.format
+
+    def _watch(self, connection: socket.socket, subscription, output_format: str, streams) -> None:
+        """Follow the change feed for one client until it disconnects or the daemon stops."""
+        def stopped() -> bool:
+            # The client sends nothing more, so the connection only turns readable when it closes.
+            return self._stopping or bool(select.select([connection], [], [], 0)[0])
+
+        with connection:
+            try:
+                exit_code = self.cli_controller.follow_changes(subscription, output_format, streams[1], stopped)
+            except OSError:
+                # The client's output went away, such as a closed pipe.
+                exit_code = 1
+            self._finish(connection, streams, exit_code)
+
+    @staticmethod
+    def _finish(connection: socket.socket, streams, exit_code: Optional[int]) -> None:
+        """Close the client's streams, then send its exit code unless the command never started."""
+        # Closing flushes the output, which must reach the client before the exit code does.
+        for stream in streams:
+            try:
+                stream.close()
+            except OSError:
+                pass
+        if exit_code is not None:
+            try:
+                connection.sendall(_EXIT.pack(exit_code))
+            except OSError:
+                pass
+
+    def _run(self, cwd: str, argv: Sequence[str], stdin, stdout, stderr,
+             command: Optional[Callable[[], object]] = None) -> int:
+        """Run a command with the client's working directory and standard streams.
+
+        ``command`` replaces handling ``argv`` with the CLI controller; it
+        signals failure by raising and success by returning.
+        """
+        saved = sys.stdin, sys.stdout, sys.stderr, os.getcwd()
+        try:
+            try:
+                os.chdir(cwd)
+            except OSError as e:
+                print(f"Error: {e}", file=stderr)
+                return 1
+            sys.stdin, sys.stdout, sys.stderr = stdin, stdout, stderr
+            if argv and argv[0] in LOCAL_COMMANDS:
+                print(f"Error: The {argv[0]} command cannot run inside the daemon", file=stderr)
+                return 1
+            try:
+                if command is not None:
+                    command()
+                    return 0
+                return self.cli_controller.handle_command(list(argv))
+            except SystemExit as e:
+                # argparse exits after printing usage errors and --help.
+                return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            except BrokenPipeError:
+                return 1
+            except Exception as e:
+                print(f"Error: {e}", file=stderr)
+                return 1
+        finally:
+            sys.stdin, sys.stdout, sys.stderr = saved[:3]
+            os.chdir(saved[3])
+
+
+def _receive_exactly(connection: socket.socket, size: int) -> bytes:
+    """Read exactly ``size`` bytes, or fewer if the peer closes the connection."""
+    chunks = []
+    while size:
+        chunk = connection.recv(size)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _receive_request(connection: socket.socket):
+    """Read a request; return (cwd, argv, fds), or None if the client sent nothing."""
+    data, fds, _, _ = socket.recv_fds(connection, 64 * 1024, 3)
+    if not data:
+        for fd in fds:
+            os.close(fd)
+        return None
+    if len(fds) != 3 or len(data) < _LENGTH.size:
+        for fd in fds:
+            os.close(fd)
+        raise ValueError("Malformed request")
+    (length,) = _LENGTH.unpack_from(data)
+    if length > _MAX_REQUEST:
+        for fd in fds:
+            os.close(fd)
+        raise ValueError("Request too large")
+    payload = data[_LENGTH.size:]
+    if len(payload) < length:
+        payload += _receive_exactly(connection, length - len(payload))
+    cwd, *argv = payload.decode("utf-8", "surrogateescape").split("\0")
+    return cwd, argv, fds
+
+
+def call_daemon(socket_path: str, argv: Optional[Sequence[str]], fds: Sequence[int] = (0, 1, 2),
+                cwd: Optional[str] = None) -> Optional[int]:
+    """Run a command in the daemon listening on ``socket_path`` and return its exit code.
+
+    Returns None when no daemon is listening or the daemon closed the
+    connection before accepting the command, in which case it is safe to run
+    the command elsewhere. With ``argv`` None, only checks that a daemon answers.
+    Raises DaemonPeerError, before sending anything, when the socket is held
+    by another user.
+    """
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    with client:
+        try:
+            client.connect(socket_path)
+        except (FileNotFoundError, ConnectionRefusedError):
+            return None
+        _check_peer(client)
+        if argv is None:
+            return 0
+        payload = "\0".join([cwd or os.getcwd(), *argv]).encode("utf-8", "surrogateescape")
+        message = _LENGTH.pack(len(payload)) + payload
+        try:
+            sent = socket.send_fds(client, [message], list(fds))
+            if sent < len(message):
+                client.sendall(message[sent:])
+            accepted = client.recv(1)
+        except (BrokenPipeError, ConnectionResetError):
+            return None
+        if accepted != _ACCEPTED:
+            return None
+        reply = _receive_exactly(client, _EXIT.size)
+    if len(reply) < _EXIT.size:
+        raise DaemonConnectionError("Lost connection to the todo daemon while it was running the command")
+    return _EXIT.unpack(reply)[0]
+
+
+def start_daemon(config: Config, socket_path: str) -> bool:
+    """Start a detached daemon for the configured store and wait until it is listening.
+
+    Raises PermissionError when a stale socket at ``socket_path`` belongs to someone else.
+    """
+    if os.path.exists(socket_path) and call_daemon(socket_path, None) is None:
+        # Left behind by a daemon that did not shut down cleanly.
+        try:
+            os.unlink(socket_path)
+        except PermissionError as e:
+            raise PermissionError(f"Cannot remove the stale daemon socket {socket_path}: {e.strerror}") from e
+    import subprocess
+    env = dict(os.environ, TODO_DATA_PATH=resolve_data_path(config) or "")
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    subprocess.Popen(
+        [sys.executable, "-m", "src.main", "serve", "--socket", socket_path,
+         "--idle-timeout", str(AUTO_IDLE_TIMEOUT)],
+        cwd=root, env=env, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL, start_new_session=True
+    )
+    deadline = time.monotonic() + START_TIMEOUT
+    while time.monotonic() < deadline:
+        if os.path.exists(socket_path):
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def run_in_daemon(config: Config, argv: Sequence[str]) -> Optional[int]:
+    """Run a command through the daemon, starting one if needed.
+
+    Returns None when the command should run in-process instead: the
+    platform cannot pass file descriptors or no daemon could be started.
+    """
+    if not daemon_supported():
+        return None
+    try:
+        socket_path = config.socket_path or default_socket_path(config)
+        exit_code = call_daemon(socket_path, argv)
+        if exit_code is None:
+            if not start_daemon(config, socket_path):
+                print("Warning: Could not start the todo daemon; running in-process", file=sys.stderr)
+                return None
+            exit_code = call_daemon(socket_path, argv)
+    except (DaemonConnectionError, PermissionError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return exit_code
@@ -0,0 +1,412 @@
+"""
+Asyncio JSON HTTP API over TaskService, mirroring the web front end's /api/todos route.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+import asyncio
+import json
+import sys
+from src.entities.task import Task, TaskStatus
+from src.interfaces.task_render import PROMETHEUS_CONTENT_TYPE, render_prometheus
+from src.interfaces.task_repository import VersionConflictError
+from src.use_cases.task_service import TaskService
+
+
+API_PATH = "/api/todos"
+# Service metrics in the Prometheus text format, when the service records them.
+METRICS_PATH = "/metrics"
+
+# A JSON payload, the text of a Prometheus metrics page, or a JSON body encoded piece by piece.
+Payload = Union[Dict[str, object], str, Iterator[bytes], None]
+
+# Seconds an idle keep-alive connection is held open.
+KEEP_ALIVE_TIMEOUT = 15.0
+# Largest accepted request head and body, in bytes.
+MAX_HEADER_SIZE = 64 * 1024
+MAX_BODY_SIZE = 1024 * 1024
+# Todos read and encoded at a time while a listing is streamed, and the bytes sent per chunk.
+LIST_CHUNK_SIZE = 500
+STREAM_CHUNK_BYTES = 64 * 1024
+
+_REASONS = {
+    200: "OK", 201: "Created", 204: "No Content", 400: "Bad Request", 404: "Not Found",
+    405: "Method Not Allowed", 409: "Conflict", 413: "Payload Too Large", 431: "Request Header Fields Too Large",
+    500: "Internal Server Error", 501: "Not Implemented",
+}
+_ALLOWED_METHODS = "GET, POST, PUT, DELETE, OPTIONS"
+# Let a front end served from another origin (such as the Next.js dev server) call the API.
+_CORS_HEADERS = (
+    "Access-Control-Allow-Origin: *\r\n"
+    f"Access-Control-Allow-Methods: {_ALLOWED_METHODS}\r\n"
+    "Access-Control-Allow-Headers: Content-Type\r\n"
+)
+
+
+class HttpError(Exception):
+    """A request that ends the connection with an error response."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def todo_json(task: Task) -> Dict[str, object]:
+    """Convert a task to the front end's Todo shape."""
+    return {
+        "id": task.id,
+        "title": task.title,
+        "description": task.description or "",
+        "completed": task.status == TaskStatus.COMPLETE,
+        "version": task.version,
+    }
+
+
+class TaskHttpApi:
+    """HTTP/1.1 server exposing GET, POST, PUT and DELETE on /api/todos.
+
+    Connections are kept alive and requests on one connection are answered
+    in order, so pipelined requests work. Service calls run on a single
+    worker thread, which keeps them serialized without locks while the event
+    loop goes on reading and writing other connections. A GET listing is
+    streamed with chunked encoding, one page of todos at a time, so a large
+    store is never encoded into one response body.
+    """
+
+    def __init__(self, task_service: TaskService):
+        """Initialize the API around a task service."""
+        self.task_service = task_service
+        self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="todo-api")
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8000) -> asyncio.AbstractServer:
+        """Start listening and return the server."""
+        return await asyncio.start_server(self._serve_connection, host, port, limit=MAX_HEADER_SIZE)
+
+    def close(self) -> None:
+        """Stop the worker thread once the service calls already queued have run."""
+        self._worker.shutdown()
+
+    def handle(self, method: str, target: str, body: bytes) -> Tuple[int, Payload]:
+        """Route one request and return its status and payload; an unexpected failure is a 500."""
+        try:
+            return self._route(method, target, body)
+        except Exception as e:
+            # A storage or programming error must not drop the connection without an answer.
+            print(f"Error: {method} {target} failed: {e!r}", file=sys.stderr)
+            return 500, {"success": False, "error": "Internal server error"}
+
+    def _route(self, method: str, target: str, body: bytes) -> Tuple[int, Payload]:
+        """Dispatch one request to its handler."""
+        url = urlsplit(target)
+        if url.path == METRICS_PATH and method == "GET":
+            return self._metrics()
+        if url.path.rstrip("/") != API_PATH:
+            return 404, {"success": False, "error": "Not found"}
+        if method == "GET":
+            return 200, self._list_chunks()
+        if method == "POST":
+            return self._create(body)
+        if method == "PUT":
+            return self._update(body)
+        if method == "DELETE":
+            return self._delete(parse_qs(url.query).get("id", [""])[0])
+        if method == "OPTIONS":
+            return 204, None
+        return 405, {"success": False, "error": "Method not allowed"}
+
+    def _list_chunks(self) -> Iterator[bytes]:
+        """Encode GET: every todo in insertion order, a page at a time.
+
+        Each page is a fresh seek from the previous page's cursor, so writes
+        served between two pages neither break nor repeat the listing.
+        """
+        yield b'{"success":true,"data":['
+        separator = b""
+        cursor = None
+        while True:
+            page = self.task_service.list_tasks_page(LIST_CHUNK_SIZE, cursor)
+            if page.tasks:
+                todos = json.dumps([todo_json(task) for task in page.tasks], separators=(",", ":"))
+                yield separator + todos[1:-1].encode("utf-8")
+                separator = b","
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+        yield b"]}"
+
+    def _metrics(self) -> Tuple[int, Payload]:
+        """Handle GET /metrics: the service's operation metrics, or 404 when it records none."""
+        snapshot = getattr(self.task_service.metrics, "snapshot", None)
+        if snapshot is None:
+            return 404, {"success": False, "error": "Metrics are off; start the API with TODO_METRICS=1"}
+        return 200, render_prometheus(snapshot())
+
+    def _create(self, body: bytes) -> Tuple[int, Dict[str, object]]:
+        """Handle POST: create a todo from a title and optional description."""
+        data = _json_object(body)
+        if data is None:
+            return 400, {"success": False, "error": "Invalid request body"}
+        if not data.get("title"):
+            return 400, {"success": False, "error": "Title is required"}
+        error = _invalid_text(data)
+        if error is not None:
+            return 400, {"success": False, "error": error}
+        try:
+            task = self.task_service.add_task(data["title"], data.get("description") or None)
+        except ValueError as e:
+            return 400, {"success": False, "error": str(e)}
+        return 201, {"success": True, "data": todo_json(task)}
+
+    def _update(self, body: bytes) -> Tuple[int, Dict[str, object]]:
+        """Handle PUT: change any of title, description and completed in one write.
+
+        With ``version``, the change applies only if the todo is still at that
+        version; otherwise the response is 409 with the current todo, so the
+        client can merge and retry.
+        """
+        data = _json_object(body)
+        if data is None:
+            return 400, {"success": False, "error": "Invalid request body"}
+        task_id = data.get("id")
+        if not isinstance(task_id, str):
+            return 404, {"success": False, "error": "Todo not found"}
+        version = data.get("version")
+        if version is not None and (not isinstance(version, int) or isinstance(version, bool)):
+            return 400, {"success": False, "error": "Invalid version"}
+        error = _invalid_text(data)
+        if error is not None:
+            return 400, {"success": False, "error": error}
+        completed = data.get("completed")
+        if completed is not None and not isinstance(completed, bool):
+            return 400, {"success": False, "error": "Completed must be true or false"}
+        status = None if completed is None else (TaskStatus.COMPLETE if completed else TaskStatus.INCOMPLETE)
+        try:
+            task = self.task_service.update_task(task_id, data.get("title"), data.get("description"), status,
+                                                 expected_version=version)
+        except VersionConflictError as e:
+            current = self.task_service.task_repository.get_by_id(task_id)
+            if current is None:
+                return 404, {"success": False, "error": "Todo not found"}
+            return 409, {"success": False, "error": str(e), "data": todo_json(current)}
+        except ValueError as e:
+            return 400, {"success": False, "error": str(e)}
+        if task is None:
+            return 404, {"success": False, "error": "Todo not found"}
+        return 200, {"success": True, "data": todo_json(task)}
+
+    def _delete(self, task_id: str) -> Tuple[int, Dict[str, object]]:
+        """Handle DELETE: remove the todo named by the ``id`` query parameter."""
+        if not task_id:
+            return 400, {"success": False, "error": "ID is required"}
+        if not self.task_service.delete_task(task_id):
+            return 404, {"success": False, "error": "Todo not found"}
+        return 200, {"success": True, "message": "Todo deleted successfully"}
+
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer requests on one connection, in order, until it closes or idles out."""
+        idle_timer = _IdleTimer(writer.transport, KEEP_ALIVE_TIMEOUT)
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    writer.write(_response(431, {"success": False, "error": "Request head too large"}, False))
+                    break
+                try:
+                    method, target, keep_alive, body = await self._read_request(head, reader, writer)
+                except HttpError as e:
+                    writer.write(_response(e.status, {"success": False, "error": str(e)}, False))
+                    break
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                idle_timer.touch()
+                status, payload, start = await self._call(self._answer, method, target, body)
+                if start is not None:
+                    if not await self._stream(status, payload, start, keep_alive, writer):
+                        break
+                else:
+                    writer.write(_response(status, payload, keep_alive))
+                if not keep_alive:
+                    break
+                await writer.drain()
+        finally:
+            idle_timer.cancel()
+            try:
+                await writer.drain()
+            except ConnectionError:
+                pass
+            writer.close()
+
+    async def _call(self, function, *args):
+        """Run a service call on the worker thread and wait for its result."""
+        return await asyncio.get_running_loop().run_in_executor(self._worker, function, *args)
+
+    def _answer(self, method: str, target: str, body: bytes) -> Tuple[int, Payload, Optional[Tuple[bytes, bool]]]:
+        """Handle a request on the worker thread, encoding the start of a streamed body on the same trip.
+
+        A listing that fits in one chunk is then answered with a single trip,
+        and one that fails before anything was sent still gets a 500.
+        """
+        status, payload = self.handle(method, target, body)
+        if not isinstance(payload, Iterator):
+            return status, payload, None
+        try:
+            return status, payload, _next_chunk(payload)
+        except Exception as e:
+            print(f"Error: {method} {target} failed: {e!r}", file=sys.stderr)
+            return 500, {"success": False, "error": "Internal server error"}, None
+
+    async def _stream(self, status: int, pieces: Iterator[bytes], start: Tuple[bytes, bool], keep_alive: bool,
+                      writer: asyncio.StreamWriter) -> bool:
+        """Write a chunked response, encoding each chunk on the worker thread; False if it broke off.
+
+        The status line has gone out before the listing fails part way, so a
+        failure is answered by closing the connection instead of with a 500.
+        """
+        writer.write(_response_head(status, "application/json", keep_alive, "Transfer-Encoding: chunked\r\n"))
+        chunk, done = start
+        while True:
+            if chunk:
+                writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            if done:
+                writer.write(b"0\r\n\r\n")
+                return True
+            await writer.drain()
+            try:
+                chunk, done = await self._call(_next_chunk, pieces)
+            except Exception as e:
+                print(f"Error: Streaming a listing failed: {e!r}", file=sys.stderr)
+                return False
+
+    @staticmethod
+    async def _read_request(head: bytes, reader: asyncio.StreamReader,
+                            writer: asyncio.StreamWriter) -> Tuple[str, str, bool, bytes]:
+        """Parse a request head and read its body; return method, target, keep-alive and body."""
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, version = lines[0].split(" ")
+        except ValueError:
+            raise HttpError(400, "Malformed request line") from None
+        headers: Dict[str, str] = {}
+        for line in lines[1:]:
+            if line:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            raise HttpError(501, "Chunked request bodies are not supported")
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            raise HttpError(400, "Invalid Content-Length") from None
+        if length > MAX_BODY_SIZE or length < 0:
+            raise HttpError(413, "Request body too large")
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+        if length and headers.get("expect", "").lower() == "100-continue":
+            writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+        body = await reader.readexactly(length) if length else b""
+        return method, target, keep_alive, body
+
+
+class _IdleTimer:
+    """Close a transport once no request has arrived for ``timeout`` seconds.
+
+    A single timer reschedules itself from the time of the last request,
+    which is far cheaper than wrapping every read in ``asyncio.wait_for``.
+    """
+
+    def __init__(self, transport: asyncio.BaseTransport, timeout: float):
+        """Start timing from now."""
+        self.transport = transport
+        self.timeout = timeout
+        self.loop = asyncio.get_running_loop()
+        self.last_request = self.loop.time()
+        self.handle = self.loop.call_at(self.last_request + timeout, self._expire)
+
+    def touch(self) -> None:
+        """Record that a request arrived."""
+        self.last_request = self.loop.time()
+
+    def cancel(self) -> None:
+        """Stop timing."""
+        self.handle.cancel()
+
+    def _expire(self) -> None:
+        """Close the transport if idle for long enough, or check again later."""
+        deadline = self.last_request + self.timeout
+        if self.loop.time() >= deadline:
+            self.transport.close()
+        else:
+            self.handle = self.loop.call_at(deadline, self._expire)
+
+
+def _json_object(body: bytes) -> Optional[Dict[str, object]]:
+    """Decode a JSON object body, or return None if it is not one."""
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _next_chunk(pieces: Iterator[bytes]) -> Tuple[bytes, bool]:
+    """Join pieces of a streamed body until they fill a chunk; also tell whether the body is finished."""
+    chunk = []
+    size = 0
+    for piece in pieces:
+        chunk.append(piece)
+        size += len(piece)
+        if size >= STREAM_CHUNK_BYTES:
+            return b"".join(chunk), False
+    return b"".join(chunk), True
+
+
+def _invalid_text(data: Dict[str, object]) -> Optional[str]:
+    """Describe what is wrong with a request's title or description, or None if both are absent or valid."""
+    title = data.get("title")
+    if title is not None and (not isinstance(title, str) or not title):
+        return "Title must be a non-empty string"
+    description = data.get("description")
+    if description is not None and not isinstance(description, str):
+        return "Description must be a string"
+    return None
+
+
+def _response(status: int, payload: Payload, keep_alive: bool) -> bytes:
+    """Encode a complete HTTP response with a JSON body, or a metrics page for a text payload."""
+    if isinstance(payload, str):
+        body, content_type = payload.encode("utf-8"), PROMETHEUS_CONTENT_TYPE
+    else:
+        body = b"" if payload is None else json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        content_type = "application/json"
+    return _response_head(status, content_type, keep_alive, f"Content-Length: {len(body)}\r\n") + body
+
+
+def _response_head(status: int, content_type: str, keep_alive: bool, framing: str) -> bytes:
+    """Encode a response's status line and headers, with ``framing`` giving its body's length or encoding."""
+    head = (
+        f"HTTP/1.1 {status} {_REASONS.get(status, 'Unknown')}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"{framing}"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        f"{_CORS_HEADERS}"
+    )
+    if status == 405:
+        head += f"Allow: {_ALLOWED_METHODS}\r\n"
+    return head.encode("latin-1") + b"\r\n"
+
+
+async def serve(task_service: TaskService, host: str, port: int) -> None:
+    """Run the API until cancelled."""
+    api = TaskHttpApi(task_service)
+    server = await api.start(host, port)
+    for sock in server.sockets:
+        address = sock.getsockname()
+        print(f"Serving the todo API on http://{address[0]}:{address[1]}{API_PATH}", file=sys.stderr, flush=True)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        api.close()
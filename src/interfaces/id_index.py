@@ -0,0 +1,94 @@
+"""
+Sorted index over task IDs for unique-prefix lookups.
+"""
+from bisect import bisect_left
+from typing import Dict, Iterable, Iterator, List
+
+
+# Shortest prefix shown by `list --short`, even when fewer characters would be unique, and the
+# shortest accepted in place of a full ID, so a stray short argument cannot pick out a task to change.
+MIN_PREFIX_LENGTH = 4
+
+
+class AmbiguousIdError(ValueError):
+    """Raised when an ID prefix matches more than one task."""
+
+    def __init__(self, prefix: str, matches: List[str]):
+        super().__init__(f"ID prefix {prefix} matches more than one task")
+        self.prefix = prefix
+        self.matches = matches
+
+
+class PrefixTooShortError(ValueError):
+    """Raised when a value that is not a full task ID is too short to use as a prefix."""
+
+    def __init__(self, prefix: str):
+        super().__init__(f"ID prefix '{prefix}' is too short; give at least {MIN_PREFIX_LENGTH} characters of the ID")
+        self.prefix = prefix
+
+
+class SortedIdIndex:
+    """Task IDs kept in sorted order so prefix lookups are a binary search."""
+
+    def __init__(self, task_ids: Iterable[str] = ()):
+        """Initialize the index from existing IDs."""
+        self._ids: List[str] = sorted(task_ids)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over IDs in sorted order."""
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        """Number of indexed IDs."""
+        return len(self._ids)
+
+    def add(self, task_id: str) -> None:
+        """Insert an ID, ignoring IDs that are already present."""
+        index = bisect_left(self._ids, task_id)
+        if index == len(self._ids) or self._ids[index] != task_id:
+            self._ids.insert(index, task_id)
+
+    def remove(self, task_id: str) -> None:
+        """Remove an ID if present."""
+        index = bisect_left(self._ids, task_id)
+        if index < len(self._ids) and self._ids[index] == task_id:
+            del self._ids[index]
+
+    def with_prefix(self, prefix: str, limit: int = 2) -> List[str]:
+        """Return up to ``limit`` IDs starting with the prefix, in sorted order."""
+        matches = []
+        index = bisect_left(self._ids, prefix)
+        while index < len(self._ids) and len(matches) < limit and self._ids[index].startswith(prefix):
+            matches.append(self._ids[index])
+            index += 1
+        return matches
+
+
+def _common_prefix_length(left: str, right: str) -> int:
+    """Length of the common prefix of two strings."""
+    length = 0
+    for a, b in zip(left, right):
+        if a != b:
+            break
+        length += 1
+    return length
+
+
+def unique_prefixes(sorted_ids: Iterable[str], min_length: int = MIN_PREFIX_LENGTH) -> Dict[str, str]:
+    """Map each ID to its shortest unique prefix in one pass over IDs in sorted order.
+
+    In sorted order an ID shares its longest prefix with one of its neighbours,
+    so one character more than the longer of the two neighbour overlaps is unique.
+    """
+    prefixes: Dict[str, str] = {}
+    iterator = iter(sorted_ids)
+    current = next(iterator, None)
+    previous_overlap = 0
+    while current is not None:
+        following = next(iterator, None)
+        next_overlap = 0 if following is None else _common_prefix_length(current, following)
+        length = max(previous_overlap, next_overlap, min_length - 1) + 1
+        prefixes[current] = current[:length]
+        previous_overlap = next_overlap
+        current = following
+    return prefixes
@@ -0,0 +1,296 @@
+"""
+Append-only write-ahead log repository for Task entities.
+"""
+import gc
+import json
+import os
+import sys
+import threading
+from typing import Iterable, List, Optional, Tuple
+from src.entities.task import Task
+from src.interfaces.task_repository import TaskRepository
+from src.interfaces.task_snapshot import read_snapshot, write_snapshot
+
+
+class LogTaskRepository(TaskRepository):
+    """Repository that keeps tasks in memory and records every mutation to an append-only log.
+
+    Writes are appended sequentially and fsynced in groups: a sync happens once
+    ``group_commit_size`` records are pending or ``group_commit_interval`` seconds
+    have passed since the first pending record. When the records logged since
+    the last checkpoint pass ``checkpoint_threshold`` (and make up at least
+    ``checkpoint_ratio`` of the live set) a background thread checkpoints the
+    store: under the lock the log is renamed to a numbered segment
+    (``<path>.<generation>``) and a new log is started, then the tasks as of
+    that switch are written to a binary snapshot (``<path>.snapshot``) while
+    writers carry on. Opening the store loads the snapshot and replays only the
+    log written after it, so startup time does not grow with the number of edits.
+    """
+
+    def __init__(self, path: str, group_commit_size: int = 64, group_commit_interval: float = 0.05,
+                 checkpoint_threshold: int = 1000, checkpoint_ratio: float = 0.5):
+        """Initialize the repository from the latest snapshot and the log at the given path."""
+        super().__init__()
+        self._path = path
+        self._snapshot_path = path + ".snapshot"
+        self._group_commit_size = group_commit_size
+        self._group_commit_interval = group_commit_interval
+        self._checkpoint_threshold = checkpoint_threshold
+        self._checkpoint_ratio = checkpoint_ratio
+        self._lock = threading.RLock()
+        self._pending = 0
+        self._flush_timer: Optional[threading.Timer] = None
+        # Newest snapshot or segment generation; the next checkpoint takes the one after it.
+        self._generation = 0
+        # Log records that opening the store would replay on top of the snapshot.
+        self._tail_records = 0
+        self._checkpoint_lock = threading.Lock()
+        self._checkpoint_thread: Optional[threading.Thread] = None
+        # After a background checkpoint fails, the next one waits until the tail reaches this many records.
+        self._checkpoint_retry_at = 0
+        # Replay creates objects that all stay alive, so collecting garbage meanwhile only costs time.
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            self._replay()
+        finally:
+            if collecting:
+                gc.enable()
+        self._log = open(self._path, "a", encoding="utf-8")
+
+    def add(self, task: Task) -> Task:
+        """Add a new task to the repository and log it."""
+        with self._lock:
+            super().add(task)
+            self._append(self._put_record(task))
+        return task
+
+    def add_many(self, tasks: Iterable[Task]) -> List[Task]:
+        """Add several tasks under one lock acquisition and one group commit."""
+        tasks = list(tasks)
+        with self._lock:
+            for task in tasks:
+                super().add(task)
+            self._append_many([self._put_record(task) for task in tasks])
+        return tasks
+
+    def update(self, task: Task) -> Optional[Task]:
+        """Update an existing task and log the new state."""
+        with self._lock:
+            if super().update(task) is None:
+                return None
+            self._append(self._put_record(task))
+        return task
+
+    def update_many(self, tasks: Iterable[Task]) -> List[Optional[Task]]:
+        """Update several tasks under one lock acquisition and one group commit."""
+        results: List[Optional[Task]] = []
+        records = []
+        with self._lock:
+            for task in tasks:
+                updated = super().update(task)
+                results.append(updated)
+                if updated is not None:
+                    records.append(self._put_record(task))
+            self._append_many(records)
+        return results
+
+    def update_if_version(self, task: Task, expected_version: int) -> Optional[Task]:
+        """Update a task only if it is still at ``expected_version``, checking and logging under one lock."""
+        with self._lock:
+            return super().update_if_version(task, expected_version)
+
+    def delete(self, task_id: str) -> bool:
+        """Delete a task by its ID and log the removal."""
+        with self._lock:
+            if not super().delete(task_id):
+                return False
+            self._append({"op": "del", "id": task_id})
+        return True
+
+    def delete_many(self, task_ids: Iterable[str]) -> List[bool]:
+        """Delete several tasks under one lock acquisition and one group commit."""
+        results = []
+        records = []
+        with self._lock:
+            for task_id in task_ids:
+                deleted = super().delete(task_id)
+                results.append(deleted)
+                if deleted:
+                    records.append({"op": "del", "id": task_id})
+            self._append_many(records)
+        return results
+
+    def flush(self) -> None:
+        """Force all pending log records to stable storage."""
+        with self._lock:
+            self._sync()
+
+    def checkpoint(self) -> None:
+        """Snapshot the store synchronously and drop the log the snapshot replaces."""
+        self._checkpoint()
+
+    def close(self) -> None:
+        """Wait for a background checkpoint, sync pending records and close the log."""
+        self._wait_for_checkpoint()
+        with self._lock:
+            if self._log.closed:
+                return
+            self._sync()
+            self._log.close()
+
+    def _replay(self) -> None:
+        """Rebuild the in-memory state from the snapshot, then the segments and log written after it."""
+        if os.path.exists(self._snapshot_path):
+            self._generation, next_seq, entries = read_snapshot(self._snapshot_path)
+            self._load(entries)
+            self._next_seq = max(self._next_seq, next_seq)
+        snapshot_generation = self._generation
+        for generation, segment in self._segments():
+            if generation <= snapshot_generation:
+                # Left behind by a checkpoint that stopped after writing its snapshot.
+                os.remove(segment)
+                continue
+            # Left behind by a checkpoint that stopped before writing its snapshot.
+            self._replay_log(segment)
+            self._generation = generation
+        if os.path.exists(self._path):
+            self._replay_log(self._path)
+
+    def _replay_log(self, path: str) -> None:
+        """Apply the records of one log file, cutting off a torn final record."""
+        valid_bytes = 0
+        with open(path, "rb") as log:
+            for line in log:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("unterminated record")
+                    record = json.loads(line)
+                except ValueError:
+                    # A torn final record from an interrupted write; everything before it is valid.
+                    break
+                valid_bytes += len(line)
+                self._tail_records += 1
+                if record["op"] == "put":
+                    task = Task.from_dict(record["task"])
+                    task.version = record["version"]
+                    self._store(task, record["seq"])
+                elif record["op"] == "del":
+                    self._remove(record["id"])
+        if valid_bytes < os.path.getsize(path):
+            # Later appends must not be glued onto the torn record.
+            os.truncate(path, valid_bytes)
+
+    def _segments(self) -> List[Tuple[int, str]]:
+        """The numbered log segments left by checkpoints, oldest first."""
+        directory, name = os.path.split(os.path.abspath(self._path))
+        prefix = name + "."
+        segments = []
+        for entry in os.listdir(directory):
+            suffix = entry[len(prefix):]
+            if entry.startswith(prefix) and suffix.isdigit():
+                segments.append((int(suffix), os.path.join(directory, entry)))
+        return sorted(segments)
+
+    def _put_record(self, task: Task) -> dict:
+        """Build the log record storing a task's current state, version and insertion sequence."""
+        return {"op": "put", "seq": self._seqs[task.id], "version": task.version, "task": task.to_dict()}
+
+    def _append(self, record: dict) -> None:
+        """Append a record to the log and schedule a group commit."""
+        self._append_many([record])
+
+    def _append_many(self, records: List[dict]) -> None:
+        """Append records to the log as one write and schedule a group commit."""
+        if not records:
+            return
+        lines = [json.dumps(record, separators=(",", ":")) + "\n" for record in records]
+        self._log.writelines(lines)
+        self._pending += len(lines)
+        self._tail_records += len(lines)
+        if self._pending >= self._group_commit_size:
+            self._sync()
+        elif self._flush_timer is None:
+            self._flush_timer = threading.Timer(self._group_commit_interval, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+        self._maybe_checkpoint()
+
+    def _sync(self) -> None:
+        """Flush and fsync the log; must be called with the lock held."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if self._pending == 0 or self._log.closed:
+            return
+        self._log.flush()
+        os.fsync(self._log.fileno())
+        self._pending = 0
+
+    def _maybe_checkpoint(self) -> None:
+        """Start a background checkpoint once enough records have been logged since the last one."""
+        if self._checkpoint_thread is not None and self._checkpoint_thread.is_alive():
+            return
+        if self._tail_records < max(self._checkpoint_threshold, self._checkpoint_retry_at):
+            return
+        if self._tail_records < self._checkpoint_ratio * len(self._tasks):
+            return
+        self._checkpoint_thread = threading.Thread(target=self._background_checkpoint, daemon=True)
+        self._checkpoint_thread.start()
+
+    def _checkpoint(self) -> None:
+        """Switch to a new log under the lock, then snapshot the tasks as of the switch without it.
+
+        Only shallow copies are taken under the lock. A task written after the
+        switch may already show its new state in the snapshot, but its record
+        is in the new log, so replay restores the same state either way. If the
+        snapshot cannot be written, the segment is kept for replay and its
+        records count towards the next checkpoint again.
+        """
+        with self._checkpoint_lock:
+            with self._lock:
+                self._sync()
+                self._log.close()
+                self._generation += 1
+                generation = self._generation
+                os.replace(self._path, f"{self._path}.{generation}")
+                self._log = open(self._path, "a", encoding="utf-8")
+                replaced_records = self._tail_records
+                self._tail_records = 0
+                tasks = self._tasks.copy()
+                order_seqs = self._order_seqs[:]
+                order_ids = self._order_ids[:]
+                next_seq = self._next_seq
+            try:
+                write_snapshot(self._snapshot_path, generation, next_seq,
+                               ((seq, tasks[task_id]) for seq, task_id in zip(order_seqs, order_ids)
+                                if task_id is not None))
+            except BaseException:
+                with self._lock:
+                    self._tail_records += replaced_records
+                raise
+            self._checkpoint_retry_at = 0
+            for segment_generation, segment in self._segments():
+                if segment_generation <= generation:
+                    os.remove(segment)
+
+    def _background_checkpoint(self) -> None:
+        """Run a checkpoint on the background thread, reporting a failure that would otherwise end with the thread.
+
+        The checkpoint is retried once another ``checkpoint_threshold`` records
+        have been logged, so a persistent failure is not retried on every write.
+        """
+        try:
+            self._checkpoint()
+        except Exception as e:
+            with self._lock:
+                self._checkpoint_retry_at = self._tail_records + self._checkpoint_threshold
+            print(f"Warning: Checkpoint of {self._path} failed, retrying after "
+                  f"{self._checkpoint_threshold} more records: {e}", file=sys.stderr)
+
+    def _wait_for_checkpoint(self) -> None:
+        """Block until any running background checkpoint finishes."""
+        thread = self._checkpoint_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self._checkpoint_thread = None
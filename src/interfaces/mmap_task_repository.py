@@ -0,0 +1,402 @@
+"""
+Memory-mapped fixed-width binary repository for Task entities.
+"""
+from bisect import bisect_left
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+import mmap
+import os
+import struct
+from src.entities.task import Task, TaskStatus, TaskSummary, SUMMARY_LENGTH, summarize_text
+from src.interfaces.task_repository import TaskRepository
+
+
+_MAGIC = b"TDMM"
+_VERSION = 2
+# magic, version, record count
+_HEADER = struct.Struct("<4sHxxQ")
+# Each text keeps its first SUMMARY_LENGTH characters inline (up to 4 UTF-8 bytes each);
+# the full text lives in the overflow heap only when it is longer than that.
+_HEAD_BYTES = SUMMARY_LENGTH * 4
+# id, flags, title head length, title head, title heap offset, title heap length,
+# description head length, description head, description heap offset, description heap length, task version
+_RECORD = struct.Struct(f"<36sBB{_HEAD_BYTES}sQIB{_HEAD_BYTES}sQII")
+# The task version is the last field of a record.
+_TASK_VERSION = struct.Struct("<I")
+_TASK_VERSION_OFFSET = _RECORD.size - _TASK_VERSION.size
+# The same layout with the heap pointers skipped, for listings.
+_SUMMARY = struct.Struct(f"<36sBB{_HEAD_BYTES}s12xB{_HEAD_BYTES}s")
+_ID_BYTES = 36
+# Heap offset and length of a text, and where each text's pair sits in a record.
+_HEAP_POINTER = struct.Struct("<QI")
+_TITLE_POINTER = _ID_BYTES + 2 + _HEAD_BYTES
+_DESCRIPTION_POINTER = _TITLE_POINTER + _HEAP_POINTER.size + 1 + _HEAD_BYTES
+
+# Lone surrogates, such as command-line arguments that were not valid UTF-8, are stored as they are.
+_TEXT_ERRORS = "surrogatepass"
+
+_LIVE = 0x01
+_COMPLETE = 0x02
+_TITLE_OVERFLOW = 0x04
+_HAS_DESCRIPTION = 0x08
+_DESCRIPTION_OVERFLOW = 0x10
+
+
+class MmapTaskRepository(TaskRepository):
+    """Repository that stores tasks as fixed-width records in a memory-mapped file.
+
+    Listing reads ids, status and the leading characters of each text straight
+    from the mapped buffer. Texts longer than SUMMARY_LENGTH characters are
+    appended to a separate overflow heap (``<path>.heap``), which is read only
+    when a full task is requested. Deleted records are tombstoned in place.
+
+    Rewriting a record keeps its heap texts when they are unchanged; replaced
+    and deleted texts are left behind as garbage. Once the garbage reaches
+    ``heap_compact_threshold`` bytes and outweighs the live texts, or when the
+    store is closed with more garbage than live text, the heap is rewritten
+    with only the live texts. Every write reaches the operating system before
+    it returns, so it survives the process exiting, but the files are synced
+    to disk only by close().
+    """
+
+    def __init__(self, path: str, initial_capacity: int = 1024, heap_compact_threshold: int = 1 << 20):
+        """Open (or create) the record file and index live records by ID."""
+        self._path = path
+        self._heap_compact_threshold = heap_compact_threshold
+        exists = os.path.exists(path) and os.path.getsize(path) >= _HEADER.size
+        self._file = open(path, "r+b" if exists else "w+b")
+        self._heap = open(path + ".heap", "a+b")
+        if exists:
+            self._map = mmap.mmap(self._file.fileno(), 0)
+            magic, version, self._count = _HEADER.unpack_from(self._map, 0)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError(f"{path} is not a task record file")
+        else:
+            self._count = 0
+            self._file.truncate(_HEADER.size + initial_capacity * _RECORD.size)
+            self._map = mmap.mmap(self._file.fileno(), 0)
+            self._write_header()
+        self._slots: Dict[str, int] = {}
+        # Live slots per status, and the same slots in ascending order so filtered pages seek by bisection.
+        # New records are appended to the sorted list; any other change drops it until the next page.
+        self._status_slots: Dict[TaskStatus, Set[int]] = {status: set() for status in TaskStatus}
+        self._status_order: Dict[TaskStatus, Optional[List[int]]] = {status: None for status in TaskStatus}
+        self._id_index = None
+        # Bytes of the heap holding the texts of live records, and bytes no record uses any more.
+        self._heap_live = 0
+        for slot in range(self._count):
+            offset = self._offset(slot)
+            flags = self._map[offset + _ID_BYTES]
+            if flags & _LIVE:
+                self._slots[self._decode_id(self._map[offset:offset + _ID_BYTES])] = slot
+                self._status_slots[self._status(flags)].add(slot)
+                if flags & (_TITLE_OVERFLOW | _DESCRIPTION_OVERFLOW):
+                    self._heap_live += sum(length for _, length in self._heap_texts(slot))
+        self._heap_garbage = os.fstat(self._heap.fileno()).st_size - self._heap_live
+
+    def add(self, task: Task) -> Task:
+        """Add a new task, overwriting the record of an existing ID in place.
+
+        The task is encoded before a slot is claimed, so one that cannot be
+        stored leaves the repository unchanged.
+        """
+        fields = self._encode_fields(task)
+        slot = self._slots.get(task.id)
+        if slot is None:
+            slot = self._allocate()
+            self._slots[task.id] = slot
+            if self._id_index is not None:
+                self._id_index.add(task.id)
+            task.version = 1
+        else:
+            task.version = self._stored_version(slot) + 1
+        self._write(slot, task, fields)
+        self._publish_stored(task)
+        return task
+
+    def get_by_id(self, task_id: str) -> Optional[Task]:
+        """Retrieve a task by its ID."""
+        slot = self._slots.get(task_id)
+        return None if slot is None else self._read(slot)
+
+    def get_all(self) -> List[Task]:
+        """Retrieve all tasks in insertion order."""
+        return [self._read(slot) for slot in sorted(self._slots.values())]
+
+    def iter_all(self) -> Iterator[Task]:
+        """Iterate over all tasks in insertion order, decoding one record at a time."""
+        for slot in range(self._count):
+            if self._map[self._offset(slot) + _ID_BYTES] & _LIVE:
+                yield self._read(slot)
+
+    def get_page(self, limit: int, after: Optional[int] = None,
+                 status: Optional[TaskStatus] = None) -> Tuple[List[Task], Optional[int]]:
+        """Return up to ``limit`` tasks after the given key, scanning records from that slot.
+
+        Slots are never reused, so a record's key is simply its slot number plus
+        one. With a status, the page is read from that status's slots instead.
+        """
+        if status is not None:
+            slots = self._sorted_slots(status)
+            start = bisect_left(slots, after or 0)
+            chosen = slots[start:start + limit + 1]
+            return [self._read(slot) for slot in chosen[:limit]], chosen[limit - 1] + 1 if len(chosen) > limit else None
+        page: List[Task] = []
+        for slot in range(after or 0, self._count):
+            if not self._map[self._offset(slot) + _ID_BYTES] & _LIVE:
+                continue
+            if len(page) == limit:
+                return page, self._slots[page[-1].id] + 1
+            page.append(self._read(slot))
+        return page, None
+
+    def get_by_status(self, status: TaskStatus) -> List[Task]:
+        """Retrieve all tasks with the given status from the in-memory status index."""
+        return [self._read(slot) for slot in self._sorted_slots(status)]
+
+    def iter_summaries(self, status: Optional[TaskStatus] = None) -> Iterator[TaskSummary]:
+        """Iterate over listing summaries read directly from the mapped records."""
+        buffer = self._map
+        slots: Iterable[int] = range(self._count) if status is None else list(self._sorted_slots(status))
+        for slot in slots:
+            task_id, flags, title_len, title_head, desc_len, desc_head = _SUMMARY.unpack_from(
+                buffer, self._offset(slot))
+            if not flags & _LIVE:
+                continue
+            yield TaskSummary(
+                self._decode_id(task_id),
+                self._status(flags),
+                summarize_text(title_head[:title_len].decode("utf-8", _TEXT_ERRORS), bool(flags & _TITLE_OVERFLOW)),
+                summarize_text(desc_head[:desc_len].decode("utf-8", _TEXT_ERRORS), bool(flags & _DESCRIPTION_OVERFLOW))
+            )
+
+    def update(self, task: Task) -> Optional[Task]:
+        """Update an existing task in place."""
+        slot = self._slots.get(task.id)
+        if slot is None:
+            return None
+        fields = self._encode_fields(task)
+        task.version = self._stored_version(slot) + 1
+        self._write(slot, task, fields)
+        self._publish_stored(task)
+        return task
+
+    def delete(self, task_id: str) -> bool:
+        """Delete a task by tombstoning its record."""
+        slot = self._slots.pop(task_id, None)
+        if slot is None:
+            return False
+        for status, slots in self._status_slots.items():
+            if slot in slots:
+                slots.discard(slot)
+                self._status_order[status] = None
+        if self._id_index is not None:
+            self._id_index.remove(task_id)
+        for text in self._heap_texts(slot):
+            self._discard_heap_text(text)
+        self._map[self._offset(slot) + _ID_BYTES] &= ~_LIVE & 0xFF
+        self._publish_deleted(task_id)
+        return True
+
+    def close(self) -> None:
+        """Compact the heap if it is mostly garbage, sync the mapped records and close both files."""
+        if self._map.closed:
+            return
+        if self._heap_garbage and self._heap_garbage >= self._heap_live:
+            self._compact_heap()
+        self._map.flush()
+        self._map.close()
+        self._file.close()
+        self._heap.close()
+
+    def _all_ids(self) -> Iterable[str]:
+        """All live task IDs, used to build the sorted ID index."""
+        return self._slots.keys()
+
+    def _offset(self, slot: int) -> int:
+        """Byte offset of a record slot."""
+        return _HEADER.size + slot * _RECORD.size
+
+    def _write_header(self) -> None:
+        """Store the current record count in the header."""
+        _HEADER.pack_into(self._map, 0, _MAGIC, _VERSION, self._count)
+
+    def _allocate(self) -> int:
+        """Reserve the next record slot, doubling the file when it is full."""
+        if self._offset(self._count + 1) > len(self._map):
+            size = self._offset(max(self._count * 2, 1))
+            self._map.close()
+            self._file.truncate(size)
+            self._map = mmap.mmap(self._file.fileno(), 0)
+        slot = self._count
+        self._count += 1
+        self._write_header()
+        return slot
+
+    def _encode_fields(self, task: Task) -> Tuple[bytes, bytes, bytes]:
+        """Encode a task's ID, title and description, raising ValueError before anything is written."""
+        return (self._encode_id(task.id), task.title.encode("utf-8", _TEXT_ERRORS),
+                (task.description or "").encode("utf-8", _TEXT_ERRORS))
+
+    def _write(self, slot: int, task: Task, fields: Tuple[bytes, bytes, bytes]) -> None:
+        """Store an encoded task in its record, spilling long texts to the heap unless they are already there."""
+        task_id, title, description = fields
+        previous = _RECORD.unpack_from(self._map, self._offset(slot))
+        previous_flags = previous[1]
+        flags = _LIVE
+        if task.status == TaskStatus.COMPLETE:
+            flags |= _COMPLETE
+        for status, slots in self._status_slots.items():
+            if status == task.status:
+                if slot not in slots:
+                    slots.add(slot)
+                    order = self._status_order[status]
+                    if order is not None:
+                        if not order or order[-1] < slot:
+                            order.append(slot)
+                        else:
+                            self._status_order[status] = None
+            elif slot in slots:
+                slots.discard(slot)
+                self._status_order[status] = None
+        title_head, title_offset, title_length = self._encode_text(
+            task.title, title, previous[4:6] if previous_flags & _TITLE_OVERFLOW else None)
+        if title_length:
+            flags |= _TITLE_OVERFLOW
+        description_head, description_offset, description_length = self._encode_text(
+            task.description or "", description, previous[8:10] if previous_flags & _DESCRIPTION_OVERFLOW else None)
+        if task.description is not None:
+            flags |= _HAS_DESCRIPTION
+        if description_length:
+            flags |= _DESCRIPTION_OVERFLOW
+        # The record may only point at heap bytes that have left the file buffer.
+        self._heap.flush()
+        _RECORD.pack_into(
+            self._map, self._offset(slot), task_id, flags,
+            len(title_head), title_head, title_offset, title_length,
+            len(description_head), description_head, description_offset, description_length,
+            task.version
+        )
+        if self._heap_garbage >= self._heap_compact_threshold and self._heap_garbage >= self._heap_live:
+            self._compact_heap()
+
+    def _stored_version(self, slot: int) -> int:
+        """Read the task version of a record without decoding the rest of it."""
+        return _TASK_VERSION.unpack_from(self._map, self._offset(slot) + _TASK_VERSION_OFFSET)[0]
+
+    def _encode_text(self, text: str, data: bytes, previous: Optional[Tuple[int, int]]) -> Tuple[bytes, int, int]:
+        """Return the inline head of a text, encoded as ``data``, plus its heap location (0, 0 if it fits inline).
+
+        ``previous`` is the heap location of the text being replaced, if any,
+        which is reused when it holds the same bytes.
+        """
+        head = text[:SUMMARY_LENGTH].encode("utf-8", _TEXT_ERRORS)
+        if len(text) <= SUMMARY_LENGTH:
+            if previous is not None:
+                self._discard_heap_text(previous)
+            return head, 0, 0
+        if previous is not None:
+            offset, length = previous
+            if length == len(data) and os.pread(self._heap.fileno(), length, offset) == data:
+                return head, offset, length
+            self._discard_heap_text(previous)
+        self._heap.seek(0, os.SEEK_END)
+        offset = self._heap.tell()
+        self._heap.write(data)
+        self._heap_live += len(data)
+        return head, offset, len(data)
+
+    def _heap_texts(self, slot: int) -> List[Tuple[int, int]]:
+        """Heap offsets and lengths of the texts a record keeps in the heap."""
+        (_, flags, _, _, title_offset, title_length,
+         _, _, desc_offset, desc_length, _) = _RECORD.unpack_from(self._map, self._offset(slot))
+        texts = []
+        if flags & _TITLE_OVERFLOW:
+            texts.append((title_offset, title_length))
+        if flags & _DESCRIPTION_OVERFLOW:
+            texts.append((desc_offset, desc_length))
+        return texts
+
+    def _discard_heap_text(self, text: Tuple[int, int]) -> None:
+        """Count a heap text that no record uses any more as garbage."""
+        self._heap_live -= text[1]
+        self._heap_garbage += text[1]
+
+    def _compact_heap(self) -> None:
+        """Copy the live texts to a new heap, swap it in and point the records at the new offsets.
+
+        The new heap is synced before it replaces the old one, and the records
+        are synced right after, so only a crash between those two steps can
+        leave records pointing at the wrong heap bytes.
+        """
+        heap_fd = self._heap.fileno()
+        moved: List[Tuple[int, int, int]] = []
+        temp_path = self._path + ".heap.compact"
+        with open(temp_path, "wb") as compacted:
+            for slot in sorted(self._slots.values()):
+                record = self._offset(slot)
+                flags = self._map[record + _ID_BYTES]
+                for overflow, pointer in ((_TITLE_OVERFLOW, _TITLE_POINTER),
+                                          (_DESCRIPTION_OVERFLOW, _DESCRIPTION_POINTER)):
+                    if flags & overflow:
+                        offset, length = _HEAP_POINTER.unpack_from(self._map, record + pointer)
+                        moved.append((record + pointer, compacted.tell(), length))
+                        compacted.write(os.pread(heap_fd, length, offset))
+            compacted.flush()
+            os.fsync(compacted.fileno())
+        self._heap.close()
+        os.replace(temp_path, self._path + ".heap")
+        self._heap = open(self._path + ".heap", "a+b")
+        for position, offset, length in moved:
+            _HEAP_POINTER.pack_into(self._map, position, offset, length)
+        self._map.flush()
+        self._heap_garbage = 0
+
+    def _read(self, slot: int) -> Task:
+        """Decode a full task from its record, loading long texts from the heap."""
+        (task_id, flags, title_len, title_head, title_offset, title_length,
+         desc_len, desc_head, desc_offset, desc_length, version) = _RECORD.unpack_from(self._map, self._offset(slot))
+        if flags & _TITLE_OVERFLOW:
+            title = self._read_heap(title_offset, title_length)
+        else:
+            title = title_head[:title_len].decode("utf-8", _TEXT_ERRORS)
+        description = None
+        if flags & _DESCRIPTION_OVERFLOW:
+            description = self._read_heap(desc_offset, desc_length)
+        elif flags & _HAS_DESCRIPTION:
+            description = desc_head[:desc_len].decode("utf-8", _TEXT_ERRORS)
+        return Task(
+            id=self._decode_id(task_id),
+            title=title,
+            description=description,
+            status=self._status(flags),
+            version=version
+        )
+
+    def _read_heap(self, offset: int, length: int) -> str:
+        """Read a long text from the overflow heap."""
+        return os.pread(self._heap.fileno(), length, offset).decode("utf-8", _TEXT_ERRORS)
+
+    def _sorted_slots(self, status: TaskStatus) -> List[int]:
+        """The live slots of a status in ascending order, sorted again only after they changed."""
+        order = self._status_order[status]
+        if order is None:
+            order = self._status_order[status] = sorted(self._status_slots[status])
+        return order
+
+    @staticmethod
+    def _status(flags: int) -> TaskStatus:
+        """Decode the status bit of a record's flags."""
+        return TaskStatus.COMPLETE if flags & _COMPLETE else TaskStatus.INCOMPLETE
+
+    @staticmethod
+    def _encode_id(task_id: str) -> bytes:
+        """Encode an ID for its fixed-width field, rejecting IDs that do not fit."""
+        raw = task_id.encode("ascii")
+        if len(raw) > _ID_BYTES:
+            raise ValueError(f"Task ID cannot be longer than {_ID_BYTES} characters")
+        return raw
+
+    @staticmethod
+    def _decode_id(raw: bytes) -> str:
+        """Strip the NUL padding from a stored ID."""
+        return raw.rstrip(b"\0").decode("ascii")
@@ -0,0 +1,68 @@
+"""
+Run one CLI command under cProfile and tracemalloc and report where its time and memory went.
+"""
+from typing import IO, Callable, Optional, TypeVar
+import cProfile
+import pstats
+import sys
+import tracemalloc
+
+
+# Entries shown in each report unless asked for another number.
+DEFAULT_TOP = 20
+
+# Frames of the measuring machinery itself, left out of allocation reports.
+_ALLOCATION_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+)
+
+T = TypeVar("T")
+
+
+def profile_call(function: Callable[[], T], output_path: Optional[str] = None, trace_alloc: bool = False,
+                 top: int = DEFAULT_TOP, report: Optional[IO[str]] = None) -> T:
+    """Call ``function`` and report on it to ``report`` (stderr by default), even if it raises.
+
+    With ``output_path``, the call runs under cProfile; the stats are saved
+    there for ``python -m pstats`` or snakeviz, and the ``top`` functions by
+    cumulative time are printed; if the stats cannot be saved, that is
+    reported instead. With ``trace_alloc``, the ``top`` source
+    lines by memory still allocated when the call returns are printed, with
+    the peak traced size. Tracing allocations slows the call down, which
+    inflates the timings when both are on.
+    """
+    report = sys.stderr if report is None else report
+    profiler = cProfile.Profile() if output_path else None
+    if trace_alloc:
+        tracemalloc.start()
+    try:
+        return function() if profiler is None else profiler.runcall(function)
+    finally:
+        if trace_alloc:
+            snapshot = tracemalloc.take_snapshot().filter_traces(_ALLOCATION_FILTERS)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        if profiler is not None:
+            try:
+                profiler.dump_stats(output_path)
+                saved = f"Profile written to {output_path}"
+            except OSError as e:
+                # Raising here would replace the call's own result or exception.
+                saved = f"Could not write the profile to {output_path} ({e})"
+            print(f"{saved}; top {top} functions by cumulative time:", file=report)
+            pstats.Stats(profiler, stream=report).strip_dirs().sort_stats("cumulative").print_stats(top)
+        if trace_alloc:
+            _report_allocations(snapshot, peak, top, report)
+        report.flush()
+
+
+def _report_allocations(snapshot: tracemalloc.Snapshot, peak: int, top: int, report: IO[str]) -> None:
+    """Print the source lines holding the most traced memory."""
+    statistics = snapshot.statistics("lineno")
+    print(f"Peak traced memory: {peak / 1024:,.1f} KiB; top {top} allocation sites still held:", file=report)
+    print(f"{'KiB':>10} {'Blocks':>8}  Location", file=report)
+    for stat in statistics[:top]:
+        frame = stat.traceback[0]
+        print(f"{stat.size / 1024:>10,.1f} {stat.count:>8}  {frame.filename}:{frame.lineno}", file=report)
@@ -0,0 +1,50 @@
+"""
+Factory for selecting a TaskRepository implementation by name.
+"""
+from typing import Optional
+from src.interfaces.task_repository import TaskRepository
+
+
+BACKENDS = ("memory", "concurrent", "columnar", "log", "sqlite", "mmap")
+
+DEFAULT_PATHS = {
+    "log": "todo.log",
+    "sqlite": "todo.db",
+    "mmap": "todo.mmap",
+}
+
+
+def create_repository(backend: str = "memory", path: Optional[str] = None,
+                      cache_entries: int = 0, cache_bytes: Optional[int] = None) -> TaskRepository:
+    """Create the repository for the given backend, importing it only when selected.
+
+    With ``cache_entries`` or ``cache_bytes`` set, the repository is wrapped in
+    an LRU read cache bounded by those limits.
+    """
+    repository = _create_backend(backend, path)
+    if cache_entries or cache_bytes:
+        from src.interfaces.caching_task_repository import CachingTaskRepository
+        return CachingTaskRepository(repository, cache_entries or None, cache_bytes)
+    return repository
+
+
+def _create_backend(backend: str, path: Optional[str]) -> TaskRepository:
+    """Create the bare repository for the given backend."""
+    if backend == "memory":
+        return TaskRepository()
+    if backend == "concurrent":
+        from src.interfaces.concurrent_task_repository import ConcurrentTaskRepository
+        return ConcurrentTaskRepository()
+    if backend == "columnar":
+        from src.interfaces.columnar_task_repository import ColumnarTaskRepository
+        return ColumnarTaskRepository()
+    if backend == "log":
+        from src.interfaces.log_task_repository import LogTaskRepository
+        return LogTaskRepository(path or DEFAULT_PATHS["log"])
+    if backend == "sqlite":
+        from src.interfaces.sqlite_task_repository import SqliteTaskRepository
+        return SqliteTaskRepository(path or DEFAULT_PATHS["sqlite"])
+    if backend == "mmap":
+        from src.interfaces.mmap_task_repository import MmapTaskRepository
+        return MmapTaskRepository(path or DEFAULT_PATHS["mmap"])
+    raise ValueError(f"Unknown storage backend: {backend} (expected one of: {', '.join(BACKENDS)})")
@@ -0,0 +1,153 @@
+"""
+Interactive shell that runs CLI commands against one long-lived task service.
+"""
+from typing import IO, List, Optional
+import os
+import shlex
+import sys
+
+try:
+    import readline
+except ImportError:  # Not available on every platform; the shell then runs without history or completion.
+    readline = None
+
+
+PROMPT = "todo> "
+EXIT_COMMANDS = ("exit", "quit")
+
+# Commands whose positional arguments are task IDs, mapped to how many leading
+# positionals are IDs (None meaning all of them).
+_ID_ARGUMENTS = {"update": 1, "delete": None, "complete": None, "incomplete": None}
+
+# Upper bound on ID candidates offered for one completion.
+_MAX_ID_COMPLETIONS = 100
+
+
+class TaskShell:
+    """Read-eval loop that parses each line with the CLI parser and dispatches it.
+
+    The repository, indexes and argument parser are built once for the whole
+    session, so each command costs only its own work. Lines are split with
+    shell quoting rules; ``exit``, ``quit`` or end of input leave the shell.
+    """
+
+    def __init__(self, cli_controller, stdin: Optional[IO[str]] = None, history_path: Optional[str] = None):
+        """Initialize the shell around an existing CLI controller."""
+        self.cli_controller = cli_controller
+        self.stdin = sys.stdin if stdin is None else stdin
+        self.history_path = history_path
+        self.interactive = self.stdin is sys.stdin and self.stdin.isatty()
+
+    def run(self) -> int:
+        """Run commands until end of input; return the exit code of the last command."""
+        exit_code = 0
+        if self.interactive:
+            self._start_readline()
+        try:
+            while True:
+                line = self._read_line()
+                if line is None or line.strip() in EXIT_COMMANDS:
+                    break
+                result = self.execute(line)
+                if result is not None:
+                    exit_code = result
+        finally:
+            if self.interactive:
+                self._save_history()
+        return exit_code
+
+    def execute(self, line: str) -> Optional[int]:
+        """Run one command line; return its exit code, or None for a blank line.
+
+        Errors the command does not handle itself are printed, and the shell carries on.
+        """
+        try:
+            args = shlex.split(line)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return 1
+        if not args:
+            return None
+        if args[0] == "shell":
+            print("Error: Already in the shell")
+            return 1
+        try:
+            exit_code = self.cli_controller.handle_command(args)
+        except SystemExit as e:
+            # argparse exits after printing usage errors and --help.
+            exit_code = e.code if isinstance(e.code, int) else 1
+        except Exception as e:
+            # A failing command, such as an export to an unwritable file, must not end the session.
+            print(f"Error: {e}")
+            exit_code = 1
+        sys.stdout.flush()
+        return exit_code
+
+    def completions(self, line: str, text: str) -> List[str]:
+        """Candidates for the word ``text`` at the end of ``line``."""
+        try:
+            words = shlex.split(line)
+        except ValueError:
+            return []
+        if text:
+            words = words[:-1]
+        if not words:
+            return [name for name in self.cli_controller.commands if name.startswith(text)] + \
+                [name for name in EXIT_COMMANDS if name.startswith(text)]
+        command = words[0]
+        if text.startswith("-"):
+            subparser = self.cli_controller.commands.get(command)
+            options = [] if subparser is None else subparser._option_string_actions
+            return sorted(option for option in options if option.startswith(text))
+        if command not in _ID_ARGUMENTS:
+            return []
+        position = len([word for word in words[1:] if not word.startswith("-")])
+        id_count = _ID_ARGUMENTS[command]
+        if id_count is not None and position >= id_count:
+            return []
+        return self.cli_controller.task_service.complete_ids(text, _MAX_ID_COMPLETIONS)
+
+    def _complete(self, text: str, state: int) -> Optional[str]:
+        """readline completer: return the ``state``-th candidate for ``text``."""
+        if state == 0:
+            line = readline.get_line_buffer()[:readline.get_endidx()]
+            self._matches = self.completions(line, text)
+        return self._matches[state] if state < len(self._matches) else None
+
+    def _read_line(self) -> Optional[str]:
+        """Read the next command line, or None at end of input."""
+        if not self.interactive:
+            line = self.stdin.readline()
+            return line if line else None
+        while True:
+            try:
+                return input(PROMPT)
+            except EOFError:
+                print()
+                return None
+            except KeyboardInterrupt:
+                # Ctrl-C abandons the current line, like a regular shell.
+                print()
+
+    def _start_readline(self) -> None:
+        """Load history and install tab completion, when readline is available."""
+        if readline is None:
+            return
+        self._matches: List[str] = []
+        readline.set_completer(self._complete)
+        readline.set_completer_delims(" \t\n\"'")
+        readline.parse_and_bind("tab: complete")
+        if self.history_path and os.path.exists(self.history_path):
+            try:
+                readline.read_history_file(self.history_path)
+            except OSError:
+                pass
+
+    def _save_history(self) -> None:
+        """Write the session history back to the history file."""
+        if readline is None or not self.history_path:
+            return
+        try:
+            readline.write_history_file(self.history_path)
+        except OSError:
+            pass
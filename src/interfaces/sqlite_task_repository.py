@@ -0,0 +1,316 @@
+"""
+SQLite-backed repository for Task entities.
+"""
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import queue
+import sqlite3
+import threading
+from src.entities.task import Task, TaskStatus, TaskSummary, SUMMARY_LENGTH, summarize_text
+from src.interfaces.task_repository import TaskRepository, VersionConflictError
+
+
+# Statements are kept as constants so each pooled connection compiles them once
+# and reuses the prepared statement from its cache on every later call.
+# AUTOINCREMENT keeps SQLite from handing a deleted task's seq to a new one,
+# which would make a page cursor taken before the delete skip or repeat tasks.
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS tasks ("
+    " seq INTEGER PRIMARY KEY AUTOINCREMENT,"
+    " id TEXT NOT NULL UNIQUE,"
+    " title TEXT NOT NULL,"
+    " description TEXT,"
+    " status TEXT NOT NULL,"
+    " version INTEGER NOT NULL DEFAULT 1)"
+)
+_STATUS_INDEX = "CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, seq)"
+_SELECT_SCHEMA = "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'tasks'"
+# Databases created before seq was AUTOINCREMENT are copied into a new table once, keeping every seq.
+_MIGRATE_SEQ = (
+    "ALTER TABLE tasks RENAME TO tasks_old",
+    _SCHEMA,
+    "INSERT INTO tasks (seq, id, title, description, status, version) "
+    "SELECT seq, id, title, description, status, version FROM tasks_old",
+    "DROP TABLE tasks_old",
+)
+_UPSERT = (
+    "INSERT INTO tasks (id, title, description, status) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT(id) DO UPDATE SET title = excluded.title, "
+    "description = excluded.description, status = excluded.status, version = tasks.version + 1"
+)
+_UPSERT_RETURNING = _UPSERT + " RETURNING version"
+_TASK_COLUMNS = "id, title, description, status, version"
+_SELECT_ONE = f"SELECT {_TASK_COLUMNS} FROM tasks WHERE id = ?"
+_SELECT_VERSION = "SELECT version FROM tasks WHERE id = ?"
+# SQLite caps bound parameters per statement, so IN lists are sent in chunks of this size.
+_CHUNK_SIZE = 500
+_SELECT_ALL = f"SELECT {_TASK_COLUMNS} FROM tasks ORDER BY seq"
+_SELECT_PAGE = f"SELECT seq, {_TASK_COLUMNS} FROM tasks WHERE seq > ? ORDER BY seq LIMIT ?"
+_SELECT_PAGE_BY_STATUS = (
+    f"SELECT seq, {_TASK_COLUMNS} FROM tasks WHERE status = ? AND seq > ? ORDER BY seq LIMIT ?"
+)
+_SELECT_BY_STATUS = f"SELECT {_TASK_COLUMNS} FROM tasks WHERE status = ? ORDER BY seq"
+# Only one character past the summary width is needed to know whether text was cut.
+_SUMMARY_COLUMNS = (
+    f"id, status, substr(title, 1, {SUMMARY_LENGTH + 1}), substr(description, 1, {SUMMARY_LENGTH + 1})"
+)
+_SELECT_SUMMARIES = f"SELECT {_SUMMARY_COLUMNS} FROM tasks ORDER BY seq"
+_SELECT_SUMMARIES_BY_STATUS = f"SELECT {_SUMMARY_COLUMNS} FROM tasks WHERE status = ? ORDER BY seq"
+_SELECT_IDS_FROM = "SELECT id FROM tasks WHERE id >= ? ORDER BY id LIMIT ?"
+_SELECT_SORTED_IDS = "SELECT id FROM tasks ORDER BY id"
+_UPDATE = "UPDATE tasks SET title = ?, description = ?, status = ?, version = version + 1 WHERE id = ?"
+_UPDATE_RETURNING = _UPDATE + " RETURNING version"
+# Compare-and-set: the WHERE clause makes the version check and the write one atomic statement.
+_UPDATE_IF_VERSION = (
+    "UPDATE tasks SET title = ?, description = ?, status = ?, version = version + 1 "
+    "WHERE id = ? AND version = ? RETURNING version"
+)
+_DELETE = "DELETE FROM tasks WHERE id = ?"
+
+
+class SqliteTaskRepository(TaskRepository):
+    """Repository that stores tasks in a local SQLite database in WAL mode."""
+
+    def __init__(self, path: str, pool_size: int = 4):
+        """Initialize the repository, creating the schema if needed."""
+        self._path = path
+        self._pool_size = pool_size
+        self._pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._connections: List[sqlite3.Connection] = []
+        self._pool_lock = threading.Lock()
+        with self._connection() as conn:
+            row = conn.execute(_SELECT_SCHEMA).fetchone()
+            if row is not None and "AUTOINCREMENT" not in row[0].upper():
+                conn.execute("BEGIN")
+                for statement in _MIGRATE_SEQ:
+                    conn.execute(statement)
+            else:
+                conn.execute(_SCHEMA)
+            conn.execute(_STATUS_INDEX)
+
+    def add(self, task: Task) -> Task:
+        """Add a new task to the repository."""
+        with self._connection() as conn:
+            (task.version,) = conn.execute(_UPSERT_RETURNING, self._to_row(task)).fetchone()
+        self._publish_stored(task)
+        return task
+
+    def add_many(self, tasks: Iterable[Task]) -> List[Task]:
+        """Add several tasks in a single transaction.
+
+        The batch is written with one executemany, which cannot return the new
+        versions, so they are read back in the same transaction. An ID that
+        already existed is stored at its next version and published as updated.
+        """
+        tasks = list(tasks)
+        with self._connection() as conn:
+            conn.executemany(_UPSERT, [self._to_row(task) for task in tasks])
+            versions = self._select_versions(conn, [task.id for task in tasks])
+        for task in tasks:
+            task.version = versions[task.id]
+        self._publish_stored_many(tasks)
+        return tasks
+
+    def get_by_id(self, task_id: str) -> Optional[Task]:
+        """Retrieve a task by its ID."""
+        with self._connection() as conn:
+            row = conn.execute(_SELECT_ONE, (task_id,)).fetchone()
+        return self._from_row(row) if row else None
+
+    def get_many(self, task_ids: Iterable[str]) -> Dict[str, Task]:
+        """Retrieve the tasks that exist among the given IDs, keyed by ID."""
+        with self._connection() as conn:
+            return {task.id: task for task in self._select_many(conn, list(task_ids))}
+
+    def get_all(self) -> List[Task]:
+        """Retrieve all tasks in insertion order."""
+        with self._connection() as conn:
+            rows = conn.execute(_SELECT_ALL).fetchall()
+        return [self._from_row(row) for row in rows]
+
+    def iter_all(self) -> Iterator[Task]:
+        """Iterate over all tasks in insertion order, fetching rows in chunks."""
+        with self._connection() as conn:
+            cursor = conn.execute(_SELECT_ALL)
+            while True:
+                rows = cursor.fetchmany(_CHUNK_SIZE)
+                if not rows:
+                    break
+                for row in rows:
+                    yield self._from_row(row)
+
+    def get_page(self, limit: int, after: Optional[int] = None,
+                 status: Optional[TaskStatus] = None) -> Tuple[List[Task], Optional[int]]:
+        """Return up to ``limit`` tasks after the given sequence key with one index range scan."""
+        after = 0 if after is None else after
+        with self._connection() as conn:
+            if status is None:
+                rows = conn.execute(_SELECT_PAGE, (after, limit + 1)).fetchall()
+            else:
+                rows = conn.execute(_SELECT_PAGE_BY_STATUS, (status.value, after, limit + 1)).fetchall()
+        page = [self._from_row(row[1:]) for row in rows[:limit]]
+        return page, (rows[limit - 1][0] if len(rows) > limit else None)
+
+    def get_by_status(self, status: TaskStatus) -> List[Task]:
+        """Retrieve all tasks with the given status using the status index."""
+        with self._connection() as conn:
+            rows = conn.execute(_SELECT_BY_STATUS, (status.value,)).fetchall()
+        return [self._from_row(row) for row in rows]
+
+    def iter_summaries(self, status: Optional[TaskStatus] = None) -> Iterator[TaskSummary]:
+        """Iterate over listing summaries, reading only the leading characters of each text."""
+        with self._connection() as conn:
+            if status is None:
+                cursor = conn.execute(_SELECT_SUMMARIES)
+            else:
+                cursor = conn.execute(_SELECT_SUMMARIES_BY_STATUS, (status.value,))
+            while True:
+                rows = cursor.fetchmany(1000)
+                if not rows:
+                    break
+                for task_id, status, title, description in rows:
+                    yield TaskSummary(task_id, TaskStatus(status), summarize_text(title), summarize_text(description))
+
+    def ids_with_prefix(self, prefix: str, limit: int = 2) -> List[str]:
+        """Return up to ``limit`` task IDs starting with the prefix via the unique ID index."""
+        with self._connection() as conn:
+            rows = conn.execute(_SELECT_IDS_FROM, (prefix, limit)).fetchall()
+        return [task_id for (task_id,) in rows if task_id.startswith(prefix)]
+
+    def iter_sorted_ids(self) -> Iterator[str]:
+        """Iterate over all task IDs in sorted order."""
+        with self._connection() as conn:
+            rows = conn.execute(_SELECT_SORTED_IDS).fetchall()
+        return (task_id for (task_id,) in rows)
+
+    def update(self, task: Task) -> Optional[Task]:
+        """Update an existing task."""
+        with self._connection() as conn:
+            row = conn.execute(_UPDATE_RETURNING, (
+                task.title, task.description, task.status.value, task.id
+            )).fetchone()
+        if row is None:
+            return None
+        (task.version,) = row
+        self._publish_stored(task)
+        return task
+
+    def update_many(self, tasks: Iterable[Task]) -> List[Optional[Task]]:
+        """Update several existing tasks in a single transaction."""
+        tasks = list(tasks)
+        with self._connection() as conn:
+            existing = {task.id: task.version for task in self._select_many(conn, [task.id for task in tasks])}
+            conn.executemany(_UPDATE, [
+                (task.title, task.description, task.status.value, task.id)
+                for task in tasks if task.id in existing
+            ])
+        for task in tasks:
+            if task.id in existing:
+                existing[task.id] += 1
+                task.version = existing[task.id]
+        self._publish_stored_many(task for task in tasks if task.id in existing)
+        return [task if task.id in existing else None for task in tasks]
+
+    def update_if_version(self, task: Task, expected_version: int) -> Optional[Task]:
+        """Update a task only if its stored version is still ``expected_version``, in one statement.
+
+        The check holds across processes sharing the database file.
+        """
+        with self._connection() as conn:
+            row = conn.execute(_UPDATE_IF_VERSION, (
+                task.title, task.description, task.status.value, task.id, expected_version
+            )).fetchone()
+            if row is None:
+                current = conn.execute(_SELECT_VERSION, (task.id,)).fetchone()
+        if row is None:
+            if current is None:
+                return None
+            raise VersionConflictError(task.id, expected_version, current[0])
+        (task.version,) = row
+        self._publish_stored(task)
+        return task
+
+    def delete(self, task_id: str) -> bool:
+        """Delete a task by its ID."""
+        with self._connection() as conn:
+            cursor = conn.execute(_DELETE, (task_id,))
+        if cursor.rowcount == 0:
+            return False
+        self._publish_deleted(task_id)
+        return True
+
+    def delete_many(self, task_ids: Iterable[str]) -> List[bool]:
+        """Delete several tasks in a single transaction."""
+        task_ids = list(task_ids)
+        with self._connection() as conn:
+            existing = {task.id for task in self._select_many(conn, task_ids)}
+            conn.executemany(_DELETE, [(task_id,) for task_id in existing])
+        self._publish_deleted_many(task_id for task_id in dict.fromkeys(task_ids) if task_id in existing)
+        return [task_id in existing for task_id in task_ids]
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        with self._pool_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+            self._pool = queue.LifoQueue()
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a pooled connection and commit (or roll back) on return."""
+        conn = self._acquire()
+        try:
+            with conn:
+                yield conn
+        finally:
+            self._pool.put(conn)
+
+    def _acquire(self) -> sqlite3.Connection:
+        """Take an idle connection, opening a new one while the pool has room."""
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+        with self._pool_lock:
+            if len(self._connections) < self._pool_size:
+                conn = sqlite3.connect(self._path, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                self._connections.append(conn)
+                return conn
+        return self._pool.get()
+
+    def _select_many(self, conn: sqlite3.Connection, task_ids: List[str]) -> List[Task]:
+        """Select the tasks with the given IDs, chunking the IN list."""
+        tasks = []
+        for start in range(0, len(task_ids), _CHUNK_SIZE):
+            chunk = task_ids[start:start + _CHUNK_SIZE]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT {_TASK_COLUMNS} FROM tasks WHERE id IN ({placeholders})", chunk
+            ).fetchall()
+            tasks.extend(self._from_row(row) for row in rows)
+        return tasks
+
+    @staticmethod
+    def _select_versions(conn: sqlite3.Connection, task_ids: List[str]) -> Dict[str, int]:
+        """Select the stored versions of the given IDs, chunking the IN list."""
+        versions = {}
+        for start in range(0, len(task_ids), _CHUNK_SIZE):
+            chunk = task_ids[start:start + _CHUNK_SIZE]
+            placeholders = ", ".join("?" * len(chunk))
+            versions.update(conn.execute(
+                f"SELECT id, version FROM tasks WHERE id IN ({placeholders})", chunk
+            ).fetchall())
+        return versions
+
+    @staticmethod
+    def _to_row(task: Task) -> tuple:
+        """Convert a task to a row for the upsert statement."""
+        return (task.id, task.title, task.description, task.status.value)
+
+    @staticmethod
+    def _from_row(row: tuple) -> Task:
+        """Convert a selected row back into a task."""
+        return Task(id=row[0], title=row[1], description=row[2], status=TaskStatus(row[3]), version=row[4])
@@ -0,0 +1,64 @@
+"""
+Streaming writers for exporting tasks as NDJSON, CSV or JSON.
+"""
+from typing import Callable, Dict, IO, Iterable
+import csv
+import io
+import json
+from src.entities.task import Task
+from src.interfaces.task_render import CHUNK_SIZE, write_chunked
+
+
+FIELDS = ("id", "title", "description", "status")
+
+_dumps = json.dumps
+
+
+def _json_object(task: Task) -> str:
+    """Serialize a task, with its version, as a JSON object without building an intermediate dict."""
+    return (
+        f'{{"id":{_dumps(task.id)},"title":{_dumps(task.title)},'
+        f'"description":{_dumps(task.description)},"status":"{task.status.value}","version":{task.version}}}'
+    )
+
+
+def write_ndjson(tasks: Iterable[Task], out: IO[str]) -> int:
+    """Write one JSON object per line; return the number of tasks written."""
+    return write_chunked((_json_object(task) + "\n" for task in tasks), out)
+
+
+def write_json(tasks: Iterable[Task], out: IO[str]) -> int:
+    """Write a single JSON array, streaming its elements; return the number of tasks written."""
+    def pieces():
+        separator = "[\n"
+        for task in tasks:
+            yield separator + _json_object(task)
+            separator = ",\n"
+        yield "\n]\n" if separator == ",\n" else "[]\n"
+
+    # The closing bracket is one extra piece.
+    return write_chunked(pieces(), out) - 1
+
+
+def write_csv(tasks: Iterable[Task], out: IO[str]) -> int:
+    """Write a CSV file with a header row; return the number of tasks written."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(FIELDS)
+    count = 0
+    for task in tasks:
+        writer.writerow((task.id, task.title, task.description or "", task.status.value))
+        count += 1
+        if buffer.tell() >= CHUNK_SIZE:
+            out.write(buffer.getvalue())
+            buffer.seek(0)
+            buffer.truncate()
+    out.write(buffer.getvalue())
+    return count
+
+
+WRITERS: Dict[str, Callable[[Iterable[Task], IO[str]], int]] = {
+    "ndjson": write_ndjson,
+    "csv": write_csv,
+    "json": write_json,
+}
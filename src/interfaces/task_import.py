@@ -0,0 +1,65 @@
+"""
+Streaming parsers for importing tasks from NDJSON and CSV files.
+"""
+from typing import Callable, Dict, IO, Iterator, Optional, Tuple
+import csv
+import json
+from src.entities.task import TaskStatus
+
+
+# (title, description, status), as accepted by TaskService.import_tasks.
+ImportEntry = Tuple[str, Optional[str], TaskStatus]
+
+# Status spellings accepted in imported records, including the CLI's todo/done labels.
+_STATUSES = {
+    "": TaskStatus.INCOMPLETE,
+    "incomplete": TaskStatus.INCOMPLETE,
+    "todo": TaskStatus.INCOMPLETE,
+    "complete": TaskStatus.COMPLETE,
+    "done": TaskStatus.COMPLETE,
+}
+
+
+def _entry(record: dict) -> ImportEntry:
+    """Convert one parsed record into an import entry; fields must be strings, or null where optional."""
+    if not isinstance(record, dict):
+        raise ValueError("Record must be an object with a title")
+    title, description, status = record.get("title"), record.get("description"), record.get("status")
+    if title is not None and not isinstance(title, str):
+        raise ValueError("Title must be a string")
+    if description is not None and not isinstance(description, str):
+        raise ValueError("Description must be a string or null")
+    if status is not None and not isinstance(status, str):
+        raise ValueError("Status must be a string or null")
+    key = (status or "").strip().lower()
+    if key not in _STATUSES:
+        raise ValueError(f"Unknown status: {status}")
+    return title or "", description or None, _STATUSES[key]
+
+
+def parse_ndjson(stream: IO[str]) -> Iterator[ImportEntry]:
+    """Lazily parse one JSON object per line, skipping blank lines."""
+    for number, line in enumerate(stream, 1):
+        if line.strip():
+            try:
+                entry = _entry(json.loads(line))
+            except ValueError as e:
+                raise ValueError(f"{e} (line {number})") from e
+            yield entry
+
+
+def parse_csv(stream: IO[str]) -> Iterator[ImportEntry]:
+    """Lazily parse CSV rows with a header naming title, description and status columns."""
+    reader = csv.DictReader(stream)
+    for row in reader:
+        try:
+            entry = _entry(row)
+        except ValueError as e:
+            raise ValueError(f"{e} (line {reader.line_num})") from e
+        yield entry
+
+
+PARSERS: Dict[str, Callable[[IO[str]], Iterator[ImportEntry]]] = {
+    "ndjson": parse_ndjson,
+    "csv": parse_csv,
+}
@@ -0,0 +1,181 @@
+"""
+Buffered renderers for listing tasks as a table or in machine-readable formats.
+"""
+from typing import TYPE_CHECKING, Callable, Dict, IO, Iterable, List, Optional
+import itertools
+from src.entities.task import Task, TaskStatus, TaskSummary, summarize_text
+
+if TYPE_CHECKING:
+    from src.interfaces.change_feed import ChangeEvent
+    from src.use_cases.task_metrics import OperationStats
+
+
+# Output is accumulated and written in chunks of roughly this many characters.
+CHUNK_SIZE = 64 * 1024
+
+FORMATS = ("table", "tsv", "json", "ndjson")
+
+CHANGE_FORMATS = ("text", "ndjson")
+
+STATS_FORMATS = ("table", "prometheus")
+
+# Content type of the Prometheus text exposition format.
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+_STATUS_LABELS = {TaskStatus.INCOMPLETE: "TODO", TaskStatus.COMPLETE: "DONE"}
+
+# Backslash escapes that keep every TSV record on one line with exactly five fields.
+_TSV_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+_TSV_NULL = "\\N"
+
+
+def write_chunked(pieces: Iterable[str], out: IO[str]) -> int:
+    """Write string pieces to ``out`` in large chunks; return the number of pieces."""
+    buffer: List[str] = []
+    size = 0
+    count = 0
+    for piece in pieces:
+        buffer.append(piece)
+        size += len(piece)
+        count += 1
+        if size >= CHUNK_SIZE:
+            out.write("".join(buffer))
+            buffer.clear()
+            size = 0
+    if buffer:
+        out.write("".join(buffer))
+    return count
+
+
+def render_table(summaries: Iterable[TaskSummary], out: IO[str],
+                 short_ids: Optional[Dict[str, str]] = None) -> int:
+    """Write summaries as a padded table in large chunks; return the number of rows.
+
+    Nothing is written, not even the header, when there are no summaries.
+    When ``short_ids`` is given, each ID is replaced by its shortest unique prefix.
+    """
+    if short_ids is None:
+        width = 36
+    else:
+        width = max((len(prefix) for prefix in short_ids.values()), default=0)
+        width = max(width, len("ID"))
+    labels = _STATUS_LABELS
+
+    def rows():
+        header = f"{'ID':<{width}} {'Status':<10} {'Title':<30} {'Description'}\n" + "-" * (width + 44) + "\n"
+        for summary in summaries:
+            task_id = summary.id if short_ids is None else short_ids[summary.id]
+            row = f"{task_id:<{width}} {labels[summary.status]:<10} {summary.title:<30} {summary.description}\n"
+            if header:
+                row = header + row
+                header = ""
+            yield row
+
+    return write_chunked(rows(), out)
+
+
+def render_tsv(tasks: Iterable[Task], out: IO[str]) -> int:
+    """Write full tasks and their versions as tab-separated values with a header row; return the number of tasks.
+
+    Tabs, newlines and backslashes inside texts are backslash-escaped, and a
+    missing description is written as ``\\N``.
+    """
+    escapes = _TSV_ESCAPES
+    rows = (
+        f"{task.id}\t{task.status.value}\t{task.title.translate(escapes)}\t"
+        f"{_TSV_NULL if task.description is None else task.description.translate(escapes)}\t{task.version}\n"
+        for task in tasks
+    )
+    # The header row is one extra piece.
+    return write_chunked(itertools.chain(("id\tstatus\ttitle\tdescription\tversion\n",), rows), out) - 1
+
+
+def render_changes(events: Iterable["ChangeEvent"], out: IO[str], epoch: str, output_format: str = "text") -> int:
+    """Write change events of the feed with the given epoch one per line; return the number of events.
+
+    Text lines show the cursor (``epoch:seq``), the kind of change and the
+    task ID, followed by the task's status, version and shortened title
+    unless it was deleted. NDJSON lines carry the cursor and sequence number
+    and the task's full new state, or null.
+    """
+    if output_format == "ndjson":
+        import json
+        lines = (
+            json.dumps({"cursor": f"{epoch}:{event.seq}", "seq": event.seq, "change": event.kind.value,
+                        "id": event.task_id,
+                        "task": None if event.task is None else dict(event.task.to_dict(), version=event.task.version)},
+                       ensure_ascii=False) + "\n"
+            for event in events
+        )
+    else:
+        labels = _STATUS_LABELS
+        lines = (
+            f"{epoch}:{event.seq} {event.kind.value:<7} {event.task_id}" + (
+                "\n" if event.task is None else
+                f" {labels[event.task.status]:<4} v{event.task.version} {summarize_text(event.task.title)}\n"
+            )
+            for event in events
+        )
+    return write_chunked(lines, out)
+
+
+def render_stats(snapshot: Dict[str, "OperationStats"], out: IO[str]) -> int:
+    """Write a table of per-operation calls, errors and latency; return the number of operations."""
+    out.write(f"{'Operation':<22} {'Calls':>9} {'Errors':>7} {'Mean ms':>9} {'p50 ms':>8} {'p99 ms':>8}\n")
+    for operation, stats in snapshot.items():
+        mean = stats.total_seconds / stats.calls * 1000
+        out.write(f"{operation:<22} {stats.calls:>9} {sum(stats.errors.values()):>7} {mean:>9.3f} "
+                  f"{_bucket_ms(stats.quantile(0.5)):>8} {_bucket_ms(stats.quantile(0.99)):>8}\n")
+    errors = [(operation, error, count) for operation, stats in snapshot.items()
+              for error, count in sorted(stats.errors.items())]
+    if errors:
+        out.write("\nErrors:\n")
+        for operation, error, count in errors:
+            out.write(f"  {operation}: {count} {error}\n")
+    return len(snapshot)
+
+
+def _bucket_ms(bound: float) -> str:
+    """A latency histogram bound in milliseconds, as an upper limit."""
+    if bound == float("inf"):
+        return "slower"
+    return f"<{bound * 1000:g}"
+
+
+def render_prometheus(snapshot: Dict[str, "OperationStats"], prefix: str = "todo") -> str:
+    """Render per-operation metrics in the Prometheus text exposition format."""
+    from src.use_cases.task_metrics import LATENCY_BUCKETS
+    lines: List[str] = [
+        f"# HELP {prefix}_operation_calls_total Calls of each task service operation.",
+        f"# TYPE {prefix}_operation_calls_total counter",
+    ]
+    lines.extend(f'{prefix}_operation_calls_total{{operation="{name}"}} {stats.calls}'
+                 for name, stats in snapshot.items())
+    lines.append(f"# HELP {prefix}_operation_errors_total Failed calls of each task service operation, by error.")
+    lines.append(f"# TYPE {prefix}_operation_errors_total counter")
+    for name, stats in snapshot.items():
+        lines.extend(f'{prefix}_operation_errors_total{{operation="{name}",error="{error}"}} {count}'
+                     for error, count in sorted(stats.errors.items()))
+    lines.append(f"# HELP {prefix}_operation_duration_seconds Latency of each task service operation.")
+    lines.append(f"# TYPE {prefix}_operation_duration_seconds histogram")
+    for name, stats in snapshot.items():
+        cumulative = 0
+        for bound, count in zip(LATENCY_BUCKETS + (float("inf"),), stats.buckets):
+            cumulative += count
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            lines.append(f'{prefix}_operation_duration_seconds_bucket{{operation="{name}",le="{le}"}} {cumulative}')
+        lines.append(f'{prefix}_operation_duration_seconds_sum{{operation="{name}"}} {stats.total_seconds!r}')
+        lines.append(f'{prefix}_operation_duration_seconds_count{{operation="{name}"}} {stats.calls}')
+    return "\n".join(lines) + "\n"
+
+
+def machine_writer(output_format: str) -> Callable[[Iterable[Task], IO[str]], int]:
+    """Return the writer for a machine format; these write full tasks without padding or truncation.
+
+    The JSON writers are shared with export and imported only when requested.
+    """
+    if output_format == "tsv":
+        return render_tsv
+    from src.interfaces.task_export import write_json, write_ndjson
+    return {"json": write_json, "ndjson": write_ndjson}[output_format]
@@ -1,40 +1,336 @@
 """
 In-memory repository for Task entities.
 """
-from typing import Dict, List, Optional
-from src.entities.task import Task
+from bisect import bisect_left, bisect_right
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from src.entities.task import Task, TaskStatus, TaskSummary
+from src.interfaces.change_feed import ChangeFeed, ChangeKind
+from src.interfaces.id_index import SortedIdIndex
+
+
+class VersionConflictError(ValueError):
+    """Raised when a compare-and-set update finds the task at a different version than expected."""
+
+    def __init__(self, task_id: str, expected_version: int, actual_version: int):
+        super().__init__(f"Task {task_id} was changed by someone else "
+                         f"(expected version {expected_version}, found {actual_version})")
+        self.task_id = task_id
+        self.expected_version = expected_version
+        self.actual_version = actual_version
 
 
 class TaskRepository:
-    """In-memory repository for managing Task entities."""
+    """In-memory repository for managing Task entities.
+
+    Every write stores the task with a version one higher than the stored
+    one (1 for a new ID) and sets ``task.version`` to it, so concurrent
+    writers can detect each other through ``update_if_version``.
+
+    Writes are published to ``changes`` as added, updated and deleted events.
+    The feed is only started when first asked for, so a repository nobody
+    follows pays nothing for it.
+    """
+
+    # Created by the first access to ``changes``; until then nothing is published.
+    _feed: Optional[ChangeFeed] = None
 
     def __init__(self):
         """Initialize the repository with an empty storage."""
         self._tasks: Dict[str, Task] = {}
+        # Task IDs per status; dicts are used as insertion-ordered sets.
+        self._status_index: Dict[TaskStatus, Dict[str, None]] = {status: {} for status in TaskStatus}
+        # Sequence numbers per status in ascending order, so filtered pages seek by bisection too.
+        # New tasks are appended; any other change drops the list, and the next page rebuilds it.
+        self._status_seqs: Dict[TaskStatus, Optional[List[int]]] = {status: None for status in TaskStatus}
+        # Built on the first prefix lookup, then kept current on add and delete.
+        self._id_index: Optional[SortedIdIndex] = None
+        # Insertion order as parallel lists of ascending sequence numbers and IDs,
+        # so pages can seek to a sequence number by bisection. Deleted entries
+        # keep their place with a None ID until the lists are compacted.
+        self._seqs: Dict[str, int] = {}
+        self._order_seqs: List[int] = []
+        self._order_ids: List[Optional[str]] = []
+        self._order_holes = 0
+        self._next_seq = 1
 
     def add(self, task: Task) -> Task:
         """Add a new task to the repository."""
-        self._tasks[task.id] = task
+        self._bump_version(task)
+        self._store(task)
+        self._publish_stored(task)
         return task
 
+    def add_many(self, tasks: Iterable[Task]) -> List[Task]:
+        """Add several tasks to the repository."""
+        return [self.add(task) for task in tasks]
+
     def get_by_id(self, task_id: str) -> Optional[Task]:
         """Retrieve a task by its ID."""
         return self._tasks.get(task_id)
 
+    def get_many(self, task_ids: Iterable[str]) -> Dict[str, Task]:
+        """Retrieve the tasks that exist among the given IDs, keyed by ID."""
+        found = {}
+        for task_id in task_ids:
+            task = self.get_by_id(task_id)
+            if task is not None:
+                found[task_id] = task
+        return found
+
     def get_all(self) -> List[Task]:
         """Retrieve all tasks."""
         return list(self._tasks.values())
 
+    def iter_all(self) -> Iterator[Task]:
+        """Iterate over all tasks without copying them into a list."""
+        return iter(self._tasks.values())
+
+    def get_page(self, limit: int, after: Optional[int] = None,
+                 status: Optional[TaskStatus] = None) -> Tuple[List[Task], Optional[int]]:
+        """Return up to ``limit`` tasks in insertion order after the given sequence key.
+
+        The second element is the key to pass as ``after`` for the next page,
+        or None when no tasks follow. With a status, the page is read from
+        that status's sequence numbers, so tasks with other statuses are never
+        visited. Those are sorted again on the first filtered page after a
+        task changed status or was deleted, so writes stay O(1).
+        """
+        if status is not None:
+            seqs = self._status_seqs[status]
+            if seqs is None:
+                seqs = self._status_seqs[status] = sorted(self._seqs[task_id] for task_id in self._status_index[status])
+            start = 0 if after is None else bisect_right(seqs, after)
+            chosen = seqs[start:start + limit + 1]
+            order_seqs, order_ids = self._order_seqs, self._order_ids
+            page = [self._tasks[order_ids[bisect_left(order_seqs, seq)]] for seq in chosen[:limit]]
+            return page, chosen[limit - 1] if len(chosen) > limit else None
+        index = 0 if after is None else bisect_right(self._order_seqs, after)
+        page = []
+        while index < len(self._order_ids):
+            task_id = self._order_ids[index]
+            index += 1
+            if task_id is None:
+                continue
+            if len(page) == limit:
+                return page, self._seqs[page[-1].id]
+            page.append(self._tasks[task_id])
+        return page, None
+
+    def get_by_status(self, status: TaskStatus) -> List[Task]:
+        """Retrieve all tasks with the given status."""
+        return [self._tasks[task_id] for task_id in self._status_index[status]]
+
+    def iter_summaries(self, status: Optional[TaskStatus] = None) -> Iterator[TaskSummary]:
+        """Iterate over listing summaries of all tasks, or only those with the given status."""
+        tasks = self._tasks.values() if status is None else self.get_by_status(status)
+        return (task.to_summary() for task in tasks)
+
+    def ids_with_prefix(self, prefix: str, limit: int = 2) -> List[str]:
+        """Return up to ``limit`` task IDs starting with the prefix, in sorted order."""
+        return self._sorted_ids().with_prefix(prefix, limit)
+
+    def iter_sorted_ids(self) -> Iterator[str]:
+        """Iterate over all task IDs in sorted order."""
+        return iter(self._sorted_ids())
+
     def update(self, task: Task) -> Optional[Task]:
         """Update an existing task."""
         if task.id not in self._tasks:
             return None
+        self._bump_version(task)
         self._tasks[task.id] = task
+        self._index_status(task)
+        self._publish_stored(task)
         return task
 
+    def update_many(self, tasks: Iterable[Task]) -> List[Optional[Task]]:
+        """Update several existing tasks; None marks tasks that were not found."""
+        return [self.update(task) for task in tasks]
+
+    def update_if_version(self, task: Task, expected_version: int) -> Optional[Task]:
+        """Update an existing task only if its stored version is still ``expected_version``.
+
+        Returns None when the task does not exist and raises VersionConflictError
+        when another write got there first.
+        """
+        stored = self.get_by_id(task.id)
+        if stored is None:
+            return None
+        if stored.version != expected_version:
+            raise VersionConflictError(task.id, expected_version, stored.version)
+        return self.update(task)
+
+    def modify(self, task_id: str, change: Callable[[Task], None],
+               expected_version: Optional[int] = None) -> Optional[Task]:
+        """Apply ``change`` to a copy of a stored task and write it back; None if the task does not exist.
+
+        The write is a compare-and-set against the version that was read, so
+        no lock is held while ``change`` runs; a concurrent write makes it
+        re-read and try again. With ``expected_version``, the task must be at
+        that version and a conflict raises VersionConflictError instead. The
+        changed task is validated before it is written, so a change that
+        leaves it invalid raises ValueError and stores nothing.
+        """
+        while True:
+            stored = self.get_by_id(task_id)
+            if stored is None:
+                return None
+            if expected_version is not None and stored.version != expected_version:
+                raise VersionConflictError(task_id, expected_version, stored.version)
+            task = stored.copy()
+            change(task)
+            task.validate()
+            try:
+                return self.update_if_version(task, stored.version)
+            except VersionConflictError:
+                if expected_version is not None:
+                    raise
+
+    def modify_many(self, task_ids: Iterable[str], change: Callable[[Task], None]) -> List[Optional[Task]]:
+        """Apply ``change`` to copies of several stored tasks and write them back as one batch.
+
+        Returns the updated task for each ID, or None where the task was not found.
+        Every changed task is validated before any is written.
+        """
+        task_ids = list(task_ids)
+        tasks = [task.copy() for task in self.get_many(task_ids).values()]
+        for task in tasks:
+            change(task)
+            task.validate()
+        updated = {task.id: task for task in self.update_many(tasks) if task is not None}
+        return [updated.get(task_id) for task_id in task_ids]
+
     def delete(self, task_id: str) -> bool:
         """Delete a task by its ID."""
+        if not self._remove(task_id):
+            return False
+        self._publish_deleted(task_id)
+        return True
+
+    def delete_many(self, task_ids: Iterable[str]) -> List[bool]:
+        """Delete several tasks by ID, reporting for each whether it existed."""
+        return [self.delete(task_id) for task_id in task_ids]
+
+    @property
+    def changes(self) -> ChangeFeed:
+        """Feed of the writes made through this repository since it was first requested."""
+        if self._feed is None:
+            self._feed = ChangeFeed()
+        return self._feed
+
+    def close(self) -> None:
+        """Release any resources held by the repository."""
+
+    def _remove(self, task_id: str) -> bool:
+        """Drop a task and its index entries without publishing the change; False if it did not exist."""
         if task_id in self._tasks:
             del self._tasks[task_id]
+            self._order_ids[bisect_right(self._order_seqs, self._seqs.pop(task_id)) - 1] = None
+            self._order_holes += 1
+            if self._order_holes > max(len(self._tasks), 1024):
+                self._compact_order()
+            for status, task_ids in self._status_index.items():
+                if task_id in task_ids:
+                    del task_ids[task_id]
+                    self._status_seqs[status] = None
+            if self._id_index is not None:
+                self._id_index.remove(task_id)
             return True
-        return False
\ No newline at end of file
+        return False
+
+    def _publish_stored(self, task: Task) -> None:
+        """Publish a task just written: as added when it is at version 1, otherwise as updated."""
+        if self._feed is not None:
+            self._feed.publish(ChangeKind.ADDED if task.version == 1 else ChangeKind.UPDATED, task.id, task)
+
+    def _publish_deleted(self, task_id: str) -> None:
+        """Publish the removal of a task just deleted."""
+        if self._feed is not None:
+            self._feed.publish(ChangeKind.DELETED, task_id)
+
+    def _publish_stored_many(self, tasks: Iterable[Task]) -> None:
+        """Publish a batch of tasks just written, as ``_publish_stored`` does for one."""
+        if self._feed is not None:
+            self._feed.publish_many(
+                (ChangeKind.ADDED if task.version == 1 else ChangeKind.UPDATED, task.id, task) for task in tasks
+            )
+
+    def _publish_deleted_many(self, task_ids: Iterable[str]) -> None:
+        """Publish the removal of a batch of tasks just deleted."""
+        if self._feed is not None:
+            self._feed.publish_many((ChangeKind.DELETED, task_id, None) for task_id in task_ids)
+
+    def _store(self, task: Task, seq: Optional[int] = None) -> Task:
+        """Store a task, giving a new ID the next (or the given) sequence number."""
+        if task.id not in self._seqs:
+            seq = self._next_seq if seq is None else seq
+            self._seqs[task.id] = seq
+            self._order_seqs.append(seq)
+            self._order_ids.append(task.id)
+            self._next_seq = max(self._next_seq, seq + 1)
+        self._tasks[task.id] = task
+        self._index_status(task)
+        if self._id_index is not None:
+            self._id_index.add(task.id)
+        return task
+
+    def _load(self, entries: Iterable[Tuple[int, Task]]) -> None:
+        """Store (sequence number, task) pairs, in ascending sequence order, into an empty repository.
+
+        A bulk form of ``_store`` for restoring a saved store at startup.
+        """
+        tasks, seqs, status_index = self._tasks, self._seqs, self._status_index
+        order_seqs, order_ids = self._order_seqs, self._order_ids
+        seq = 0
+        for seq, task in entries:
+            task_id = task.id
+            tasks[task_id] = task
+            seqs[task_id] = seq
+            order_seqs.append(seq)
+            order_ids.append(task_id)
+            status_index[task.status][task_id] = None
+        self._status_seqs = {status: None for status in TaskStatus}
+        self._next_seq = max(self._next_seq, seq + 1)
+
+    def _bump_version(self, task: Task) -> None:
+        """Give a task about to be written the version after the stored one."""
+        stored = self._tasks.get(task.id)
+        task.version = 1 if stored is None else stored.version + 1
+
+    def _all_ids(self) -> Iterable[str]:
+        """All stored task IDs, used to build the sorted ID index."""
+        return self._tasks.keys()
+
+    def _sorted_ids(self) -> SortedIdIndex:
+        """Return the sorted ID index, building it on first use."""
+        if self._id_index is None:
+            self._id_index = SortedIdIndex(self._all_ids())
+        return self._id_index
+
+    def _compact_order(self) -> None:
+        """Drop deleted entries from the insertion order lists."""
+        live = [(seq, task_id) for seq, task_id in zip(self._order_seqs, self._order_ids) if task_id is not None]
+        self._order_seqs = [seq for seq, _ in live]
+        self._order_ids = [task_id for _, task_id in live]
+        self._order_holes = 0
+
+    def _index_status(self, task: Task) -> None:
+        """Move a task into the status index bucket matching its current status.
+
+        Tasks may already have been mutated in place, so the task is removed
+        from every bucket rather than only from the one it was last seen in.
+        """
+        for status, task_ids in self._status_index.items():
+            if status != task.status and task.id in task_ids:
+                del task_ids[task.id]
+                self._status_seqs[status] = None
+        task_ids = self._status_index[task.status]
+        if task.id not in task_ids:
+            task_ids[task.id] = None
+            seqs = self._status_seqs[task.status]
+            if seqs is not None:
+                seq = self._seqs[task.id]
+                if not seqs or seqs[-1] < seq:
+                    seqs.append(seq)
+                else:
+                    self._status_seqs[task.status] = None
\ No newline at end of file
@@ -0,0 +1,84 @@
+"""
+Compact binary snapshots of a whole task store.
+"""
+import os
+import struct
+from typing import Iterable, Iterator, Tuple
+from src.entities.task import Task, TaskStatus
+
+
+_MAGIC = b"TDSN"
+_FORMAT = 1
+# magic, format, generation, next sequence number, task count
+_HEADER = struct.Struct("<4sHxxQQQ")
+# sequence number, version, flags, then the id, title and description lengths in characters
+_RECORD = struct.Struct("<QIBIII")
+
+_COMPLETE = 0x01
+_HAS_DESCRIPTION = 0x02
+# Texts may hold lone surrogates (from JSON escapes or undecodable file names), which strict UTF-8 refuses.
+_TEXT_ERRORS = "surrogatepass"
+
+
+def write_snapshot(path: str, generation: int, next_seq: int, entries: Iterable[Tuple[int, Task]]) -> None:
+    """Atomically write (sequence number, task) pairs, in ascending sequence order, to a snapshot file.
+
+    The fixed-width records come first and all texts follow as one UTF-8
+    block, so loading decodes the texts once and slices them. If writing
+    fails, the temporary file is removed and the previous snapshot is kept.
+    """
+    records = []
+    texts = []
+    for seq, task in entries:
+        description = task.description
+        flags = _COMPLETE if task.status == TaskStatus.COMPLETE else 0
+        if description is not None:
+            flags |= _HAS_DESCRIPTION
+        else:
+            description = ""
+        records.append(_RECORD.pack(seq, task.version, flags, len(task.id), len(task.title), len(description)))
+        texts.extend((task.id, task.title, description))
+    temp_path = path + ".tmp"
+    try:
+        with open(temp_path, "wb") as snapshot:
+            snapshot.write(_HEADER.pack(_MAGIC, _FORMAT, generation, next_seq, len(records)))
+            snapshot.write(b"".join(records))
+            snapshot.write("".join(texts).encode("utf-8", _TEXT_ERRORS))
+            snapshot.flush()
+            os.fsync(snapshot.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def read_snapshot(path: str) -> Tuple[int, int, Iterator[Tuple[int, Task]]]:
+    """Read a snapshot file, returning its generation, next sequence number and (sequence number, task) pairs."""
+    with open(path, "rb") as snapshot:
+        data = snapshot.read()
+    if len(data) < _HEADER.size:
+        raise ValueError(f"{path} is not a task snapshot")
+    magic, version, generation, next_seq, count = _HEADER.unpack_from(data, 0)
+    if magic != _MAGIC or version != _FORMAT:
+        raise ValueError(f"{path} is not a task snapshot")
+    end = _HEADER.size + count * _RECORD.size
+    return generation, next_seq, _iter_entries(data[_HEADER.size:end], data[end:].decode("utf-8", _TEXT_ERRORS))
+
+
+def _iter_entries(records: bytes, text: str) -> Iterator[Tuple[int, Task]]:
+    """Decode the fixed-width records, slicing each task's texts from the shared text block."""
+    position = 0
+    for seq, version, flags, id_length, title_length, description_length in _RECORD.iter_unpack(records):
+        title_start = position + id_length
+        description_start = title_start + title_length
+        end = description_start + description_length
+        # Positional arguments: this runs once per task on every startup.
+        yield seq, Task(
+            text[position:title_start],
+            text[title_start:description_start],
+            text[description_start:end] if flags & _HAS_DESCRIPTION else None,
+            TaskStatus.COMPLETE if flags & _COMPLETE else TaskStatus.INCOMPLETE,
+            version
+        )
+        position = end
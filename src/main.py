@@ -1,25 +1,69 @@
-
-
 """
 Main entry point for the Todo CLI application.
 """
-from src.interfaces.task_repository import TaskRepository
-from src.use_cases.task_service import TaskService
-from src.interfaces.cli_controller import CLIController
+from src.config import Config
 import sys
 
 
 def main():
     """Main entry point for the application."""
+    try:
+        config = Config.from_env()
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    argv = sys.argv[1:]
+
+    # With a daemon, this process is only a thin client; the service layers are never imported.
+    if config.daemon and (not argv or argv[0] not in ("serve", "shell", "api")):
+        from src.interfaces.daemon import run_in_daemon
+        try:
+            exit_code = run_in_daemon(config, argv)
+        except KeyboardInterrupt:
+            # Interrupting is how `watch` ends; the daemon sees the connection close and stops following.
+            if argv[:1] != ["watch"]:
+                raise
+            sys.exit(0)
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    # Metrics live in the process running the service, and a one-shot command's service has done nothing yet.
+    if argv[:1] == ["stats"]:
+        print("Error: stats shows the metrics of a running daemon; start one with `serve` and run stats "
+              "with TODO_DAEMON=1 TODO_METRICS=1, or run it in the shell")
+        sys.exit(1)
+
+    from src.entities.task_id import create_id_generator
+    from src.interfaces.repository_factory import create_repository
+    from src.use_cases.task_service import TaskService
+    from src.interfaces.cli_controller import CLIController
+
     # Initialize the application components
-    task_repository = TaskRepository()
-    task_service = TaskService(task_repository)
+    data_path = config.data_path
+    if argv[:1] == ["serve"]:
+        # The daemon changes into each client's directory, so the store path must not be relative.
+        from src.interfaces.daemon import resolve_data_path
+        data_path = resolve_data_path(config)
+    try:
+        id_generator = create_id_generator(config.id_format)
+        task_repository = create_repository(config.backend, data_path, config.cache_entries, config.cache_bytes)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    metrics = None
+    if config.metrics:
+        from src.use_cases.task_metrics import OperationMetrics
+        metrics = OperationMetrics()
+    task_service = TaskService(task_repository, id_generator, metrics)
     cli_controller = CLIController(task_service)
 
     # Handle the command line arguments
-    exit_code = cli_controller.handle_command()
+    try:
+        exit_code = cli_controller.handle_command()
+    finally:
+        task_repository.close()
     sys.exit(exit_code)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,116 @@
+"""
+Inverted full-text index over task titles and descriptions.
+"""
+from typing import Dict, Iterable, List, Tuple
+import heapq
+import math
+import re
+from src.entities.task import Task
+
+
+_TOKEN = re.compile(r"\w+")
+
+# Title matches count more than description matches.
+TITLE_WEIGHT = 2
+# BM25 term-frequency saturation and length normalisation.
+_K1 = 1.2
+_B = 0.75
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens."""
+    return _TOKEN.findall(text.lower())
+
+
+class SearchIndex:
+    """Inverted index mapping terms to the tasks that contain them.
+
+    Each task is indexed as a bag of weighted term frequencies so it can be
+    removed or re-indexed without rescanning other tasks. Queries are a
+    disjunction of conjunctions: terms separated by spaces must all match,
+    and ``OR`` separates alternative groups. Results are ranked with BM25.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._documents: Dict[str, Dict[str, int]] = {}
+        self._lengths: Dict[str, int] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        """Number of indexed tasks."""
+        return len(self._documents)
+
+    def add(self, task: Task) -> None:
+        """Index a task, replacing any previous entry for its ID."""
+        self.remove(task.id)
+        frequencies: Dict[str, int] = {}
+        for term in tokenize(task.title):
+            frequencies[term] = frequencies.get(term, 0) + TITLE_WEIGHT
+        for term in tokenize(task.description or ""):
+            frequencies[term] = frequencies.get(term, 0) + 1
+        for term, frequency in frequencies.items():
+            self._postings.setdefault(term, {})[task.id] = frequency
+        length = sum(frequencies.values())
+        self._documents[task.id] = frequencies
+        self._lengths[task.id] = length
+        self._total_length += length
+
+    def add_many(self, tasks: Iterable[Task]) -> None:
+        """Index several tasks."""
+        for task in tasks:
+            self.add(task)
+
+    def remove(self, task_id: str) -> None:
+        """Drop a task from the index if present."""
+        frequencies = self._documents.pop(task_id, None)
+        if frequencies is None:
+            return
+        for term in frequencies:
+            postings = self._postings[term]
+            del postings[task_id]
+            if not postings:
+                del self._postings[term]
+        self._total_length -= self._lengths.pop(task_id)
+
+    def search(self, query: str, limit: int = 20) -> List[Tuple[str, float]]:
+        """Return up to ``limit`` (task ID, score) pairs matching the query, best first."""
+        scores: Dict[str, float] = {}
+        for group in self._parse(query):
+            matches = self._match_all(group)
+            for task_id in matches:
+                score = sum(self._score(term, task_id) for term in group)
+                if score > scores.get(task_id, 0.0):
+                    scores[task_id] = score
+        return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+
+    @staticmethod
+    def _parse(query: str) -> List[List[str]]:
+        """Split a query into OR-separated groups of AND-ed terms."""
+        groups: List[List[str]] = [[]]
+        for word in query.split():
+            if word == "OR":
+                groups.append([])
+            elif word != "AND":
+                groups[-1].extend(tokenize(word))
+        return [group for group in groups if group]
+
+    def _match_all(self, terms: List[str]) -> Iterable[str]:
+        """Task IDs containing every term, intersecting from the rarest posting list."""
+        postings = [self._postings.get(term) for term in terms]
+        if not all(postings):
+            return ()
+        postings.sort(key=len)
+        rarest, rest = postings[0], postings[1:]
+        return [task_id for task_id in rarest if all(task_id in other for other in rest)]
+
+    def _score(self, term: str, task_id: str) -> float:
+        """BM25 contribution of one term to one task."""
+        postings = self._postings[term]
+        frequency = postings[task_id]
+        count = len(self._documents)
+        idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+        average_length = self._total_length / count
+        norm = _K1 * (1 - _B + _B * self._lengths[task_id] / average_length)
+        return idf * frequency * (_K1 + 1) / (frequency + norm)
@@ -0,0 +1,135 @@
+"""
+Per-operation metrics for TaskService: call counts, error counts and latency histograms.
+"""
+from bisect import bisect_left
+from functools import wraps
+from threading import Lock
+from time import perf_counter
+from typing import Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+
+# Upper bounds, in seconds, of the latency histogram buckets; one more bucket holds anything slower.
+LATENCY_BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                   0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# Error recorded for a call that found nothing to act on: a None or False result, or one among a batch.
+NOT_FOUND = "not_found"
+
+
+class MetricsSink:
+    """Receives one record for every instrumented service call."""
+
+    def record(self, operation: str, seconds: float, error: Optional[str] = None) -> None:
+        """Record a call that took ``seconds``; ``error`` names how it failed, or is None."""
+        raise NotImplementedError
+
+
+class OperationStats(NamedTuple):
+    """Totals for one operation. ``buckets`` counts calls per LATENCY_BUCKETS bound, plus one slower bucket."""
+
+    calls: int
+    errors: Dict[str, int]
+    total_seconds: float
+    buckets: Tuple[int, ...]
+
+    def quantile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given fraction of calls; infinity past the last bound."""
+        wanted = fraction * self.calls
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.buckets):
+            seen += count
+            if seen >= wanted:
+                return bound
+        return float("inf")
+
+
+class OperationMetrics(MetricsSink):
+    """Thread-safe sink that keeps counts and a latency histogram per operation in memory."""
+
+    def __init__(self):
+        """Initialize with nothing recorded."""
+        self._lock = Lock()
+        # Per operation: [calls, total seconds, errors by name, bucket counts].
+        self._operations: Dict[str, list] = {}
+
+    def record(self, operation: str, seconds: float, error: Optional[str] = None) -> None:
+        """Count a call and add its latency to the operation's histogram."""
+        bucket = bisect_left(LATENCY_BUCKETS, seconds)
+        # Explicit acquire and release cost less than a with block on this per-call path.
+        self._lock.acquire()
+        try:
+            entry = self._operations.get(operation)
+            if entry is None:
+                entry = self._operations[operation] = [0, 0.0, {}, [0] * (len(LATENCY_BUCKETS) + 1)]
+            entry[0] += 1
+            entry[1] += seconds
+            entry[3][bucket] += 1
+            if error is not None:
+                entry[2][error] = entry[2].get(error, 0) + 1
+        finally:
+            self._lock.release()
+
+    def snapshot(self) -> Dict[str, OperationStats]:
+        """A consistent copy of the totals so far, by operation name in sorted order."""
+        with self._lock:
+            return {
+                operation: OperationStats(calls, dict(errors), total, tuple(buckets))
+                for operation, (calls, total, errors, buckets) in sorted(self._operations.items())
+            }
+
+    def reset(self) -> None:
+        """Forget everything recorded so far."""
+        with self._lock:
+            self._operations.clear()
+
+
+def instrument(target: object, operations: Iterable[str], sink: MetricsSink,
+               batch_operations: Iterable[str] = ()) -> None:
+    """Shadow the named methods of ``target`` with wrappers that report each call to ``sink``.
+
+    The wrappers are set on the instance, so other instances, and this one
+    when it is never instrumented, call the methods directly. A call that
+    returns None or False records NOT_FOUND, as does one of
+    ``batch_operations`` whose list of per-item results holds one. A call
+    that returns an iterator is timed until the iterator is exhausted or closed.
+    """
+    batch_operations = set(batch_operations)
+    for operation in operations:
+        method = getattr(target, operation)
+        setattr(target, operation, _timed(operation, method, sink, operation in batch_operations))
+
+
+def _timed(operation: str, method, sink: MetricsSink, batch: bool):
+    """Wrap a bound method to time it and classify its outcome."""
+    record = sink.record
+
+    @wraps(method)
+    def timed(*args, **kwargs):
+        started = perf_counter()
+        try:
+            result = method(*args, **kwargs)
+        except Exception as e:
+            record(operation, perf_counter() - started, type(e).__name__)
+            raise
+        if hasattr(result, "__next__"):
+            return _timed_iterator(operation, result, started, sink)
+        elapsed = perf_counter() - started
+        if result is None or result is False or (batch and any(item is None or item is False for item in result)):
+            record(operation, elapsed, NOT_FOUND)
+        else:
+            record(operation, elapsed)
+        return result
+    return timed
+
+
+def _timed_iterator(operation: str, iterator: Iterator, started: float, sink: MetricsSink) -> Iterator:
+    """Pass an iterator's items through, recording the call once it is exhausted, fails or is closed."""
+    error = None
+    try:
+        yield from iterator
+    except Exception as e:
+        error = type(e).__name__
+        raise
+    finally:
+        sink.record(operation, perf_counter() - started, error)
+
@@ -1,64 +1,317 @@
 """
 Task service containing business logic for todo operations.
 """
-from typing import List, Optional
-from src.entities.task import Task, TaskStatus
+from threading import Lock
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from src.entities.task import Task, TaskPage, TaskStatus, TaskSummary
+from src.entities.task_id import IdGenerator, random_id
+from src.interfaces.change_feed import ChangeFeed, ChangeSubscription, MissedChangesError
+from src.interfaces.id_index import MIN_PREFIX_LENGTH, AmbiguousIdError, PrefixTooShortError, unique_prefixes
 from src.interfaces.task_repository import TaskRepository
-import uuid
+
+# Modules only some commands need are imported where they are used, to keep CLI startup short.
+if TYPE_CHECKING:
+    from src.use_cases.search_index import SearchIndex
+    from src.use_cases.task_metrics import MetricsSink
+
+# Operations timed and counted when the service is given a metrics sink.
+INSTRUMENTED_OPERATIONS = (
+    "add_task", "add_tasks", "import_tasks", "list_tasks", "list_tasks_page", "iter_tasks", "list_summaries",
+    "resolve_task_id", "resolve_task_ids", "update_task", "update_tasks", "delete_task", "delete_tasks",
+    "search_tasks", "mark_task_complete", "mark_task_incomplete", "mark_complete_many", "mark_incomplete_many",
+)
+# Operations returning one result per requested ID; a missing one among them counts as not found.
+BATCH_OPERATIONS = ("resolve_task_ids", "update_tasks", "delete_tasks", "mark_complete_many", "mark_incomplete_many")
 
 
 class TaskService:
     """Service layer for task management operations."""
 
-    def __init__(self, task_repository: TaskRepository):
-        """Initialize the service with a task repository."""
+    def __init__(self, task_repository: TaskRepository, id_generator: IdGenerator = random_id,
+                 metrics: Optional["MetricsSink"] = None):
+        """Initialize the service with a task repository, the generator for new task IDs and a metrics sink."""
         self.task_repository = task_repository
+        self._id_generator = id_generator
+        # Built from the repository on the first search, then brought up to date from the change feed
+        # before each later one. The lock serializes searches from the daemon's, API's and threads' callers.
+        self._search_index: Optional["SearchIndex"] = None
+        self._search_changes: Optional[ChangeSubscription] = None
+        self._search_lock = Lock()
+        self.metrics = metrics
+        if metrics is not None:
+            # Timing wrappers shadow the operations on this instance only; without a sink calls go straight through.
+            from src.use_cases.task_metrics import instrument
+            instrument(self, INSTRUMENTED_OPERATIONS, metrics, BATCH_OPERATIONS)
 
     def add_task(self, title: str, description: Optional[str] = None) -> Task:
         """Add a new task with the given title and optional description."""
-        task_id = str(uuid.uuid4())
-        task = Task(
-            id=task_id,
-            title=title,
-            description=description,
-            status=TaskStatus.INCOMPLETE
-        )
-        return self.task_repository.add(task)
-
-    def list_tasks(self) -> List[Task]:
-        """Retrieve all tasks."""
-        return self.task_repository.get_all()
-
-    def update_task(self, task_id: str, title: Optional[str] = None, description: Optional[str] = None) -> Optional[Task]:
-        """Update an existing task with new title and/or description."""
-        existing_task = self.task_repository.get_by_id(task_id)
-        if not existing_task:
-            return None
+        return self.task_repository.add(self._new_task(title, description))
+
+    def add_tasks(self, entries: Iterable[Tuple[str, Optional[str]]]) -> List[Task]:
+        """Add several tasks from (title, description) pairs as one batch.
+
+        Every entry is validated before anything is stored, so an invalid entry
+        leaves the repository unchanged.
+        """
+        return self._add_batch([self._new_task(title, description) for title, description in entries])
+
+    def import_tasks(self, entries: Iterable[Tuple[str, Optional[str], TaskStatus]],
+                     batch_size: int = 1000) -> Iterator[int]:
+        """Add tasks from (title, description, status) entries, writing them in batches.
+
+        Entries are consumed lazily and validated like add_task, so memory stays
+        bounded by the batch size. Yields the number of tasks stored by each batch.
+        An invalid entry stops the import with a ValueError naming its 1-based
+        record number; the valid entries before it are stored first.
+        """
+        batch: List[Task] = []
+        iterator = iter(entries)
+        record = 0
+        while True:
+            record += 1
+            try:
+                entry = next(iterator, None)
+                if entry is None:
+                    break
+                title, description, status = entry
+                batch.append(self._new_task(title, description, status))
+            except ValueError as e:
+                if batch:
+                    yield len(self._add_batch(batch))
+                raise ValueError(f"Record {record}: {e}") from e
+            if len(batch) >= batch_size:
+                yield len(self._add_batch(batch))
+                batch = []
+        if batch:
+            yield len(self._add_batch(batch))
+
+    def list_tasks(self, status: Optional[TaskStatus] = None) -> List[Task]:
+        """Retrieve all tasks, or only those with the given status."""
+        if status is None:
+            return self.task_repository.get_all()
+        return self.task_repository.get_by_status(status)
+
+    def list_tasks_page(self, limit: int, after: Optional[str] = None,
+                        status: Optional[TaskStatus] = None) -> TaskPage:
+        """Retrieve one page of tasks in insertion order, starting after an opaque cursor.
+
+        Each page is a seek on the repository's sequence key rather than an offset,
+        so fetching page N costs the same as fetching the first page.
+        """
+        if limit < 1:
+            raise ValueError("Page size must be at least 1")
+        tasks, next_key = self.task_repository.get_page(limit, self._decode_cursor(after), status)
+        return TaskPage(tasks, None if next_key is None else self._encode_cursor(next_key))
+
+    def iter_tasks(self, status: Optional[TaskStatus] = None) -> Iterator[Task]:
+        """Iterate over all tasks, or only those with the given status, without materializing all of them."""
+        if status is None:
+            return self.task_repository.iter_all()
+        return iter(self.task_repository.get_by_status(status))
+
+    def list_summaries(self, status: Optional[TaskStatus] = None) -> Iterator[TaskSummary]:
+        """Iterate over listing summaries of all tasks, or only those with the given status."""
+        return self.task_repository.iter_summaries(status)
+
+    def resolve_task_id(self, id_or_prefix: str) -> Optional[str]:
+        """Resolve a full task ID or a unique prefix of one to the full ID.
+
+        Returns None when nothing matches and raises AmbiguousIdError when the
+        prefix matches more than one task. A prefix shorter than
+        MIN_PREFIX_LENGTH, including an empty one, raises PrefixTooShortError
+        even if it is unique.
+        """
+        if self.task_repository.get_by_id(id_or_prefix) is not None:
+            return id_or_prefix
+        if len(id_or_prefix) < MIN_PREFIX_LENGTH:
+            raise PrefixTooShortError(id_or_prefix)
+        matches = self.task_repository.ids_with_prefix(id_or_prefix, 2)
+        if len(matches) > 1:
+            raise AmbiguousIdError(id_or_prefix, matches)
+        return matches[0] if matches else None
+
+    def resolve_task_ids(self, ids_or_prefixes: Iterable[str]) -> List[Optional[str]]:
+        """Resolve several full IDs or unique prefixes, looking up exact IDs in one batch.
+
+        Returns None for entries that match nothing and raises AmbiguousIdError
+        for the first prefix that matches more than one task, or
+        PrefixTooShortError for the first that is too short to use.
+        """
+        values = list(ids_or_prefixes)
+        exact = self.task_repository.get_many(values)
+        resolved: List[Optional[str]] = []
+        for value in values:
+            if value in exact:
+                resolved.append(value)
+                continue
+            if len(value) < MIN_PREFIX_LENGTH:
+                raise PrefixTooShortError(value)
+            matches = self.task_repository.ids_with_prefix(value, 2)
+            if len(matches) > 1:
+                raise AmbiguousIdError(value, matches)
+            resolved.append(matches[0] if matches else None)
+        return resolved
+
+    def short_ids(self) -> Dict[str, str]:
+        """Map every task ID to its shortest unique prefix."""
+        return unique_prefixes(self.task_repository.iter_sorted_ids())
+
+    def complete_ids(self, prefix: str, limit: int = 100) -> List[str]:
+        """Return up to ``limit`` task IDs starting with the prefix, for tab completion."""
+        return self.task_repository.ids_with_prefix(prefix, limit)
+
+    def update_task(self, task_id: str, title: Optional[str] = None, description: Optional[str] = None,
+                    status: Optional[TaskStatus] = None, expected_version: Optional[int] = None) -> Optional[Task]:
+        """Update an existing task with any of a new title, description and status, as one write.
+
+        Concurrent writes are retried on top of each other. With
+        ``expected_version``, the update applies only if the task is still at
+        that version and raises VersionConflictError otherwise, so the caller
+        can re-read the task and decide again.
+        """
+        def change(task: Task) -> None:
+            # Update only provided fields, keep others unchanged
+            if title is not None:
+                task.title = title
+            if description is not None:
+                task.description = description
+            if status is not None:
+                task.status = status
 
-        # Update only provided fields, keep others unchanged
-        if title is not None:
-            existing_task.title = title
-        if description is not None:
-            existing_task.description = description
+        return self.task_repository.modify(task_id, change, expected_version)
 
-        return self.task_repository.update(existing_task)
+    def update_tasks(self, updates: Iterable[Tuple[str, Optional[str], Optional[str]]]) -> List[Optional[Task]]:
+        """Update several tasks from (task_id, title, description) triples as one batch.
+
+        Returns the updated task for each triple, or None where the task was not found.
+        """
+        updates = list(updates)
+        changes: Dict[str, List[Tuple[Optional[str], Optional[str]]]] = {}
+        for task_id, title, description in updates:
+            changes.setdefault(task_id, []).append((title, description))
+
+        def change(task: Task) -> None:
+            for title, description in changes[task.id]:
+                if title is not None:
+                    task.title = title
+                if description is not None:
+                    task.description = description
+
+        updated = self._modify_many(changes, change)
+        return [updated.get(task_id) for task_id, _, _ in updates]
 
     def delete_task(self, task_id: str) -> bool:
         """Delete a task by its ID."""
         return self.task_repository.delete(task_id)
 
-    def mark_task_complete(self, task_id: str) -> Optional[Task]:
-        """Mark a task as complete."""
-        task = self.task_repository.get_by_id(task_id)
-        if not task:
-            return None
-        task.mark_complete()
-        return self.task_repository.update(task)
+    def delete_tasks(self, task_ids: Iterable[str]) -> List[bool]:
+        """Delete several tasks as one batch, reporting for each whether it existed."""
+        return self.task_repository.delete_many(list(task_ids))
+
+    @property
+    def changes(self) -> ChangeFeed:
+        """Feed of the changes made to the repository, started on first use."""
+        return self.task_repository.changes
+
+    def search_tasks(self, query: str, limit: int = 20) -> List[Task]:
+        """Find tasks whose title or description match the query, best match first.
+
+        The first search indexes every task, so the index only pays off in a
+        long-lived process such as the daemon, the shell or the HTTP API; a
+        one-shot ``todo search`` scans the store like a linear search would.
+        Later searches first apply the changes the repository has published
+        since, so they see every write made through this process, in order.
+        """
+        with self._search_lock:
+            if self._search_index is None:
+                self._rebuild_search_index()
+            else:
+                self._catch_up_search_index()
+            matches = self._search_index.search(query, limit)
+        results = []
+        for task_id, _ in matches:
+            task = self.task_repository.get_by_id(task_id)
+            if task is not None:
+                results.append(task)
+        return results
+
+    def mark_task_complete(self, task_id: str, expected_version: Optional[int] = None) -> Optional[Task]:
+        """Mark a task as complete, optionally only if it is still at ``expected_version``."""
+        return self.task_repository.modify(task_id, Task.mark_complete, expected_version)
+
+    def mark_task_incomplete(self, task_id: str, expected_version: Optional[int] = None) -> Optional[Task]:
+        """Mark a task as incomplete, optionally only if it is still at ``expected_version``."""
+        return self.task_repository.modify(task_id, Task.mark_incomplete, expected_version)
+
+    def mark_complete_many(self, task_ids: Iterable[str]) -> List[Optional[Task]]:
+        """Mark several tasks as complete as one batch; None marks tasks that were not found."""
+        return self._set_status_many(task_ids, TaskStatus.COMPLETE)
 
-    def mark_task_incomplete(self, task_id: str) -> Optional[Task]:
-        """Mark a task as incomplete."""
-        task = self.task_repository.get_by_id(task_id)
-        if not task:
+    def mark_incomplete_many(self, task_ids: Iterable[str]) -> List[Optional[Task]]:
+        """Mark several tasks as incomplete as one batch; None marks tasks that were not found."""
+        return self._set_status_many(task_ids, TaskStatus.INCOMPLETE)
+
+    def _rebuild_search_index(self) -> None:
+        """Index every stored task, following the change feed from just before the scan."""
+        from src.use_cases.search_index import SearchIndex
+        # Changes made during the scan are applied again on the next search; re-indexing is idempotent.
+        self._search_changes = self.task_repository.changes.subscribe()
+        self._search_index = SearchIndex()
+        self._search_index.add_many(self.task_repository.get_all())
+
+    def _catch_up_search_index(self) -> None:
+        """Apply the changes published since the last search, or rebuild if the feed no longer has them."""
+        try:
+            events = self._search_changes.poll()
+        except MissedChangesError:
+            self._rebuild_search_index()
+            return
+        for event in events:
+            if event.task is None:
+                self._search_index.remove(event.task_id)
+            else:
+                self._search_index.add(event.task)
+
+    def _add_batch(self, tasks: List[Task]) -> List[Task]:
+        """Store already-built tasks with one repository call."""
+        return self.task_repository.add_many(tasks)
+
+    @staticmethod
+    def _encode_cursor(key: int) -> str:
+        """Wrap a repository sequence key in an opaque URL-safe cursor."""
+        import base64
+        return base64.urlsafe_b64encode(str(key).encode("ascii")).decode("ascii").rstrip("=")
+
+    @staticmethod
+    def _decode_cursor(cursor: Optional[str]) -> Optional[int]:
+        """Recover the repository sequence key from a cursor."""
+        if cursor is None:
             return None
-        task.mark_incomplete()
-        return self.task_repository.update(task)
\ No newline at end of file
+        import base64
+        import binascii
+        try:
+            key = int(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("ascii"))
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise ValueError("Invalid cursor") from None
+        if key < 0:
+            raise ValueError("Invalid cursor")
+        return key
+
+    def _new_task(self, title: str, description: Optional[str] = None,
+                  status: TaskStatus = TaskStatus.INCOMPLETE) -> Task:
+        """Build a validated task with a freshly generated ID."""
+        return Task(id=self._id_generator(), title=title, description=description, status=status)
+
+    def _set_status_many(self, task_ids: Iterable[str], status: TaskStatus) -> List[Optional[Task]]:
+        """Set the status of several tasks with one read and one write against the repository."""
+        task_ids = list(task_ids)
+
+        def change(task: Task) -> None:
+            task.status = status
+
+        updated = self._modify_many(task_ids, change)
+        return [updated.get(task_id) for task_id in task_ids]
+
+    def _modify_many(self, task_ids: Iterable[str], change: Callable[[Task], None]) -> Dict[str, Task]:
+        """Change several tasks in one repository batch; returns the stored ones by ID."""
+        return {task.id: task for task in self.task_repository.modify_many(task_ids, change) if task is not None}
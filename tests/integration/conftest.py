@@ -0,0 +1,14 @@
+"""
+Shared fixtures for the CLI integration tests.
+"""
+import pytest
+from src.interfaces.repository_factory import create_repository
+
+
+@pytest.fixture(params=["memory", "concurrent", "columnar", "log", "sqlite", "mmap", "sqlite-cached"])
+def task_repository(request, tmp_path):
+    """Provide a fresh repository for each storage backend, and for SQLite behind a small read cache."""
+    backend, _, cached = request.param.partition("-")
+    repository = create_repository(backend, str(tmp_path / f"todo.{backend}"), cache_entries=8 if cached else 0)
+    yield repository
+    repository.close()
@@ -5,7 +5,6 @@ from io import StringIO
 import sys
 from unittest.mock import patch
 import pytest
-from src.interfaces.task_repository import TaskRepository
 from src.use_cases.task_service import TaskService
 from src.interfaces.cli_controller import CLIController
 
@@ -13,9 +12,10 @@ from src.interfaces.cli_controller import CLIController
 class TestCLIDeleteCommand:
     """Integration tests for the CLI delete command."""
 
-    def setup_method(self):
-        """Set up a fresh CLI controller for each test."""
-        self.task_repository = TaskRepository()
+    @pytest.fixture(autouse=True)
+    def setup_controller(self, task_repository):
+        """Set up a fresh CLI controller for each test and storage backend."""
+        self.task_repository = task_repository
         self.task_service = TaskService(self.task_repository)
         self.cli_controller = CLIController(self.task_service)
 
@@ -106,7 +106,7 @@ class TestCLIDeleteCommand:
         # Add and complete a task
         task = self.task_service.add_task("Test Title", "Test Description")
         self.task_service.mark_task_complete(task.id)
-        assert task.status.value == "complete"
+        assert self.task_repository.get_by_id(task.id).status.value == "complete"
 
         # Verify task exists
         assert len(self.task_service.list_tasks()) == 1
@@ -128,4 +128,23 @@ class TestCLIDeleteCommand:
         assert result == 0
 
         # Verify the task was removed
-        assert len(self.task_service.list_tasks()) == 0
\ No newline at end of file
+        assert len(self.task_service.list_tasks()) == 0
+
+    def test_delete_command_accepts_multiple_ids(self):
+        """Test that delete removes every given task in one command."""
+        tasks = [self.task_service.add_task(f"Task {i}") for i in range(3)]
+
+        # Capture output
+        old_stdout = sys.stdout
+        sys.stdout = captured_output = StringIO()
+
+        try:
+            result = self.cli_controller.handle_command(['delete', tasks[0].id, tasks[2].id])
+            output = captured_output.getvalue()
+        finally:
+            sys.stdout = old_stdout
+
+        assert result == 0
+        assert f"Task {tasks[0].id} deleted successfully" in output
+        assert f"Task {tasks[2].id} deleted successfully" in output
+        assert [task.id for task in self.task_service.list_tasks()] == [tasks[1].id]
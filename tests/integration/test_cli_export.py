@@ -0,0 +1,61 @@
+"""
+Integration tests for CLI export command functionality.
+"""
+from io import StringIO
+import json
+import sys
+import pytest
+from src.use_cases.task_service import TaskService
+from src.interfaces.cli_controller import CLIController
+
+
+class TestCLIExportCommand:
+    """Integration tests for the CLI export command."""
+
+    @pytest.fixture(autouse=True)
+    def setup_controller(self, task_repository, tmp_path):
+        """Set up a fresh CLI controller for each test and storage backend."""
+        self.tmp_path = tmp_path
+        self.task_repository = task_repository
+        self.task_service = TaskService(self.task_repository)
+        self.cli_controller = CLIController(self.task_service)
+
+    def _run(self, args):
+        """Run a command and return its exit code and output."""
+        old_stdout = sys.stdout
+        sys.stdout = captured_output = StringIO()
+        try:
+            result = self.cli_controller.handle_command(args)
+            output = captured_output.getvalue()
+        finally:
+            sys.stdout = old_stdout
+        return result, output
+
+    def test_export_command_writes_ndjson_to_stdout(self):
+        """Test that export streams every task to standard output."""
+        task1 = self.task_service.add_task("Task 1", "Description 1")
+        task2 = self.task_service.add_task("Task 2")
+        self.task_service.mark_task_complete(task2.id)
+
+        result, output = self._run(['export'])
+
+        assert result == 0
+        records = [json.loads(line) for line in output.splitlines()]
+        assert [record["id"] for record in records] == [task1.id, task2.id]
+        assert records[1]["status"] == "complete"
+
+    def test_export_then_import_round_trips(self):
+        """Test that an exported CSV file can be imported again."""
+        self.task_service.add_task("Task 1", "Description 1")
+        self.task_service.add_task("Task 2")
+        path = self.tmp_path / "tasks.csv"
+
+        result, output = self._run(['export', '--format', 'csv', '--output', str(path)])
+        assert result == 0
+        assert f"Exported 2 tasks to {path}" in output
+
+        result, _ = self._run(['import', str(path)])
+
+        assert result == 0
+        titles = [task.title for task in self.task_service.list_tasks()]
+        assert titles == ["Task 1", "Task 2", "Task 1", "Task 2"]
@@ -0,0 +1,99 @@
+"""
+Integration tests for CLI import command functionality.
+"""
+from io import StringIO
+import sys
+import pytest
+from src.use_cases.task_service import TaskService
+from src.interfaces.cli_controller import CLIController
+
+
+class TestCLIImportCommand:
+    """Integration tests for the CLI import command."""
+
+    @pytest.fixture(autouse=True)
+    def setup_controller(self, task_repository, tmp_path):
+        """Set up a fresh CLI controller for each test and storage backend."""
+        self.tmp_path = tmp_path
+        self.task_repository = task_repository
+        self.task_service = TaskService(self.task_repository)
+        self.cli_controller = CLIController(self.task_service)
+
+    def _run(self, args):
+        """Run a command and return its exit code and output."""
+        old_stdout = sys.stdout
+        sys.stdout = captured_output = StringIO()
+        try:
+            result = self.cli_controller.handle_command(args)
+            output = captured_output.getvalue()
+        finally:
+            sys.stdout = old_stdout
+        return result, output
+
+    def test_import_command_reads_ndjson(self):
+        """Test that NDJSON records are imported with their status."""
+        path = self.tmp_path / "tasks.ndjson"
+        path.write_text('{"title": "Task 1", "description": "D1"}\n{"title": "Task 2", "status": "done"}\n')
+
+        result, output = self._run(['import', str(path), '--batch-size', '1'])
+
+        assert result == 0
+        assert "Imported 2 tasks" in output
+        tasks = self.task_service.list_tasks()
+        assert [(task.title, task.description, task.status.value) for task in tasks] == [
+            ("Task 1", "D1", "incomplete"),
+            ("Task 2", None, "complete"),
+        ]
+
+    def test_import_command_infers_csv_from_extension(self):
+        """Test that .csv files are parsed as CSV without --format."""
+        path = self.tmp_path / "tasks.csv"
+        path.write_text("title,description,status\nTask 1,,todo\nTask 2,\"Has, comma\",done\n")
+
+        result, output = self._run(['import', str(path)])
+
+        assert result == 0
+        assert [task.description for task in self.task_service.list_tasks()] == [None, "Has, comma"]
+
+    def test_import_command_reports_invalid_record(self):
+        """Test that an invalid record stops the import and is reported."""
+        path = self.tmp_path / "tasks.ndjson"
+        path.write_text('{"title": "Task 1"}\n{"title": ""}\n{"title": "Task 3"}\n')
+
+        result, output = self._run(['import', str(path)])
+
+        assert result == 1
+        assert "Error: Record 2: Task title cannot be empty" in output
+        assert "Imported 1 tasks before the error" in output
+        assert len(self.task_service.list_tasks()) == 1
+
+    def test_import_command_rejects_non_string_description(self):
+        """Test that a description of another JSON type is a per-record error, on every backend."""
+        path = self.tmp_path / "tasks.ndjson"
+        path.write_text('{"title": "Task 1"}\n{"title": "x", "description": 5}\n')
+
+        result, output = self._run(['import', str(path)])
+
+        assert result == 1
+        assert "Error: Record 2: Description must be a string or null (line 2)" in output
+        assert [task.title for task in self.task_service.list_tasks()] == ["Task 1"]
+
+    def test_import_command_with_missing_file(self):
+        """Test that a missing file is reported as an error."""
+        result, output = self._run(['import', str(self.tmp_path / "missing.ndjson")])
+
+        assert result == 1
+        assert "Error:" in output
+
+    @pytest.mark.parametrize("batch_size", ["0", "-5"])
+    def test_import_command_rejects_a_batch_size_below_one(self, batch_size, capsys):
+        """Test that --batch-size 0 or less is a usage error instead of a failure inside the import."""
+        path = self.tmp_path / "tasks.ndjson"
+        path.write_text('{"title": "Task 1"}\n')
+
+        with pytest.raises(SystemExit) as exit_info:
+            self.cli_controller.handle_command(['import', str(path), '--batch-size', batch_size])
+
+        assert exit_info.value.code == 2
+        assert "must be at least 1" in capsys.readouterr().err
+        assert self.task_service.list_tasks() == []
@@ -2,10 +2,11 @@
 Integration tests for CLI list command functionality.
 """
 from io import StringIO
+import json
 import sys
 from unittest.mock import patch
 import pytest
-from src.interfaces.task_repository import TaskRepository
+from src.entities.task import TaskStatus
 from src.use_cases.task_service import TaskService
 from src.interfaces.cli_controller import CLIController
 
@@ -13,9 +14,10 @@ from src.interfaces.cli_controller import CLIController
 class TestCLIListCommand:
     """Integration tests for the CLI list command."""
 
-    def setup_method(self):
-        """Set up a fresh CLI controller for each test."""
-        self.task_repository = TaskRepository()
+    @pytest.fixture(autouse=True)
+    def setup_controller(self, task_repository):
+        """Set up a fresh CLI controller for each test and storage backend."""
+        self.task_repository = task_repository
         self.task_service = TaskService(self.task_repository)
         self.cli_controller = CLIController(self.task_service)
 
@@ -131,4 +133,139 @@ class TestCLIListCommand:
         assert "Status" in lines[0]
         assert "Title" in lines[0]
         assert "Description" in lines[0]
-        assert "-" in lines[1]  # Separator line
\ No newline at end of file
+        assert "-" in lines[1]  # Separator line
+
+    def test_list_command_filters_by_status(self):
+        """Test that list --status only shows tasks with that status."""
+        todo = self.task_service.add_task("Still open")
+        done = self.task_service.add_task("Finished")
+        self.task_service.mark_task_complete(done.id)
+
+        # Capture output
+        old_stdout = sys.stdout
+        sys.stdout = captured_output = StringIO()
+
+        try:
+            todo_result = self.cli_controller.handle_command(['list', '--status', 'todo'])
+            todo_output = captured_output.getvalue()
+            captured_output.truncate(0)
+            captured_output.seek(0)
+            done_result = self.cli_controller.handle_command(['list', '--status', 'done'])
+            done_output = captured_output.getvalue()
+        finally:
+            sys.stdout = old_stdout
+
+        assert todo_result == 0 and done_result == 0
+        assert todo.id in todo_output and done.id not in todo_output
+        assert done.id in done_output and todo.id not in done_output
+
+    def test_list_command_status_filter_with_no_matches(self):
+        """Test that list --status reports no tasks when none match."""
+        self.task_service.add_task("Still open")
+
+        # Capture output
+        old_stdout = sys.stdout
+        sys.stdout = captured_output = StringIO()
+
+        try:
+            result = self.cli_controller.handle_command(['list', '--status', 'done'])
+            output = captured_output.getvalue()
+        finally:
+            sys.stdout = old_stdout
+
+        assert result == 0
+        assert "No tasks found." in output
+
+    def _run(self, args):
+        """Run a command and return its exit code and output."""
+        old_stdout = sys.stdout
+        sys.stdout = captured_output = StringIO()
+        try:
+            result = self.cli_controller.handle_command(args)
+            output = captured_output.getvalue()
+        finally:
+            sys.stdout = old_stdout
+        return result, output
+
+    def test_list_command_pages_with_limit_and_after(self):
+        """Test that --limit prints a cursor and --after continues from it."""
+        for i in range(5):
+            self.task_service.add_task(f"Task {i}")
+
+        result, output = self._run(['list', '--limit', '3'])
+        assert result == 0
+        assert "Task 2" in output and "Task 3" not in output
+        cursor = output.split("--after ")[1].strip()
+
+        result, output = self._run(['list', '--limit', '3', '--after', cursor])
+        assert result == 0
+        assert "Task 2" not in output and "Task 3" in output and "Task 4" in output
+        assert "Next page" not in output
+
+    @pytest.mark.parametrize("limit", ["0", "-1"])
+    def test_list_command_rejects_a_limit_below_one(self, limit, capsys):
+        """Test that --limit 0 or less is a usage error rather than the default page size."""
+        with pytest.raises(SystemExit) as exit_info:
+            self.cli_controller.handle_command(['list', '--limit', limit])
+
+        assert exit_info.value.code == 2
+        assert "must be at least 1" in capsys.readouterr().err
+
+    def test_status_pages_follow_insertion_order_across_status_changes(self):
+        """Test that paging a status visits its tasks once each, in insertion order, whatever their history."""
+        tasks = self.task_service.add_tasks([(f"Task {i}", None) for i in range(40)])
+        self.task_service.mark_complete_many([task.id for task in tasks[::3]])
+        self.task_service.mark_incomplete_many([tasks[9].id])
+        self.task_service.mark_complete_many([tasks[1].id, tasks[9].id])
+        self.task_service.delete_task(tasks[12].id)
+        expected = [task.id for i, task in enumerate(tasks) if (i % 3 == 0 or i == 1) and i != 12]
+
+        seen = []
+        page = self.task_service.list_tasks_page(4, status=TaskStatus.COMPLETE)
+        seen.extend(task.id for task in page.tasks)
+        while page.next_cursor is not None:
+            page = self.task_service.list_tasks_page(4, page.next_cursor, TaskStatus.COMPLETE)
+            seen.extend(task.id for task in page.tasks)
+
+        assert seen == expected
+
+    def test_status_pages_see_changes_made_after_an_earlier_page(self):
+        """Test that a status page reflects tasks added, completed and deleted since the previous page."""
+        tasks = self.task_service.add_tasks([(f"Task {i}", None) for i in range(6)])
+        self.task_service.mark_complete_many([tasks[2].id, tasks[4].id])
+        assert [task.id for task in self.task_service.list_tasks_page(10, status=TaskStatus.COMPLETE).tasks] == [
+            tasks[2].id, tasks[4].id]
+
+        added = self.task_service.add_task("Task 6")
+        self.task_service.mark_complete_many([added.id, tasks[0].id])
+        self.task_service.delete_task(tasks[4].id)
+        page = self.task_service.list_tasks_page(10, status=TaskStatus.COMPLETE)
+
+        assert [task.id for task in page.tasks] == [tasks[0].id, tasks[2].id, added.id]
+        assert [task.id for task in self.task_service.list_tasks_page(10, status=TaskStatus.INCOMPLETE).tasks] == [
+            tasks[1].id, tasks[3].id, tasks[5].id]
+
+    def test_list_command_rejects_invalid_cursor(self):
+        """Test that a malformed cursor is reported as an error."""
+        result, output = self._run(['list', '--after', '!!'])
+
+        assert result == 1
+        assert "Error: Invalid cursor" in output
+
+    def test_list_command_json_format_prints_full_tasks(self):
+        """Test that --format json prints untruncated tasks with their versions and honours --status."""
+        task = self.task_service.add_task("T" * 50, "D" * 50)
+        done = self.task_service.add_task("Done")
+        self.task_service.mark_task_complete(done.id)
+
+        result, output = self._run(['list', '--format', 'json', '--status', 'todo'])
+
+        assert result == 0
+        assert json.loads(output) == [dict(task.to_dict(), version=1)]
+
+    def test_list_command_tsv_format_with_no_tasks_prints_header_only(self):
+        """Test that machine formats never print the 'No tasks found' message."""
+        result, output = self._run(['list', '--format', 'tsv'])
+
+        assert result == 0
+        assert output == "id\tstatus\ttitle\tdescription\tversion\n"
@@ -5,7 +5,6 @@ from io import StringIO
 import sys
 from unittest.mock import patch
 import pytest
-from src.interfaces.task_repository import TaskRepository
 from src.use_cases.task_service import TaskService
 from src.interfaces.cli_controller import CLIController
 
@@ -13,9 +12,10 @@ from src.interfaces.cli_controller import CLIController
 class TestCLIMarkCommands:
     """Integration tests for the CLI complete/incomplete commands."""
 
-    def setup_method(self):
-        """Set up a fresh CLI controller for each test."""
-        self.task_repository = TaskRepository()
+    @pytest.fixture(autouse=True)
+    def setup_controller(self, task_repository):
+        """Set up a fresh CLI controller for each test and storage backend."""
+        self.task_repository = task_repository
         self.task_service = TaskService(self.task_repository)
         self.cli_controller = CLIController(self.task_service)
 
@@ -51,7 +51,7 @@ class TestCLIMarkCommands:
         # Add and complete a task
         task = self.task_service.add_task("Test Title", "Test Description")
         self.task_service.mark_task_complete(task.id)
-        assert task.status.value == "complete"
+        assert self.task_repository.get_by_id(task.id).status.value == "complete"
 
         # Simulate command: todo incomplete <id>
         args = type('Args', (), {'id': task.id})()
@@ -117,7 +117,7 @@ class TestCLIMarkCommands:
         # Add and complete a task
         task = self.task_service.add_task("Test Title", "Test Description")
         self.task_service.mark_task_complete(task.id)
-        assert task.status.value == "complete"
+        assert self.task_repository.get_by_id(task.id).status.value == "complete"
 
         # Try to mark it complete again
         args = type('Args', (), {'id': task.id})()
@@ -165,4 +165,42 @@ class TestCLIMarkCommands:
 
         # Verify the task status is still incomplete
         updated_task = self.task_repository.get_by_id(task.id)
-        assert updated_task.status.value == "incomplete"
\ No newline at end of file
+        assert updated_task.status.value == "incomplete"
+
+    def test_complete_command_accepts_multiple_ids(self):
+        """Test that complete marks every given task in one command."""
+        tasks = [self.task_service.add_task(f"Task {i}") for i in range(3)]
+
+        # Capture output
+        old_stdout = sys.stdout
+        sys.stdout = captured_output = StringIO()
+
+        try:
+            result = self.cli_controller.handle_command(['complete'] + [task.id for task in tasks])
+            output = captured_output.getvalue()
+        finally:
+            sys.stdout = old_stdout
+
+        assert result == 0
+        for task in tasks:
+            assert f"Task {task.id} marked as complete" in output
+            assert self.task_repository.get_by_id(task.id).status.value == "complete"
+
+    def test_complete_command_with_some_missing_ids(self):
+        """Test that found tasks are updated and missing ones are reported."""
+        task = self.task_service.add_task("Task")
+
+        # Capture output
+        old_stdout = sys.stdout
+        sys.stdout = captured_output = StringIO()
+
+        try:
+            result = self.cli_controller.handle_command(['complete', task.id, 'non-existent-id'])
+            output = captured_output.getvalue()
+        finally:
+            sys.stdout = old_stdout
+
+        assert result == 1
+        assert f"Task {task.id} marked as complete" in output
+        assert "Error: Task with ID non-existent-id not found" in output
+        assert self.task_repository.get_by_id(task.id).status.value == "complete"
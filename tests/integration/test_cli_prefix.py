@@ -0,0 +1,91 @@
+"""
+Integration tests for resolving task ID prefixes in CLI commands.
+"""
+from io import StringIO
+import sys
+import pytest
+from src.entities.task import Task
+from src.use_cases.task_service import TaskService
+from src.interfaces.cli_controller import CLIController
+
+
+FIRST_ID = "3fa85f64-5717-4562-b3fc-2c963f66afa6"
+SECOND_ID = "3fa8aaaa-5717-4562-b3fc-2c963f66afa6"
+THIRD_ID = "7b000000-5717-4562-b3fc-2c963f66afa6"
+
+
+class TestCLIIdPrefixes:
+    """Integration tests for unique ID prefix resolution."""
+
+    @pytest.fixture(autouse=True)
+    def setup_controller(self, task_repository):
+        """Set up a CLI controller over tasks with known IDs for each storage backend."""
+        self.task_repository = task_repository
+        self.task_service = TaskService(self.task_repository)
+        self.cli_controller = CLIController(self.task_service)
+        for task_id in (FIRST_ID, SECOND_ID, THIRD_ID):
+            self.task_repository.add(Task(id=task_id, title=f"Task {task_id[:4]}"))
+
+    def _run(self, args):
+        """Run a command and return its exit code and output."""
+        old_stdout = sys.stdout
+        sys.stdout = captured_output = StringIO()
+        try:
+            result = self.cli_controller.handle_command(args)
+            output = captured_output.getvalue()
+        finally:
+            sys.stdout = old_stdout
+        return result, output
+
+    def test_complete_command_accepts_unique_prefix(self):
+        """Test that a unique prefix is resolved to the full ID."""
+        result, output = self._run(['complete', '3fa85'])
+
+        assert result == 0
+        assert f"Task {FIRST_ID} marked as complete" in output
+        assert self.task_repository.get_by_id(FIRST_ID).status.value == "complete"
+
+    def test_delete_command_rejects_ambiguous_prefix(self):
+        """Test that an ambiguous prefix is reported and nothing is deleted."""
+        result, output = self._run(['delete', '3fa8'])
+
+        assert result == 1
+        assert "Error: ID prefix 3fa8 matches more than one task" in output
+        assert len(self.task_service.list_tasks()) == 3
+
+    def test_short_and_empty_prefixes_change_nothing(self):
+        """Test that commands refuse an empty or too-short prefix instead of acting on the task it matches."""
+        self.task_service.delete_tasks([FIRST_ID, SECOND_ID])
+
+        for args in (['delete', ''], ['complete', '7'], ['update', '7b0', 'New title']):
+            result, output = self._run(args)
+            assert result == 1
+            assert "is too short; give at least 4 characters of the ID" in output
+        task = self.task_repository.get_by_id(THIRD_ID)
+        assert (task.title, task.status.value) == ("Task 7b00", "incomplete")
+
+    def test_update_command_with_unknown_prefix(self):
+        """Test that a prefix matching nothing reports the task as not found."""
+        result, output = self._run(['update', 'ffff', 'New title'])
+
+        assert result == 1
+        assert "Error: Task with ID ffff not found" in output
+
+    def test_list_short_shows_unique_prefixes(self):
+        """Test that list --short prints the shortest unique prefix of each ID."""
+        result, output = self._run(['list', '--short'])
+
+        assert result == 0
+        rows = [line.split()[0] for line in output.strip().split('\n')[2:]]
+        assert rows == ["3fa85", "3fa8a", "7b00"]
+
+    def test_list_short_with_nothing_to_list(self):
+        """Test that list --short on an empty store or an empty status filter reports no tasks."""
+        result, output = self._run(['list', '--short', '--status', 'done'])
+        assert result == 0
+        assert "No tasks found" in output
+
+        self.task_service.delete_tasks([FIRST_ID, SECOND_ID, THIRD_ID])
+        result, output = self._run(['list', '--short'])
+        assert result == 0
+        assert "No tasks found" in output
@@ -0,0 +1,96 @@
+"""
+Integration tests for profiling commands with --profile and --trace-alloc.
+"""
+import io
+import pstats
+import pytest
+from src.interfaces.cli_controller import CLIController
+from src.interfaces.profiling import profile_call
+from src.use_cases.task_service import TaskService
+
+
+class TestCLIProfile:
+    """Test cases for running a command under the profiler."""
+
+    @pytest.fixture(autouse=True)
+    def setup_controller(self, task_repository, tmp_path, monkeypatch):
+        """Create a controller with a few tasks, working in a temporary directory."""
+        monkeypatch.chdir(tmp_path)
+        self.tmp_path = tmp_path
+        self.task_service = TaskService(task_repository)
+        self.task_service.add_tasks([("First", None), ("Second", "Profiled")])
+        self.controller = CLIController(self.task_service)
+
+    def test_profile_saves_stats_and_prints_hotspots(self, capsys):
+        """Test that --profile runs the command, saves loadable stats and reports to stderr."""
+        assert self.controller.handle_command(["--profile", "--profile-top", "5", "list"]) == 0
+
+        captured = capsys.readouterr()
+        assert "First" in captured.out and "Second" in captured.out
+        assert "Profile written to todo-list.prof; top 5 functions by cumulative time:" in captured.err
+        assert "_handle_list" in captured.err
+        stats = pstats.Stats(str(self.tmp_path / "todo-list.prof"))
+        assert any(function == "_handle_list" for _, _, function in stats.stats)
+
+    def test_profile_output_path(self, capsys):
+        """Test that --profile-output chooses where the stats are saved."""
+        output = self.tmp_path / "complete.prof"
+
+        assert self.controller.handle_command(
+            ["--profile", "--profile-output", str(output), "complete", self.task_service.list_tasks()[0].id]
+        ) == 0
+
+        assert output.exists()
+        assert f"Profile written to {output}" in capsys.readouterr().err
+
+    def test_trace_alloc_reports_allocation_sites(self, capsys):
+        """Test that --trace-alloc alone reports allocations without saving a profile."""
+        assert self.controller.handle_command(["--trace-alloc", "add", "Traced"]) == 0
+
+        captured = capsys.readouterr()
+        assert "Task added successfully" in captured.out
+        assert "Peak traced memory:" in captured.err and "allocation sites still held" in captured.err
+        assert "Profile written" not in captured.err
+        assert not list(self.tmp_path.glob("*.prof"))
+
+    def test_report_is_printed_when_the_command_fails(self, capsys):
+        """Test that a failing command still returns its exit code and is profiled."""
+        assert self.controller.handle_command(["--profile", "update", "missing", "Title"]) == 1
+
+        captured = capsys.readouterr()
+        assert "Error:" in captured.out
+        assert "Profile written to todo-update.prof" in captured.err
+
+    def test_missing_output_directory_is_refused_before_running(self, capsys):
+        """Test that a profile path in a missing directory is reported and the command never runs."""
+        output = self.tmp_path / "missing" / "add.prof"
+
+        assert self.controller.handle_command(["--profile", "--profile-output", str(output), "add", "Unrun"]) == 1
+
+        assert f"Error: Cannot write the profile to {output}" in capsys.readouterr().out
+        assert [task.title for task in self.task_service.list_tasks()] == ["First", "Second"]
+
+    def test_failed_save_still_returns_the_result(self):
+        """Test that a profile that cannot be saved is reported without hiding the call's result."""
+        report = io.StringIO()
+
+        result = profile_call(lambda: 42, str(self.tmp_path / "missing" / "call.prof"), report=report)
+
+        assert result == 42
+        assert "Could not write the profile to" in report.getvalue()
+        assert "top 20 functions by cumulative time" in report.getvalue()
+
+    @pytest.mark.parametrize("top", ["0", "-3"])
+    def test_profile_top_must_be_positive(self, top, capsys):
+        """Test that --profile-top below 1 is a usage error."""
+        with pytest.raises(SystemExit):
+            self.controller.handle_command(["--profile", "--profile-top", top, "list"])
+
+        assert "must be at least 1" in capsys.readouterr().err
+
+    def test_global_options_build_only_the_command_parser(self):
+        """Test that options before the subcommand keep the cheap single-command parser."""
+        self.controller.parse_args(["--profile", "--profile-output", "out.prof", "list"])
+
+        assert self.controller._parser is None
+        assert list(self.controller._command_parsers) == ["list"]
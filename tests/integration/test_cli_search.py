@@ -0,0 +1,103 @@
+"""
+Integration tests for CLI search command functionality.
+"""
+from io import StringIO
+import sys
+import pytest
+from src.use_cases.task_service import TaskService
+from src.interfaces.cli_controller import CLIController
+
+
+class TestCLISearchCommand:
+    """Integration tests for the CLI search command."""
+
+    @pytest.fixture(autouse=True)
+    def setup_controller(self, task_repository):
+        """Set up a fresh CLI controller for each test and storage backend."""
+        self.task_repository = task_repository
+        self.task_service = TaskService(self.task_repository)
+        self.cli_controller = CLIController(self.task_service)
+
+    def _run(self, args):
+        """Run a command and return its exit code and output."""
+        old_stdout = sys.stdout
+        sys.stdout = captured_output = StringIO()
+        try:
+            result = self.cli_controller.handle_command(args)
+            output = captured_output.getvalue()
+        finally:
+            sys.stdout = old_stdout
+        return result, output
+
+    def test_search_command_rejects_a_limit_below_one(self, capsys):
+        """Test that --limit 0 is a usage error."""
+        with pytest.raises(SystemExit) as exit_info:
+            self.cli_controller.handle_command(['search', 'anything', '--limit', '0'])
+
+        assert exit_info.value.code == 2
+        assert "must be at least 1" in capsys.readouterr().err
+
+    def test_search_command_finds_matching_tasks(self):
+        """Test that search shows tasks whose text matches all terms."""
+        groceries = self.task_service.add_task("Buy groceries", "Milk and bread")
+        plumber = self.task_service.add_task("Call plumber")
+
+        result, output = self._run(['search', 'milk', 'groceries'])
+
+        assert result == 0
+        assert groceries.id in output
+        assert plumber.id not in output
+
+    def test_search_command_supports_or(self):
+        """Test that search returns tasks matching either side of OR."""
+        groceries = self.task_service.add_task("Buy groceries")
+        plumber = self.task_service.add_task("Call plumber")
+
+        result, output = self._run(['search', 'groceries', 'OR', 'plumber'])
+
+        assert result == 0
+        assert groceries.id in output
+        assert plumber.id in output
+
+    def test_search_command_with_no_matches(self):
+        """Test that search reports when nothing matches."""
+        self.task_service.add_task("Buy groceries")
+
+        result, output = self._run(['search', 'dentist'])
+
+        assert result == 0
+        assert "No matching tasks found." in output
+
+    def test_search_command_sees_tasks_stored_before_index_was_built(self):
+        """Test that the index is built from tasks already in the repository."""
+        task = self.task_service.add_task("Existing task")
+        self.task_service = TaskService(self.task_repository)
+        self.cli_controller = CLIController(self.task_service)
+
+        result, output = self._run(['search', 'existing'])
+
+        assert result == 0
+        assert task.id in output
+
+    def test_search_follows_writes_that_bypass_the_service(self):
+        """Test that the index picks up changes made straight through the repository, on every backend."""
+        task = self.task_service.add_task("Quarterly report")
+        assert self.task_service.search_tasks("report") == [task]
+
+        renamed = self.task_repository.get_by_id(task.id).copy()
+        renamed.title = "Quarterly budget"
+        self.task_repository.update(renamed)
+        other = self.task_service.add_task("Weekly report")
+
+        assert [found.id for found in self.task_service.search_tasks("report")] == [other.id]
+        assert [found.id for found in self.task_service.search_tasks("budget")] == [task.id]
+
+    def test_search_rebuilds_after_missing_changes(self):
+        """Test that falling behind the change feed rebuilds the index instead of losing writes."""
+        self.task_service.add_task("Seed")
+        self.task_service.search_tasks("seed")
+        self.task_service.add_tasks((f"Bulk {i}", None) for i in range(10_050))
+        self.task_service.add_task("Needle in the stack")
+
+        assert [task.title for task in self.task_service.search_tasks("needle")] == ["Needle in the stack"]
+        assert len(self.task_service.search_tasks("bulk", limit=20_000)) == 10_050
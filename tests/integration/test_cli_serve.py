@@ -0,0 +1,260 @@
+"""
+Integration tests for the CLI serve command and its thin client.
+"""
+import os
+import shutil
+import signal
+import socket
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+import pytest
+from src.use_cases.task_service import TaskService
+from src.interfaces.cli_controller import CLIController
+from src.interfaces import daemon
+from src.interfaces.daemon import (DaemonPeerError, TaskDaemon, call_daemon, daemon_supported, default_socket_path,
+                                   peer_uid, run_in_daemon, start_daemon)
+from src.config import Config
+
+
+pytestmark = pytest.mark.skipif(not daemon_supported(), reason="needs Unix sockets with file descriptor passing")
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+class TestCLIServeCommand:
+    """Integration tests for running commands through the daemon."""
+
+    @pytest.fixture(autouse=True)
+    def setup_daemon(self, task_repository, tmp_path):
+        """Serve a fresh CLI controller for each test and storage backend."""
+        self.tmp_path = tmp_path
+        self.task_repository = task_repository
+        self.task_service = TaskService(self.task_repository)
+        # Socket paths are limited to about 100 bytes, too short for pytest's tmp_path.
+        socket_dir = tempfile.mkdtemp(prefix="todo")
+        self.socket_path = os.path.join(socket_dir, "todo.sock")
+        self.daemon = TaskDaemon(CLIController(self.task_service), self.socket_path)
+        thread = threading.Thread(target=self.daemon.serve)
+        thread.start()
+        while not os.path.exists(self.socket_path):
+            time.sleep(0.01)
+        yield
+        self.daemon.stop()
+        thread.join()
+        shutil.rmtree(socket_dir)
+
+    def _call(self, *argv, stdin=""):
+        """Run a command through the daemon and return its exit code, stdout and stderr."""
+        paths = [self.tmp_path / name for name in ("stdin", "stdout", "stderr")]
+        paths[0].write_text(stdin)
+        files = [open(paths[0]), open(paths[1], "w"), open(paths[2], "w")]
+        try:
+            result = call_daemon(self.socket_path, argv, [f.fileno() for f in files], cwd=str(self.tmp_path))
+        finally:
+            for f in files:
+                f.close()
+        return result, paths[1].read_text(), paths[2].read_text()
+
+    def test_commands_share_the_resident_service(self):
+        """Test that a task added through the daemon is listed by a later client."""
+        result, output, _ = self._call("add", "Daemon task", "Kept in memory")
+        assert result == 0
+        assert "Task added successfully" in output
+
+        result, output, _ = self._call("list")
+
+        assert result == 0
+        assert "Daemon task" in output and "Kept in memory" in output
+
+    def test_exit_codes_and_errors_reach_the_client(self):
+        """Test that failures and argparse errors are reported with their exit codes."""
+        result, output, _ = self._call("complete", "missing")
+        assert result == 1
+        assert "Error: Task with ID missing not found" in output
+
+        result, _, errors = self._call("bogus")
+        assert result == 2
+        assert "invalid choice" in errors
+
+    def test_relative_paths_and_stdin_belong_to_the_client(self):
+        """Test that import reads the client's stdin and export writes relative to its directory."""
+        result, output, _ = self._call("import", "-", stdin='{"title": "From stdin"}\n')
+        assert result == 0
+        assert "Imported 1 tasks" in output
+
+        result, _, _ = self._call("export", "--output", "tasks.ndjson")
+
+        assert result == 0
+        assert "From stdin" in (self.tmp_path / "tasks.ndjson").read_text()
+
+    def test_concurrent_clients_are_serialized(self):
+        """Test that commands from many clients at once are all applied."""
+        def client(worker):
+            for i in range(10):
+                assert self._call_quiet("add", f"Task {worker}-{i}") == 0
+
+        threads = [threading.Thread(target=client, args=(worker,)) for worker in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(self.task_service.list_tasks()) == 80
+
+    def test_shell_and_serve_are_refused(self):
+        """Test that commands that must run locally are rejected by the daemon."""
+        result, _, errors = self._call("shell")
+
+        assert result == 1
+        assert "cannot run inside the daemon" in errors
+
+    def test_watch_streams_changes_while_other_commands_run(self):
+        """Test that a watching client sees other clients' changes without holding them up."""
+        read_fd, write_fd = os.pipe()
+        exit_codes = []
+        with open(os.devnull) as devnull, os.fdopen(read_fd) as changes:
+            watcher = threading.Thread(target=lambda: exit_codes.append(
+                call_daemon(self.socket_path, ["watch"], [devnull.fileno(), write_fd, devnull.fileno()])))
+            watcher.start()
+            while not self.daemon._watchers:
+                time.sleep(0.01)
+            os.close(write_fd)
+
+            assert self._call("add", "Seen by the watcher")[0] == 0
+            line = changes.readline()
+            self.daemon.stop()
+            watcher.join()
+
+        assert line.startswith(f"{self.daemon.cli_controller.task_service.changes.epoch}:1 added") and line.endswith("TODO v1 Seen by the watcher\n")
+        assert exit_codes == [0]
+
+    def test_watch_ends_when_its_client_goes_away(self):
+        """Test that interrupting a watching client stops its thread in the daemon."""
+        env = {key: value for key, value in os.environ.items() if not key.startswith("TODO_")}
+        env.update(TODO_DAEMON="1", TODO_SOCKET=self.socket_path)
+        client = subprocess.Popen([sys.executable, "-m", "src.main", "watch", "--format", "ndjson"],
+                                  cwd=ROOT, env=env, stdout=subprocess.PIPE, text=True)
+        while not self.daemon._watchers:
+            time.sleep(0.01)
+        thread = self.daemon._watchers[0]
+
+        self._call("add", "Interrupted")
+        line = client.stdout.readline()
+        client.send_signal(signal.SIGINT)
+
+        assert client.wait(timeout=10) == 0
+        client.stdout.close()
+        assert '"change": "added"' in line
+        thread.join(timeout=10)
+        assert not thread.is_alive()
+
+    def _call_quiet(self, *argv):
+        """Run a command through the daemon, discarding its output."""
+        with open(os.devnull, "r+") as devnull:
+            return call_daemon(self.socket_path, argv, [devnull.fileno()] * 3)
+
+
+    def test_client_refuses_a_daemon_of_another_user(self, monkeypatch):
+        """Test that the client sends nothing to a socket held by another user."""
+        monkeypatch.setattr(daemon, "peer_uid", lambda connection: os.getuid() + 1)
+
+        with pytest.raises(DaemonPeerError):
+            self._call("add", "Leaked")
+
+        monkeypatch.undo()
+        assert self.task_repository.get_all() == []
+
+    def test_daemon_refuses_a_client_of_another_user(self, monkeypatch):
+        """Test that the daemon closes a connection from another user without reading its request."""
+        monkeypatch.setattr(daemon, "peer_uid", lambda connection: os.getuid() + 1)
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client.connect(self.socket_path)
+        payload = "\0".join([str(self.tmp_path), "add", "Intruder"]).encode("utf-8")
+        with client, open(os.devnull, "r+") as devnull:
+            try:
+                socket.send_fds(client, [struct.pack("!I", len(payload)) + payload], [devnull.fileno()] * 3)
+                answer = client.recv(1)
+            except (BrokenPipeError, ConnectionResetError):
+                # The daemon may hang up before the request is even sent.
+                answer = b""
+            assert answer == b""
+
+        monkeypatch.undo()
+        assert self.task_repository.get_all() == []
+
+
+class TestDaemonClient:
+    """Tests for the thin client in src.main."""
+
+    def test_peer_uid_is_the_current_user(self):
+        """Test that the peer of a local socket pair runs as this user, where the platform can tell."""
+        left, right = socket.socketpair(socket.AF_UNIX)
+        with left, right:
+            assert peer_uid(left) in (os.getuid(), None)
+
+    def test_default_socket_is_in_a_private_directory(self, tmp_path, monkeypatch):
+        """Test that the default socket path lies in a directory only this user can enter."""
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+
+        path = default_socket_path(Config(backend="sqlite", data_path=str(tmp_path / "todo.db")))
+
+        directory = os.path.dirname(path)
+        assert directory == str(tmp_path / "todo")
+        assert os.stat(directory).st_mode & 0o777 == 0o700
+
+    def test_shared_socket_directory_is_refused(self, tmp_path, monkeypatch, capsys):
+        """Test that a socket directory others can enter is an error rather than a place to talk."""
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        os.mkdir(tmp_path / "todo", 0o777)
+        os.chmod(tmp_path / "todo", 0o777)
+
+        assert run_in_daemon(Config(daemon=True), ["list"]) == 1
+        assert "must be a directory owned by you with mode 0700" in capsys.readouterr().err
+
+    def test_stale_socket_owned_by_someone_else_is_an_error(self, tmp_path, monkeypatch):
+        """Test that failing to remove a stale socket is reported instead of ignored."""
+        stale = tmp_path / "stale.sock"
+        stale.write_text("")
+
+        def refuse(path):
+            raise PermissionError(1, "Operation not permitted", path)
+
+        monkeypatch.setattr(daemon.os, "unlink", refuse)
+        with pytest.raises(PermissionError, match="Cannot remove the stale daemon socket"):
+            start_daemon(Config(), str(stale))
+
+    def test_call_daemon_returns_none_without_a_daemon(self, tmp_path):
+        """Test that the client reports when nothing is listening."""
+        assert call_daemon(str(tmp_path / "missing.sock"), ["list"]) is None
+
+    def test_main_auto_starts_a_daemon_that_keeps_state(self):
+        """Test that the first client starts a daemon and a second one sees its in-memory store."""
+        socket_dir = tempfile.mkdtemp(prefix="todo")
+        socket_path = os.path.join(socket_dir, "todo.sock")
+        env = {key: value for key, value in os.environ.items() if not key.startswith("TODO_")}
+        env.update(TODO_BACKEND="memory", TODO_DAEMON="1", TODO_SOCKET=socket_path)
+
+        def run(*argv):
+            return subprocess.run([sys.executable, "-m", "src.main", *argv], cwd=ROOT, env=env,
+                                  capture_output=True, text=True)
+
+        try:
+            assert run("add", "Remembered").returncode == 0
+            listing = run("list")
+            assert listing.returncode == 0
+            assert "Remembered" in listing.stdout
+        finally:
+            if os.path.exists(socket_path):
+                probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                probe.connect(socket_path)
+                pid, _, _ = struct.unpack("3i", probe.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, 12))
+                probe.close()
+                os.kill(pid, 15)
+                while os.path.exists(socket_path):
+                    time.sleep(0.05)
+            shutil.rmtree(socket_dir)
@@ -0,0 +1,80 @@
+"""
+Integration tests for the CLI shell command.
+"""
+from io import StringIO
+import sys
+import pytest
+from src.use_cases.task_service import TaskService
+from src.interfaces.cli_controller import CLIController
+from src.interfaces.shell import TaskShell
+
+
+class TestCLIShellCommand:
+    """Integration tests for the interactive shell."""
+
+    @pytest.fixture(autouse=True)
+    def setup_controller(self, task_repository):
+        """Set up a fresh CLI controller for each test and storage backend."""
+        self.task_repository = task_repository
+        self.task_service = TaskService(self.task_repository)
+        self.cli_controller = CLIController(self.task_service)
+
+    def _run_shell(self, script):
+        """Feed a script to a shell and return its exit code and output."""
+        old_stdout = sys.stdout
+        sys.stdout = captured_output = StringIO()
+        try:
+            result = TaskShell(self.cli_controller, stdin=StringIO(script)).run()
+            output = captured_output.getvalue()
+        finally:
+            sys.stdout = old_stdout
+        return result, output
+
+    def test_shell_runs_commands_against_one_service(self):
+        """Test that tasks added in the shell are visible to later commands."""
+        result, output = self._run_shell('add "Buy milk" "Semi-skimmed"\nadd Walk\n\nlist\n')
+
+        assert result == 0
+        assert output.count("Task added successfully") == 2
+        assert "Buy milk" in output and "Semi-skimmed" in output and "Walk" in output
+        assert len(self.task_service.list_tasks()) == 2
+
+    def test_shell_survives_errors_and_stops_at_exit(self):
+        """Test that bad lines are reported and that nothing after exit runs."""
+        task = self.task_service.add_task("Task")
+
+        result, output = self._run_shell(f'complete {task.id}\nbogus\nadd "unclosed\nexit\nadd Ignored\n')
+
+        assert result == 1
+        assert f"Task {task.id} marked as complete" in output
+        assert "Error: No closing quotation" in output
+        assert [t.title for t in self.task_service.list_tasks()] == ["Task"]
+
+    def test_shell_keeps_running_after_an_unexpected_error(self):
+        """Test that an exception escaping a command is printed and later commands still run."""
+        def broken_export(*args, **kwargs):
+            raise OSError("Disk on fire")
+
+        self.task_service.iter_tasks = broken_export
+        result, output = self._run_shell("export\nadd After\n")
+
+        assert result == 0
+        assert "Error: Disk on fire" in output
+        assert "Task added successfully" in output
+
+    def test_shell_refuses_to_nest(self):
+        """Test that the shell command is rejected inside the shell."""
+        result, output = self._run_shell("shell\n")
+
+        assert result == 1
+        assert "Error: Already in the shell" in output
+
+    def test_completions_offer_commands_options_and_ids(self):
+        """Test tab completion of command names, options and task IDs."""
+        task = self.task_service.add_task("Task")
+        shell = TaskShell(self.cli_controller, stdin=StringIO())
+
+        assert shell.completions("comp", "comp") == ["complete"]
+        assert shell.completions("list --st", "--st") == ["--status"]
+        assert shell.completions(f"delete {task.id[:2]}", task.id[:2]) == [task.id]
+        assert shell.completions(f"update {task.id} ", "") == []
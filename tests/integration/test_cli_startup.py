@@ -0,0 +1,55 @@
+"""
+Integration tests for CLI cold-start cost.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# Modules that `todo list` must not import: storage backends and the
+# dependencies of commands and formats that were not requested.
+LAZY_MODULES = (
+    "sqlite3",
+    "mmap",
+    "json",
+    "csv",
+    "uuid",
+    "base64",
+    "readline",
+    "src.use_cases.search_index",
+    "src.interfaces.task_export",
+    "src.interfaces.task_import",
+    "src.interfaces.shell",
+    "src.interfaces.columnar_task_repository",
+    "src.interfaces.log_task_repository",
+    "src.interfaces.sqlite_task_repository",
+    "src.interfaces.mmap_task_repository",
+)
+
+
+def _run(*args):
+    """Run the interpreter from the repository root with an empty in-memory store."""
+    env = {key: value for key, value in os.environ.items()
+           if not key.startswith("TODO_") and key != "PYTHONDONTWRITEBYTECODE"}
+    env["TODO_BACKEND"] = "memory"
+    return subprocess.run([sys.executable, *args], cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+
+
+class TestCLIStartup:
+    """Startup cost checks for `todo list` on an empty store.
+
+    Startup is checked through the modules it imports rather than its wall
+    time, which depends on the machine and its load.
+    """
+
+    def test_list_imports_only_what_it_needs(self):
+        """Test that listing does not import backends or other commands' dependencies."""
+        result = _run("-X", "importtime", "-m", "src.main", "list")
+
+        imported = {line.rsplit("|", 1)[1].strip() for line in result.stderr.splitlines() if "|" in line}
+        assert "No tasks found." in result.stdout
+        assert "src.interfaces.cli_controller" in imported
+        assert sorted(imported.intersection(LAZY_MODULES)) == []
@@ -0,0 +1,82 @@
+"""
+Integration tests for the stats command and the metrics configuration.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+from src.config import Config
+from src.interfaces.cli_controller import CLIController
+from src.interfaces.task_repository import TaskRepository
+from src.use_cases.task_metrics import OperationMetrics
+from src.use_cases.task_service import TaskService
+
+
+class TestCLIStats:
+    """Test cases for printing the metrics a service has recorded."""
+
+    @pytest.fixture(autouse=True)
+    def setup_controller(self, task_repository):
+        """Create a controller over a service that records metrics, for each storage backend."""
+        self.task_service = TaskService(task_repository, metrics=OperationMetrics())
+        self.controller = CLIController(self.task_service)
+
+    def test_table_lists_calls_and_errors(self, capsys):
+        """Test that the table shows each operation's calls and names its errors."""
+        self.controller.handle_command(["add", "Counted"])
+        self.controller.handle_command(["update", "f" * 32, "Missing"])
+        capsys.readouterr()
+
+        assert self.controller.handle_command(["stats"]) == 0
+
+        output = capsys.readouterr().out
+        rows = {line.split()[0]: line.split() for line in output.splitlines()[1:] if line and line[0] != " "}
+        assert rows["add_task"][1:3] == ["1", "0"]
+        assert rows["resolve_task_id"][1:3] == ["1", "1"]
+        assert "resolve_task_id: 1 not_found" in output
+
+    def test_prometheus_format(self, capsys):
+        """Test that the Prometheus format has counters and a cumulative histogram per operation."""
+        self.controller.handle_command(["add", "Exported"])
+        capsys.readouterr()
+
+        assert self.controller.handle_command(["stats", "--format", "prometheus"]) == 0
+
+        lines = capsys.readouterr().out.splitlines()
+        assert "# TYPE todo_operation_duration_seconds histogram" in lines
+        assert 'todo_operation_calls_total{operation="add_task"} 1' in lines
+        assert 'todo_operation_duration_seconds_bucket{operation="add_task",le="+Inf"} 1' in lines
+        assert 'todo_operation_duration_seconds_count{operation="add_task"} 1' in lines
+
+    def test_empty_metrics(self, capsys):
+        """Test that stats before any operation says so."""
+        assert self.controller.handle_command(["stats"]) == 0
+        assert "No operations recorded yet" in capsys.readouterr().out
+
+
+class TestStatsConfiguration:
+    """Test cases for turning metrics on and off."""
+
+    def test_stats_without_metrics_is_refused(self, capsys):
+        """Test that stats explains how to turn metrics on."""
+        controller = CLIController(TaskService(TaskRepository()))
+
+        assert controller.handle_command(["stats"]) == 1
+        assert "TODO_METRICS=1" in capsys.readouterr().out
+
+    def test_metrics_flag_from_environment(self):
+        """Test that TODO_METRICS turns metrics on and defaults to off."""
+        assert Config.from_env({}).metrics is False
+        assert Config.from_env({"TODO_METRICS": "1"}).metrics is True
+        assert Config.from_env({"TODO_METRICS": "no"}).metrics is False
+
+    def test_one_shot_stats_points_to_the_daemon(self):
+        """Test that stats outside a daemon or shell says where its metrics live instead of showing none."""
+        env = {key: value for key, value in os.environ.items() if not key.startswith("TODO_")}
+        env.update(TODO_BACKEND="memory", TODO_METRICS="1")
+        result = subprocess.run([sys.executable, "-m", "src.main", "stats"], cwd=Path(__file__).resolve().parents[2],
+                                env=env, capture_output=True, text=True)
+
+        assert result.returncode == 1
+        assert "metrics of a running daemon" in result.stdout
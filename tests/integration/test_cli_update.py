@@ -5,7 +5,6 @@ from io import StringIO
 import sys
 from unittest.mock import patch
 import pytest
-from src.interfaces.task_repository import TaskRepository
 from src.use_cases.task_service import TaskService
 from src.interfaces.cli_controller import CLIController
 
@@ -13,9 +12,10 @@ from src.interfaces.cli_controller import CLIController
 class TestCLIUpdateCommand:
     """Integration tests for the CLI update command."""
 
-    def setup_method(self):
-        """Set up a fresh CLI controller for each test."""
-        self.task_repository = TaskRepository()
+    @pytest.fixture(autouse=True)
+    def setup_controller(self, task_repository):
+        """Set up a fresh CLI controller for each test and storage backend."""
+        self.task_repository = task_repository
         self.task_service = TaskService(self.task_repository)
         self.cli_controller = CLIController(self.task_service)
 
@@ -142,7 +142,7 @@ class TestCLIUpdateCommand:
         self.task_service.mark_task_complete(original_task.id)
 
         # Verify it's complete
-        assert original_task.status.value == "complete"
+        assert self.task_repository.get_by_id(original_task.id).status.value == "complete"
 
         # Simulate command: todo update <id> "New Title"
         args = type('Args', (), {
@@ -0,0 +1,164 @@
+"""
+Integration tests for the repository change feed and the watch command on every backend.
+"""
+import json
+import threading
+from io import StringIO
+import pytest
+from src.entities.task import TaskStatus
+from src.use_cases.task_service import TaskService
+from src.interfaces.change_feed import ChangeKind, StaleCursorError
+from src.interfaces.cli_controller import CLIController
+from src.interfaces.log_task_repository import LogTaskRepository
+from src.interfaces.task_repository import TaskRepository
+
+
+class TestChangeFeed:
+    """Change events published by all storage backends."""
+
+    @pytest.fixture(autouse=True)
+    def setup_service(self, task_repository):
+        """Create a service for each test and storage backend and start following its changes."""
+        self.task_repository = task_repository
+        self.task_service = TaskService(self.task_repository)
+        self.subscription = self.task_service.changes.subscribe()
+
+    def _changes(self):
+        """The events published since the last call, as (kind, task ID, version) tuples."""
+        return [(event.kind, event.task_id, event.task and event.task.version) for event in self.subscription.poll()]
+
+    def test_single_writes_are_published_in_order(self):
+        """Test that adding, updating, completing and deleting a task publish one event each."""
+        task = self.task_service.add_task("Followed")
+        self.task_service.update_task(task.id, title="Renamed")
+        self.task_service.mark_task_complete(task.id)
+        self.task_service.delete_task(task.id)
+
+        assert self._changes() == [
+            (ChangeKind.ADDED, task.id, 1),
+            (ChangeKind.UPDATED, task.id, 2),
+            (ChangeKind.UPDATED, task.id, 3),
+            (ChangeKind.DELETED, task.id, None),
+        ]
+
+    def test_events_carry_the_stored_state(self):
+        """Test that an event shows the task as written, not as it is later."""
+        task = self.task_service.add_task("Before")
+        self.task_service.update_task(task.id, title="After")
+
+        added, updated = self.subscription.poll()
+
+        assert (added.task.title, updated.task.title) == ("Before", "After")
+        assert updated.task.status == TaskStatus.INCOMPLETE
+
+    def test_bulk_writes_publish_every_task(self):
+        """Test that batch adds, status changes and deletes publish an event per task."""
+        tasks = self.task_service.add_tasks([("One", None), ("Two", None)])
+        ids = [task.id for task in tasks]
+        self.task_service.mark_complete_many(ids)
+        self.task_service.delete_tasks(ids + ["missing"])
+
+        changes = self._changes()
+
+        # Within a batch the order is up to the backend; the batches themselves come out in order.
+        assert [sorted(changes[start:start + 2]) for start in (0, 2, 4)] == [
+            sorted((ChangeKind.ADDED, task_id, 1) for task_id in ids),
+            sorted((ChangeKind.UPDATED, task_id, 2) for task_id in ids),
+            sorted((ChangeKind.DELETED, task_id, None) for task_id in ids),
+        ]
+        assert len(changes) == 6
+
+    def test_failed_writes_publish_nothing(self):
+        """Test that writes to missing tasks leave the feed untouched."""
+        self.task_service.update_task("missing", title="Nobody")
+        self.task_service.delete_task("missing")
+
+        assert self._changes() == []
+
+    def test_watch_follows_changes_until_stopped(self):
+        """Test that the watch loop prints changes made by another thread, resuming from --after."""
+        self.task_service.add_task("Before watching")
+        controller = CLIController(self.task_service)
+        epoch = self.task_service.changes.epoch
+        subscription = controller.subscribe(controller.parse_args(["watch", "--after", f"{epoch}:0"]))
+        out = StringIO()
+        done = threading.Event()
+        watcher = threading.Thread(target=controller.follow_changes, args=(subscription, "text", out, done.is_set))
+        watcher.start()
+
+        task = self.task_service.add_task("While watching")
+        self.task_service.delete_task(task.id)
+        done.set()
+        watcher.join()
+
+        lines = out.getvalue().splitlines()
+        assert lines[0].startswith(f"{epoch}:1 added") and lines[0].endswith("TODO v1 Before watching")
+        assert lines[1] == f"{epoch}:2 added   {task.id} TODO v1 While watching"
+        assert lines[2] == f"{epoch}:3 deleted {task.id}"
+
+    def test_watch_prints_ndjson(self):
+        """Test that --format ndjson prints one object per change with the full task."""
+        task = self.task_service.add_task("Machine readable", "Details")
+        controller = CLIController(self.task_service)
+        epoch = self.task_service.changes.epoch
+        subscription = controller.subscribe(
+            controller.parse_args(["watch", "--after", f"{epoch}:0", "--format", "ndjson"]))
+        out = StringIO()
+
+        assert controller.follow_changes(subscription, "ndjson", out, iter([False, True]).__next__) == 0
+
+        assert json.loads(out.getvalue()) == {
+            "cursor": f"{epoch}:1", "seq": 1, "change": "added", "id": task.id,
+            "task": {"id": task.id, "title": "Machine readable", "description": "Details",
+                     "status": "incomplete", "version": 1},
+        }
+
+    def test_watch_reports_a_position_it_cannot_resume_from(self):
+        """Test that resuming from a change the feed has not reached is an error."""
+        controller = CLIController(self.task_service)
+        out = StringIO()
+
+        epoch = self.task_service.changes.epoch
+        subscription = controller.subscribe(controller.parse_args(["watch", "--after", f"{epoch}:5"]))
+
+        exit_code = controller.follow_changes(subscription, "text", out, lambda: False)
+
+        assert exit_code == 1
+        assert "Error: Change 5 has not happened yet" in out.getvalue()
+
+    def test_watch_refuses_a_cursor_from_another_feed(self):
+        """Test that a cursor from an earlier run of the feed, or no cursor at all, is refused up front."""
+        controller = CLIController(self.task_service)
+
+        with pytest.raises(StaleCursorError, match="from another run of the change feed"):
+            controller.subscribe(controller.parse_args(["watch", "--after", "0000beef:5"]))
+        with pytest.raises(ValueError, match="expected EPOCH:SEQ"):
+            controller.subscribe(controller.parse_args(["watch", "--after", "5"]))
+
+
+class TestChangeFeedStartup:
+    """The feed only records writes made after something asked for it."""
+
+    def test_reopened_log_does_not_replay_into_the_feed(self, tmp_path):
+        """Test that restoring a store at startup publishes nothing, and a fresh feed starts at 1."""
+        repository = LogTaskRepository(str(tmp_path / "todo.log"))
+        service = TaskService(repository)
+        task = service.add_task("Persisted")
+        service.delete_task(service.add_task("Removed").id)
+        repository.close()
+
+        reopened = LogTaskRepository(str(tmp_path / "todo.log"))
+        feed = reopened.changes
+        TaskService(reopened).mark_task_complete(task.id)
+        reopened.close()
+
+        assert [(event.seq, event.kind, event.task_id) for event in feed.read()] == [
+            (1, ChangeKind.UPDATED, task.id)
+        ]
+
+    def test_in_process_watch_is_refused(self, capsys):
+        """Test that watch without the daemon explains why it would never see anything."""
+        controller = CLIController(TaskService(TaskRepository()))
+
+        assert controller.handle_command(["watch"]) == 1
+        assert "run it with TODO_DAEMON=1" in capsys.readouterr().out
@@ -0,0 +1,312 @@
+"""
+Integration tests for the asyncio HTTP API.
+"""
+import asyncio
+import json
+import threading
+import pytest
+from src.entities.task import TaskStatus
+from src.use_cases.task_service import TaskService
+from src.interfaces.http_api import TaskHttpApi, _response, todo_json
+from src.use_cases.task_metrics import OperationMetrics
+
+
+def _request(method, target, body=None, headers=""):
+    """Encode one HTTP/1.1 request, with a JSON body when given."""
+    data = b"" if body is None else json.dumps(body).encode("utf-8")
+    head = f"{method} {target} HTTP/1.1\r\nHost: localhost\r\n{headers}Content-Length: {len(data)}\r\n\r\n"
+    return head.encode("latin-1") + data
+
+
+async def _read_response(reader):
+    """Read one response, with a fixed-length or chunked body; return its status, headers and decoded JSON body."""
+    lines = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+    status = int(lines[0].split(" ")[1])
+    headers = {}
+    for line in lines[1:]:
+        if line:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+    if headers.get("transfer-encoding") == "chunked":
+        body = b""
+        while True:
+            size = int(await reader.readuntil(b"\r\n"), 16)
+            body += (await reader.readexactly(size + 2))[:-2]
+            if not size:
+                break
+    else:
+        body = await reader.readexactly(int(headers["content-length"]))
+    return status, headers, json.loads(body) if body else None
+
+
+class TestHttpApi:
+    """Integration tests for the /api/todos contract, keep-alive and pipelining."""
+
+    @pytest.fixture(autouse=True)
+    def setup_api(self, task_repository):
+        """Create a service and API for each test and storage backend."""
+        self.task_repository = task_repository
+        self.task_service = TaskService(self.task_repository)
+        self.api = TaskHttpApi(self.task_service)
+
+    def _exchange(self, *requests):
+        """Send requests on one connection and return their responses in order."""
+        async def run():
+            server = await self.api.start("127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                responses = []
+                for request in requests:
+                    writer.write(request)
+                    responses.append(await _read_response(reader))
+                writer.close()
+                await writer.wait_closed()
+            return responses
+        return asyncio.run(run())
+
+    def test_post_then_get_round_trip(self):
+        """Test that a created todo is returned in the front end's shape and then listed."""
+        (status, _, created), (_, _, listing) = self._exchange(
+            _request("POST", "/api/todos", {"title": "Write API", "description": "Over asyncio"}),
+            _request("GET", "/api/todos"),
+        )
+
+        assert status == 201
+        assert created["success"] is True
+        todo = created["data"]
+        assert todo["title"] == "Write API"
+        assert todo["description"] == "Over asyncio"
+        assert todo["completed"] is False
+        assert listing == {"success": True, "data": [todo]}
+
+    def test_post_validation_errors(self):
+        """Test that a missing title and malformed JSON are rejected like the web route does."""
+        missing, malformed = self._exchange(
+            _request("POST", "/api/todos", {"description": "No title"}),
+            b"POST /api/todos HTTP/1.1\r\nContent-Length: 5\r\n\r\n{oops",
+        )
+
+        assert missing[0] == 400 and missing[2] == {"success": False, "error": "Title is required"}
+        assert malformed[0] == 400 and malformed[2] == {"success": False, "error": "Invalid request body"}
+
+    def test_non_string_fields_are_rejected(self):
+        """Test that titles and descriptions of other JSON types, and an emptied title, give 400 and store nothing."""
+        (_, _, created), = self._exchange(_request("POST", "/api/todos", {"title": "Kept"}))
+        todo_id = created["data"]["id"]
+
+        responses = self._exchange(
+            _request("POST", "/api/todos", {"title": ["a"]}),
+            _request("POST", "/api/todos", {"title": "Typed", "description": 5}),
+            _request("PUT", "/api/todos", {"id": todo_id, "title": ["a"]}),
+            _request("PUT", "/api/todos", {"id": todo_id, "title": ""}),
+            _request("PUT", "/api/todos", {"id": todo_id, "description": {"a": 1}}),
+            _request("PUT", "/api/todos", {"id": todo_id, "completed": "yes"}),
+        )
+
+        assert [status for status, _, _ in responses] == [400] * 6
+        assert responses[2][2]["error"] == "Title must be a non-empty string"
+        assert responses[4][2]["error"] == "Description must be a string"
+        assert [task.title for task in self.task_repository.get_all()] == ["Kept"]
+        assert self.task_repository.get_by_id(todo_id).version == 1
+
+    def test_unexpected_errors_are_answered_with_500(self, monkeypatch):
+        """Test that a failure outside the expected errors still gets a response on a live connection."""
+        def fail(*args, **kwargs):
+            raise RuntimeError("storage exploded")
+
+        monkeypatch.setattr(self.task_service, "add_task", fail)
+        failed, listing = self._exchange(
+            _request("POST", "/api/todos", {"title": "Boom"}),
+            _request("GET", "/api/todos"),
+        )
+
+        assert failed[0] == 500 and failed[2] == {"success": False, "error": "Internal server error"}
+        assert listing[0] == 200
+
+    def test_put_updates_fields_and_completion(self):
+        """Test that PUT changes the title and marks the todo completed."""
+        task = self.task_service.add_task("Old title")
+
+        ((status, _, updated),) = self._exchange(
+            _request("PUT", "/api/todos", {"id": task.id, "title": "New title", "completed": True}),
+        )
+
+        assert status == 200
+        assert updated["data"]["title"] == "New title"
+        assert updated["data"]["completed"] is True
+        stored = self.task_repository.get_by_id(task.id)
+        assert stored.title == "New title"
+        assert stored.status == TaskStatus.COMPLETE
+
+    def test_put_and_delete_unknown_todo(self):
+        """Test that unknown IDs give 404 and a missing DELETE id gives 400."""
+        put, delete, no_id = self._exchange(
+            _request("PUT", "/api/todos", {"id": "missing", "title": "x"}),
+            _request("DELETE", "/api/todos?id=missing"),
+            _request("DELETE", "/api/todos"),
+        )
+
+        assert put[0] == 404 and put[2]["error"] == "Todo not found"
+        assert delete[0] == 404 and delete[2]["error"] == "Todo not found"
+        assert no_id[0] == 400 and no_id[2]["error"] == "ID is required"
+
+    def test_delete_removes_todo(self):
+        """Test that DELETE removes the todo and reports success."""
+        task = self.task_service.add_task("Remove me")
+
+        ((status, _, body),) = self._exchange(_request("DELETE", f"/api/todos?id={task.id}"))
+
+        assert status == 200
+        assert body == {"success": True, "message": "Todo deleted successfully"}
+        assert self.task_repository.get_by_id(task.id) is None
+
+    def test_unknown_path_and_method(self):
+        """Test that other paths give 404 and other methods give 405 with an Allow header."""
+        missing, patch = self._exchange(_request("GET", "/api/other"), _request("PATCH", "/api/todos"))
+
+        assert missing[0] == 404
+        assert patch[0] == 405
+        assert "PUT" in patch[1]["allow"]
+
+    def test_metrics_need_metrics_on(self):
+        """Test that /metrics is a 404 when the service records no metrics."""
+        (status, _, payload), = self._exchange(_request("GET", "/metrics"))
+
+        assert status == 404
+        assert "TODO_METRICS=1" in payload["error"]
+
+    def test_metrics_are_served_as_prometheus_text(self):
+        """Test that /metrics counts API calls and is sent with the Prometheus content type."""
+        api = TaskHttpApi(TaskService(self.task_repository, metrics=OperationMetrics()))
+        api.handle("POST", "/api/todos", b'{"title": "Counted"}')
+        _, listing = api.handle("GET", "/api/todos", b"")
+        assert json.loads(b"".join(listing))["data"][0]["title"] == "Counted"
+
+        status, text = api.handle("GET", "/metrics", b"")
+        head, _, body = _response(status, text, True).partition(b"\r\n\r\n")
+
+        assert status == 200
+        assert b"Content-Type: text/plain; version=0.0.4" in head
+        lines = body.decode("utf-8").splitlines()
+        assert 'todo_operation_calls_total{operation="add_task"} 1' in lines
+        assert 'todo_operation_calls_total{operation="list_tasks_page"} 1' in lines
+
+    def test_pipelined_requests_are_answered_in_order(self):
+        """Test that requests written back to back on one connection get responses in order."""
+        async def run():
+            server = await self.api.start("127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.write(b"".join(_request("POST", "/api/todos", {"title": f"Task {i}"}) for i in range(20))
+                             + _request("GET", "/api/todos"))
+                responses = [await _read_response(reader) for _ in range(21)]
+                writer.close()
+                await writer.wait_closed()
+            return responses
+
+        responses = asyncio.run(run())
+
+        assert [status for status, _, _ in responses] == [201] * 20 + [200]
+        assert [body["data"]["title"] for _, _, body in responses[:20]] == [f"Task {i}" for i in range(20)]
+        assert len(responses[-1][2]["data"]) == 20
+        assert all(headers["connection"] == "keep-alive" for _, headers, _ in responses)
+
+    def test_connection_close_is_honoured(self):
+        """Test that the server closes the connection after a Connection: close request."""
+        async def run():
+            server = await self.api.start("127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.write(_request("GET", "/api/todos", headers="Connection: close\r\n"))
+                response = await _read_response(reader)
+                remainder = await reader.read()
+                writer.close()
+                await writer.wait_closed()
+            return response, remainder
+
+        (status, headers, _), remainder = asyncio.run(run())
+
+        assert status == 200
+        assert headers["connection"] == "close"
+        assert remainder == b""
+
+    def test_idle_connection_is_closed(self, monkeypatch):
+        """Test that a keep-alive connection without requests is closed after the timeout."""
+        monkeypatch.setattr("src.interfaces.http_api.KEEP_ALIVE_TIMEOUT", 0.1)
+
+        async def run():
+            server = await self.api.start("127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.write(_request("GET", "/api/todos"))
+                response = await _read_response(reader)
+                remainder = await asyncio.wait_for(reader.read(), 5)
+                writer.close()
+                await writer.wait_closed()
+            return response, remainder
+
+        (status, _, _), remainder = asyncio.run(run())
+
+        assert status == 200
+        assert remainder == b""
+
+    def test_listing_is_streamed_a_page_at_a_time(self, monkeypatch):
+        """Test that GET sends every todo in order as a chunked body built from several pages."""
+        monkeypatch.setattr("src.interfaces.http_api.LIST_CHUNK_SIZE", 2)
+        tasks = self.task_service.add_tasks([(f"Task {i}", None) for i in range(5)])
+
+        ((status, headers, listing),) = self._exchange(_request("GET", "/api/todos"))
+
+        assert status == 200
+        assert headers["transfer-encoding"] == "chunked" and "content-length" not in headers
+        assert listing == {"success": True, "data": [todo_json(task) for task in tasks]}
+
+    def test_service_calls_run_off_the_event_loop_thread(self, monkeypatch):
+        """Test that service calls run on the worker thread, leaving the event loop free for other connections."""
+        threads = []
+        add_task = self.task_service.add_task
+
+        def recording_add_task(*args):
+            threads.append(threading.current_thread())
+            return add_task(*args)
+
+        monkeypatch.setattr(self.task_service, "add_task", recording_add_task)
+        ((status, _, _),) = self._exchange(_request("POST", "/api/todos", {"title": "Threaded"}))
+
+        assert status == 201
+        assert threads and threads[0] is not threading.main_thread()
+
+    def test_listing_that_fails_part_way_closes_the_connection(self, monkeypatch):
+        """Test that a listing failing after its status line was sent ends the connection instead of hanging."""
+        monkeypatch.setattr("src.interfaces.http_api.LIST_CHUNK_SIZE", 1)
+        monkeypatch.setattr("src.interfaces.http_api.STREAM_CHUNK_BYTES", 1)
+        self.task_service.add_tasks([("Task 1", None), ("Task 2", None)])
+        list_tasks_page = self.task_service.list_tasks_page
+
+        def failing_after_first_page(limit, after=None, status=None):
+            if after is not None:
+                raise RuntimeError("storage exploded")
+            return list_tasks_page(limit, after, status)
+
+        monkeypatch.setattr(self.task_service, "list_tasks_page", failing_after_first_page)
+
+        with pytest.raises(asyncio.IncompleteReadError):
+            self._exchange(_request("GET", "/api/todos"))
+
+    def test_listing_that_fails_before_sending_is_answered_with_500(self, monkeypatch):
+        """Test that a listing whose first chunk cannot be built is still answered with a 500."""
+        def fail(*args, **kwargs):
+            raise RuntimeError("storage exploded")
+
+        monkeypatch.setattr(self.task_service, "list_tasks_page", fail)
+        failed, created = self._exchange(
+            _request("GET", "/api/todos"),
+            _request("POST", "/api/todos", {"title": "Still served"}),
+        )
+
+        assert failed[0] == 500 and failed[2] == {"success": False, "error": "Internal server error"}
+        assert created[0] == 201
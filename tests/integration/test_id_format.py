@@ -0,0 +1,42 @@
+"""
+Integration tests for choosing the task ID format through the environment.
+"""
+import json
+import os
+import subprocess
+import sys
+import uuid
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+class TestIdFormat:
+    """End-to-end checks of TODO_ID_FORMAT."""
+
+    def _run(self, tmp_path, id_format, *args):
+        """Run the CLI against a log store in the temporary directory."""
+        env = {key: value for key, value in os.environ.items() if not key.startswith("TODO_")}
+        env.update(TODO_BACKEND="log", TODO_DATA_PATH=str(tmp_path / "todo.log"), TODO_ID_FORMAT=id_format)
+        return subprocess.run([sys.executable, "-m", "src.main", *args], cwd=ROOT, env=env,
+                              capture_output=True, text=True)
+
+    def test_uuid7_ids_follow_creation_order(self, tmp_path):
+        """Test that tasks added with uuid7 get version 7 IDs that sort in the order they were added."""
+        for title in ("First", "Second", "Third"):
+            assert self._run(tmp_path, "uuid7", "add", title).returncode == 0
+
+        result = self._run(tmp_path, "uuid7", "list", "--format", "json")
+        tasks = json.loads(result.stdout)
+
+        assert [task["title"] for task in tasks] == ["First", "Second", "Third"]
+        assert all(uuid.UUID(task["id"]).version == 7 for task in tasks)
+        assert [task["id"] for task in tasks] == sorted(task["id"] for task in tasks)
+
+    def test_unknown_format_is_reported(self, tmp_path):
+        """Test that an unknown ID format fails with an error instead of starting."""
+        result = self._run(tmp_path, "sequential", "add", "Task")
+
+        assert result.returncode == 1
+        assert "Error: Unknown ID format: sequential" in result.stdout
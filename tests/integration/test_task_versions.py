@@ -0,0 +1,122 @@
+"""
+Integration tests for task versions and compare-and-set updates on every backend.
+"""
+import sys
+from io import StringIO
+import pytest
+from src.entities.task import Task, TaskStatus
+from src.use_cases.task_service import TaskService
+from src.interfaces.cli_controller import CLIController
+from src.interfaces.http_api import TaskHttpApi
+from src.interfaces.repository_factory import create_repository
+from src.interfaces.task_repository import VersionConflictError
+
+
+class TestTaskVersions:
+    """Version and compare-and-set behaviour shared by all storage backends."""
+
+    @pytest.fixture(autouse=True)
+    def setup_service(self, task_repository):
+        """Create a service for each test and storage backend."""
+        self.task_repository = task_repository
+        self.task_service = TaskService(self.task_repository)
+
+    def test_every_write_bumps_the_version(self):
+        """Test that adding starts at version 1 and each update increments it."""
+        task = self.task_service.add_task("Versioned")
+        assert task.version == 1
+
+        self.task_service.update_task(task.id, title="Renamed")
+        completed = self.task_service.mark_task_complete(task.id)
+
+        assert completed.version == 3
+        assert self.task_repository.get_by_id(task.id).version == 3
+
+    def test_update_if_version_rejects_stale_writes(self):
+        """Test that a write based on an old version raises and leaves the task unchanged."""
+        task = self.task_service.add_task("Original")
+        stale = self.task_repository.get_by_id(task.id)
+        self.task_service.update_task(task.id, title="First writer")
+
+        stale.title = "Second writer"
+        with pytest.raises(VersionConflictError) as conflict:
+            self.task_repository.update_if_version(stale, stale.version)
+
+        assert (conflict.value.expected_version, conflict.value.actual_version) == (1, 2)
+        assert self.task_repository.get_by_id(task.id).title == "First writer"
+
+    def test_update_if_version_applies_current_writes(self):
+        """Test that a write at the current version is stored with the next version."""
+        task = self.task_service.add_task("Original")
+        current = self.task_repository.get_by_id(task.id)
+
+        current.title = "Changed"
+        updated = self.task_repository.update_if_version(current, 1)
+
+        assert updated.version == 2
+        assert self.task_repository.get_by_id(task.id).title == "Changed"
+        assert self.task_repository.update_if_version(Task(id="missing", title="x"), 1) is None
+
+    def test_service_surfaces_conflicts_for_expected_versions(self):
+        """Test that service updates with an outdated expected version raise instead of overwriting."""
+        task = self.task_service.add_task("Original")
+        self.task_service.mark_task_complete(task.id)
+
+        with pytest.raises(VersionConflictError):
+            self.task_service.update_task(task.id, title="Late edit", expected_version=1)
+        with pytest.raises(VersionConflictError):
+            self.task_service.mark_task_incomplete(task.id, expected_version=1)
+
+        stored = self.task_repository.get_by_id(task.id)
+        assert (stored.title, stored.status, stored.version) == ("Original", TaskStatus.COMPLETE, 2)
+        assert self.task_service.update_task(task.id, title="Fresh edit", expected_version=2).version == 3
+
+    def test_cli_update_if_version(self):
+        """Test that `update --if-version` succeeds at the current version and fails on a stale one."""
+        task = self.task_service.add_task("Original")
+        controller = CLIController(self.task_service)
+        sys.stdout = StringIO()
+        try:
+            assert controller.handle_command(["update", task.id, "Second", "--if-version", "1"]) == 0
+            assert "now version 2" in sys.stdout.getvalue()
+            assert controller.handle_command(["update", task.id, "Third", "--if-version", "1"]) == 1
+            assert "found 2" in sys.stdout.getvalue()
+        finally:
+            sys.stdout = sys.__stdout__
+        assert self.task_repository.get_by_id(task.id).title == "Second"
+
+    def test_http_put_with_stale_version_returns_conflict(self):
+        """Test that PUT with an old version answers 409 with the current todo."""
+        api = TaskHttpApi(self.task_service)
+        task = self.task_service.add_task("Original")
+        self.task_service.update_task(task.id, title="Newer")
+
+        status, body = api.handle("PUT", "/api/todos", f'{{"id": "{task.id}", "title": "Stale", "version": 1}}'.encode())
+
+        assert status == 409
+        assert body["success"] is False
+        assert body["data"]["title"] == "Newer" and body["data"]["version"] == 2
+
+        status, body = api.handle("PUT", "/api/todos", f'{{"id": "{task.id}", "completed": true, "version": 2}}'.encode())
+
+        assert status == 200
+        assert body["data"]["completed"] is True and body["data"]["version"] == 3
+
+
+@pytest.mark.parametrize("backend", ["log", "sqlite", "mmap"])
+def test_versions_survive_reopening(backend, tmp_path):
+    """Test that persistent backends store versions with the tasks."""
+    path = str(tmp_path / f"todo.{backend}")
+    repository = create_repository(backend, path)
+    service = TaskService(repository)
+    task = service.add_task("Persisted")
+    service.update_task(task.id, title="Renamed")
+    repository.close()
+
+    reopened = create_repository(backend, path)
+    try:
+        assert reopened.get_by_id(task.id).version == 2
+        with pytest.raises(VersionConflictError):
+            TaskService(reopened).update_task(task.id, title="Stale", expected_version=1)
+    finally:
+        reopened.close()
@@ -0,0 +1,130 @@
+"""
+Unit tests for the CachingTaskRepository.
+"""
+import pytest
+from src.entities.task import Task, TaskStatus
+from src.interfaces.caching_task_repository import ENTRY_OVERHEAD, CachingTaskRepository
+from src.interfaces.log_task_repository import LogTaskRepository
+from src.interfaces.task_repository import TaskRepository
+from src.use_cases.task_service import TaskService
+
+
+class CountingRepository(TaskRepository):
+    """In-memory repository that counts point reads and hands out copies, like a disk-backed store."""
+
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+
+    def get_by_id(self, task_id):
+        self.reads += 1
+        task = super().get_by_id(task_id)
+        return None if task is None else task.copy()
+
+    def get_many(self, task_ids):
+        return {task_id: task.copy() for task_id, task in super().get_many(task_ids).items()}
+
+
+class TestCachingTaskRepository:
+    """Test cases for the LRU read cache."""
+
+    def setup_method(self):
+        """Wrap a counting repository holding three tasks in a two-entry cache."""
+        self.inner = CountingRepository()
+        for task_id in ("1", "2", "3"):
+            self.inner.add(Task(id=task_id, title=f"Task {task_id}"))
+        self.inner.reads = 0
+        self.repository = CachingTaskRepository(self.inner, max_entries=2)
+
+    def test_repeated_reads_are_served_from_the_cache(self):
+        """Test that only the first read of an ID reaches the wrapped repository."""
+        for _ in range(3):
+            assert self.repository.get_by_id("1").title == "Task 1"
+        assert self.repository.get_by_id("missing") is None
+
+        stats = self.repository.stats()
+        assert self.inner.reads == 2
+        assert (stats.hits, stats.misses, stats.entries) == (2, 2, 1)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that the entry read longest ago is evicted when the cache is full."""
+        self.repository.get_by_id("1")
+        self.repository.get_by_id("2")
+        self.repository.get_by_id("1")
+        self.repository.get_by_id("3")
+        self.inner.reads = 0
+
+        self.repository.get_by_id("1")
+        self.repository.get_by_id("2")
+
+        assert self.inner.reads == 1
+        assert self.repository.stats().evictions == 2
+
+    def test_byte_budget_limits_cached_text(self):
+        """Test that the byte budget evicts entries once their estimated size exceeds it."""
+        repository = CachingTaskRepository(self.inner, max_entries=None, max_bytes=2 * ENTRY_OVERHEAD + 20)
+        self.inner.add(Task(id="long", title="x" * 500))
+
+        for task_id in ("1", "2", "long"):
+            repository.get_by_id(task_id)
+
+        stats = repository.stats()
+        assert stats.bytes <= 2 * ENTRY_OVERHEAD + 20
+        assert stats.entries == 0 and stats.evictions == 3
+
+    def test_writes_go_through_and_refresh_the_cache(self):
+        """Test that single writes cache the new state and deletes drop it."""
+        self.repository.get_by_id("1")
+        self.repository.update(Task(id="1", title="Renamed"))
+        self.repository.add(Task(id="4", title="Task 4"))
+        self.inner.reads = 0
+
+        assert self.repository.get_by_id("1").title == "Renamed"
+        assert self.repository.get_by_id("1").version == 2
+        assert self.inner.get_by_id("1").title == "Renamed"
+        assert self.repository.delete("1") is True
+        assert self.repository.get_by_id("1") is None
+
+    def test_bulk_writes_drop_cached_entries(self):
+        """Test that bulk updates, status changes and deletes never leave stale entries behind."""
+        service = TaskService(self.repository)
+        self.repository.get_many(["1", "2"])
+
+        self.repository.update_many([Task(id="1", title="Bulk renamed")])
+        service.mark_complete_many(["2"])
+
+        assert self.repository.get_by_id("1").title == "Bulk renamed"
+        assert self.repository.get_by_id("2").status == TaskStatus.COMPLETE
+        self.repository.delete_many(["1", "2"])
+        assert self.repository.get_many(["1", "2", "3"]).keys() == {"3"}
+
+    def test_cached_tasks_cannot_be_changed_in_place(self):
+        """Test that changing a returned task does not change what the cache serves."""
+        task = self.repository.get_by_id("1")
+        task.title = "Changed without saving"
+
+        assert self.repository.get_by_id("1").title == "Task 1"
+
+    def test_version_conflict_refreshes_a_stale_entry(self):
+        """Test that a write made behind the cache's back is picked up when an update conflicts with it."""
+        service = TaskService(self.repository)
+        self.repository.get_by_id("1")
+        self.inner.update(Task(id="1", title="Changed elsewhere"))
+
+        updated = service.mark_task_complete("1")
+
+        assert (updated.title, updated.status, updated.version) == ("Changed elsewhere", TaskStatus.COMPLETE, 3)
+        assert self.inner.get_by_id("1").status == TaskStatus.COMPLETE
+
+    def test_backend_specific_methods_are_forwarded(self, tmp_path):
+        """Test that methods only the wrapped backend has, such as flush, stay reachable."""
+        inner = LogTaskRepository(str(tmp_path / "todo.log"))
+        repository = CachingTaskRepository(inner)
+        repository.add(Task(id="1", title="Task 1"))
+
+        repository.flush()
+        repository.close()
+
+        assert inner._pending == 0
+        with pytest.raises(AttributeError):
+            repository.no_such_method()
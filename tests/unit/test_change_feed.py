@@ -0,0 +1,88 @@
+"""
+Unit tests for the ChangeFeed and its subscriptions.
+"""
+import threading
+import time
+import pytest
+from src.entities.task import Task
+from src.interfaces.change_feed import ChangeFeed, ChangeKind, MissedChangesError, StaleCursorError
+
+
+class TestChangeFeed:
+    """Test cases for publishing and reading change events."""
+
+    def setup_method(self):
+        """Create a feed that keeps the last three events."""
+        self.feed = ChangeFeed(retention=3)
+
+    def test_events_are_numbered_in_publish_order(self):
+        """Test that events get consecutive sequence numbers and are read back oldest first."""
+        self.feed.publish(ChangeKind.ADDED, "1", Task(id="1", title="First"))
+        self.feed.publish(ChangeKind.DELETED, "1")
+
+        events = self.feed.read()
+
+        assert [(event.seq, event.kind, event.task_id) for event in events] == [
+            (1, ChangeKind.ADDED, "1"), (2, ChangeKind.DELETED, "1")
+        ]
+        assert events[0].task.title == "First" and events[1].task is None
+        assert self.feed.last_seq == 2
+
+    def test_published_tasks_are_copied(self):
+        """Test that changing a task after publishing it does not change the event."""
+        task = Task(id="1", title="Published")
+        self.feed.publish(ChangeKind.ADDED, task.id, task)
+        task.title = "Changed afterwards"
+
+        assert self.feed.read()[0].task.title == "Published"
+
+    def test_subscriptions_resume_from_their_position(self):
+        """Test that a subscription hands out each event once and a new one can resume where it stopped."""
+        subscription = self.feed.subscribe(after=0)
+        self.feed.publish(ChangeKind.ADDED, "1", Task(id="1", title="One"))
+        assert [event.seq for event in subscription.poll()] == [1]
+        assert subscription.poll() == []
+
+        self.feed.publish(ChangeKind.ADDED, "2", Task(id="2", title="Two"))
+        self.feed.publish(ChangeKind.ADDED, "3", Task(id="3", title="Three"))
+        resumed = self.feed.subscribe(after=subscription.position)
+
+        assert [event.task_id for event in resumed.poll(limit=1)] == ["2"]
+        assert [event.task_id for event in resumed.poll()] == ["3"]
+        assert self.feed.subscribe().poll() == []
+
+    def test_cursors_name_a_position_in_this_feed_only(self):
+        """Test that a subscription's cursor resumes on its own feed and is refused by a new one."""
+        subscription = self.feed.subscribe(after=0)
+        self.feed.publish(ChangeKind.ADDED, "1", Task(id="1", title="One"))
+        subscription.poll()
+
+        assert subscription.cursor == f"{self.feed.epoch}:1"
+        assert self.feed.parse_cursor(subscription.cursor) == 1
+        restarted = ChangeFeed()
+        assert restarted.epoch != self.feed.epoch
+        with pytest.raises(StaleCursorError):
+            restarted.parse_cursor(subscription.cursor)
+
+    def test_falling_behind_the_retention_window_is_reported(self):
+        """Test that resuming before the oldest retained event raises instead of skipping changes."""
+        self.feed.publish_many((ChangeKind.DELETED, str(i), None) for i in range(5))
+
+        assert [event.seq for event in self.feed.read(after=2)] == [3, 4, 5]
+        with pytest.raises(MissedChangesError, match="oldest kept change is 3"):
+            self.feed.read(after=1)
+        with pytest.raises(ValueError, match="has not happened yet"):
+            self.feed.read(after=6)
+
+    def test_poll_waits_for_the_next_event(self):
+        """Test that a poll with a timeout returns as soon as another thread publishes."""
+        subscription = self.feed.subscribe()
+        publisher = threading.Timer(0.05, self.feed.publish, (ChangeKind.DELETED, "1"))
+        publisher.start()
+        started = time.monotonic()
+
+        events = subscription.poll(timeout=5)
+
+        publisher.join()
+        assert [event.task_id for event in events] == ["1"]
+        assert time.monotonic() - started < 5
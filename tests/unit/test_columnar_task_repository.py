@@ -0,0 +1,98 @@
+"""
+Unit tests for the ColumnarTaskRepository.
+"""
+import uuid
+import pytest
+from src.entities.task import Task, TaskStatus
+from src.interfaces.columnar_task_repository import ColumnarTaskRepository, _SCAN_BYTES
+
+
+def _new_id() -> str:
+    """Generate a task ID accepted by the columnar store."""
+    return str(uuid.uuid4())
+
+
+class TestColumnarTaskRepository:
+    """Test cases for the columnar in-memory repository."""
+
+    def setup_method(self):
+        """Set up a fresh repository for each test."""
+        self.repository = ColumnarTaskRepository()
+
+    def test_tasks_round_trip_through_columns(self):
+        """Test that all task fields are rebuilt from the columns."""
+        task = Task(id=_new_id(), title="Tâsk", description="", status=TaskStatus.COMPLETE)
+        self.repository.add(task)
+
+        assert self.repository.get_by_id(task.id) == task
+
+    def test_missing_description_stays_none(self):
+        """Test that a missing description is distinguished from an empty one."""
+        task = self.repository.add(Task(id=_new_id(), title="Task"))
+
+        assert self.repository.get_by_id(task.id).description is None
+
+    def test_get_all_preserves_insertion_order_across_deletes(self):
+        """Test that deleted slots are skipped and order is kept."""
+        tasks = [self.repository.add(Task(id=_new_id(), title=f"Task {i}")) for i in range(20)]
+
+        self.repository.delete(tasks[3].id)
+        self.repository.delete(tasks[9].id)
+
+        expected = [task.id for i, task in enumerate(tasks) if i not in (3, 9)]
+        assert [task.id for task in self.repository.get_all()] == expected
+
+    def test_returned_tasks_are_detached_copies(self):
+        """Test that mutating a returned task only takes effect through update."""
+        task = self.repository.add(Task(id=_new_id(), title="Task"))
+        loaded = self.repository.get_by_id(task.id)
+        loaded.mark_complete()
+
+        assert self.repository.get_by_id(task.id).status == TaskStatus.INCOMPLETE
+        self.repository.update(loaded)
+        assert self.repository.get_by_id(task.id).status == TaskStatus.COMPLETE
+
+    def test_compaction_keeps_live_tasks(self):
+        """Test that compaction after heavy churn preserves the live data."""
+        keep = self.repository.add(Task(id=_new_id(), title="Keep", description="me"))
+        for i in range(3000):
+            self.repository.delete(self.repository.add(Task(id=_new_id(), title=f"Task {i}")).id)
+
+        assert self.repository._dead_slots <= 1024
+        assert self.repository.get_all() == [keep]
+
+    def test_page_keys_survive_compaction(self):
+        """Test that a page cursor taken before compaction still resumes at the right task."""
+        tasks = [self.repository.add(Task(id=_new_id(), title=f"Task {i}")) for i in range(3)]
+        page, after = self.repository.get_page(1)
+        for i in range(3000):
+            self.repository.delete(self.repository.add(Task(id=_new_id(), title=f"Churn {i}")).id)
+
+        page, _ = self.repository.get_page(5, after)
+
+        assert page == tasks[1:]
+
+    def test_status_pages_cross_scan_blocks(self):
+        """Test that status pages seek and continue correctly across the blocks the bitsets are scanned in."""
+        count = _SCAN_BYTES * 8 * 2 + 10
+        self.repository.add_many(Task(id=_new_id(), title=f"Task {i}") for i in range(count))
+        tasks = self.repository.get_all()
+        done = [tasks[i] for i in (3, _SCAN_BYTES * 8 - 1, _SCAN_BYTES * 8, count - 1)]
+        for task in done:
+            task.status = TaskStatus.COMPLETE
+            self.repository.update(task)
+
+        first, after = self.repository.get_page(2, status=TaskStatus.COMPLETE)
+        rest, end = self.repository.get_page(2, after, TaskStatus.COMPLETE)
+
+        assert [task.id for task in first + rest] == [task.id for task in done]
+        assert end is None
+        assert self.repository.get_by_status(TaskStatus.COMPLETE) == first + rest
+
+    def test_non_uuid_ids_are_rejected_and_not_found(self):
+        """Test that IDs which cannot be packed are refused on add and missing on lookup."""
+        with pytest.raises(ValueError):
+            self.repository.add(Task(id="1", title="Task"))
+
+        assert self.repository.get_by_id("1") is None
+        assert self.repository.delete("1") is False
@@ -0,0 +1,190 @@
+"""
+Unit tests for the ConcurrentTaskRepository.
+"""
+import sys
+import threading
+import pytest
+from src.entities.task import Task, TaskStatus
+from src.interfaces.concurrent_task_repository import ConcurrentTaskRepository
+from src.use_cases.task_service import TaskService
+
+
+@pytest.fixture(autouse=True)
+def frequent_thread_switches():
+    """Switch threads far more often than usual so races show up within a short test."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def _run_threads(target, count):
+    """Run ``target(worker)`` on ``count`` threads and wait for all of them."""
+    threads = [threading.Thread(target=target, args=(worker,)) for worker in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+class TestConcurrentTaskRepository:
+    """Test cases for the lock-striped repository."""
+
+    def setup_method(self):
+        """Set up a fresh repository for each test."""
+        self.repository = ConcurrentTaskRepository()
+
+    def test_returned_tasks_are_copies(self):
+        """Test that mutating a returned or added task does not change the stored one."""
+        task = Task(id="1", title="Stored")
+        self.repository.add(task)
+        task.title = "Changed after add"
+        self.repository.get_by_id("1").title = "Changed after get"
+        self.repository.get_all()[0].mark_complete()
+
+        stored = self.repository.get_by_id("1")
+        assert stored.title == "Stored"
+        assert stored.status == TaskStatus.INCOMPLETE
+
+    def test_invalid_modify_stores_nothing(self):
+        """Test that a change leaving the task invalid raises and keeps the old task."""
+        self.repository.add(Task(id="1", title="Valid"))
+
+        def clear_title(task):
+            task.title = ""
+
+        with pytest.raises(ValueError):
+            self.repository.modify("1", clear_title)
+        assert self.repository.get_by_id("1").title == "Valid"
+
+    def test_concurrent_modifies_lose_no_updates(self):
+        """Test that counters incremented from many threads end at the exact total."""
+        for task_id in ("a", "b", "c"):
+            self.repository.add(Task(id=task_id, title="0"))
+
+        def increment(task):
+            task.title = str(int(task.title) + 1)
+
+        def worker(index):
+            for _ in range(300):
+                self.repository.modify("abc"[index % 3], increment)
+
+        _run_threads(worker, 9)
+
+        assert [self.repository.get_by_id(task_id).title for task_id in "abc"] == ["900"] * 3
+
+    def test_service_updates_of_different_fields_are_not_lost(self):
+        """Test that concurrent title and description updates through the service both land."""
+        service = TaskService(self.repository)
+        task_ids = [service.add_task(f"Task {i}").id for i in range(50)]
+
+        def worker(index):
+            for task_id in task_ids:
+                if index == 0:
+                    service.update_task(task_id, title="New title")
+                elif index == 1:
+                    service.update_task(task_id, description="New description")
+                else:
+                    service.mark_task_complete(task_id)
+
+        _run_threads(worker, 3)
+
+        for task in self.repository.get_all():
+            assert (task.title, task.description, task.status) == ("New title", "New description", TaskStatus.COMPLETE)
+
+    def test_full_scans_never_see_half_applied_writes(self):
+        """Test that snapshots taken during a stream of deletes and adds keep a constant count."""
+        for i in range(100):
+            self.repository.add(Task(id=f"task-{i}", title=f"Task {i}"))
+        done = threading.Event()
+        counts = []
+
+        def writer(_):
+            # Replace tasks one by one; each replacement is a delete then an add.
+            for i in range(100, 400):
+                self.repository.delete(f"task-{i - 100}")
+                self.repository.add(Task(id=f"task-{i}", title=f"Task {i}"))
+            done.set()
+
+        def reader(_):
+            while True:
+                finished = done.is_set()
+                tasks = self.repository.get_all()
+                summaries = list(self.repository.iter_summaries(TaskStatus.INCOMPLETE))
+                counts.append(len({task.id for task in tasks}))
+                counts.append(len(summaries))
+                if finished:
+                    break
+
+        _run_threads(lambda worker: writer(worker) if worker == 0 else reader(worker), 3)
+
+        assert counts and set(counts) <= {99, 100}
+        assert len(self.repository.get_all()) == 100
+
+    def test_searches_during_concurrent_renames_end_consistent(self):
+        """Test that the search index ends up matching the store when threads rename tasks while others search."""
+        service = TaskService(self.repository)
+        tasks = service.add_tasks((f"Task {i}", None) for i in range(8))
+        service.search_tasks("task")
+
+        def work(worker):
+            for round_number in range(30):
+                if worker % 2:
+                    service.search_tasks("renamed")
+                else:
+                    for task in tasks[worker::2]:
+                        service.update_task(task.id, title=f"Renamed {worker} {round_number}")
+
+        _run_threads(work, 4)
+
+        assert {task.id for task in service.search_tasks("renamed", limit=20)} == {
+            task.id for task in self.repository.get_all() if task.title.startswith("Renamed")
+        }
+        assert {task.id for task in service.search_tasks("29", limit=20)} == {
+            task.id for task in self.repository.get_all() if task.title.endswith(" 29")
+        }
+
+    def test_status_pages_stay_consistent_under_concurrent_status_changes(self):
+        """Test that threads toggling statuses leave each status's pages matching its tasks."""
+        for i in range(32):
+            self.repository.add(Task(id=str(i), title=f"Task {i}"))
+
+        def work(worker):
+            for round_number in range(100):
+                status = TaskStatus.COMPLETE if (worker + round_number) % 2 else TaskStatus.INCOMPLETE
+                for task_id in range(worker, 32, 4):
+                    self.repository.update(Task(id=str(task_id), title=f"Task {task_id}", status=status))
+
+        _run_threads(work, 4)
+
+        for status in TaskStatus:
+            page, _ = self.repository.get_page(100, status=status)
+            assert [task.id for task in page] == [task.id for task in self.repository.get_all()
+                                                  if task.status == status]
+
+    def test_unrelated_tasks_do_not_share_a_lock(self):
+        """Test that a write holding one task's stripe does not block a write to another task."""
+        first, second = "first", next(f"other-{i}" for i in range(1000)
+                                      if self.repository._stripe(f"other-{i}") is not self.repository._stripe("first"))
+        self.repository.add(Task(id=first, title="First"))
+        self.repository.add(Task(id=second, title="Second"))
+        entered, release = threading.Event(), threading.Event()
+
+        def slow_change(task):
+            entered.set()
+            release.wait(5)
+            task.title = "Slow"
+
+        holder = threading.Thread(target=self.repository.modify, args=(first, slow_change))
+        holder.start()
+        entered.wait(5)
+        try:
+            other = threading.Thread(target=self.repository.modify, args=(second, Task.mark_complete))
+            other.start()
+            other.join(5)
+            assert not other.is_alive()
+            assert self.repository.get_by_id(second).status == TaskStatus.COMPLETE
+        finally:
+            release.set()
+            holder.join()
+        assert self.repository.get_by_id(first).title == "Slow"
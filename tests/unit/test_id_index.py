@@ -0,0 +1,50 @@
+"""
+Unit tests for the sorted ID index and unique prefix computation.
+"""
+from src.interfaces.id_index import SortedIdIndex, unique_prefixes
+
+
+class TestSortedIdIndex:
+    """Test cases for the SortedIdIndex."""
+
+    def setup_method(self):
+        """Set up an index with a few IDs."""
+        self.index = SortedIdIndex(["3fa85f64", "3fb00000", "a1000000", "3fa8aaaa"])
+
+    def test_ids_are_kept_sorted(self):
+        """Test that iteration yields IDs in sorted order."""
+        self.index.add("00000000")
+
+        assert list(self.index) == sorted(["3fa85f64", "3fb00000", "a1000000", "3fa8aaaa", "00000000"])
+
+    def test_add_ignores_duplicates_and_remove_ignores_missing(self):
+        """Test that the index behaves like a set."""
+        self.index.add("a1000000")
+        self.index.remove("ffffffff")
+
+        assert len(self.index) == 4
+
+    def test_with_prefix_returns_matches_up_to_limit(self):
+        """Test that prefix lookups return the contiguous matching range."""
+        assert self.index.with_prefix("3fa8") == ["3fa85f64", "3fa8aaaa"]
+        assert self.index.with_prefix("3f", limit=3) == ["3fa85f64", "3fa8aaaa", "3fb00000"]
+        assert self.index.with_prefix("a") == ["a1000000"]
+        assert self.index.with_prefix("b") == []
+
+
+class TestUniquePrefixes:
+    """Test cases for unique_prefixes."""
+
+    def test_prefixes_are_unique_and_shortest(self):
+        """Test that each prefix is one character past the longest neighbour overlap."""
+        prefixes = unique_prefixes(sorted(["3fa85f64", "3fa8aaaa", "3fb00000", "a1000000"]), min_length=1)
+
+        assert prefixes == {"3fa85f64": "3fa85", "3fa8aaaa": "3fa8a", "3fb00000": "3fb", "a1000000": "a"}
+
+    def test_prefixes_respect_minimum_length(self):
+        """Test that prefixes are never shorter than the minimum."""
+        assert unique_prefixes(["a1000000"]) == {"a1000000": "a100"}
+
+    def test_empty_input(self):
+        """Test that no IDs give no prefixes."""
+        assert unique_prefixes([]) == {}
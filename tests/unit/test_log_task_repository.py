@@ -0,0 +1,302 @@
+"""
+Unit tests for the LogTaskRepository.
+"""
+import os
+import threading
+import pytest
+from src.entities.task import Task, TaskStatus
+from src.interfaces import log_task_repository
+from src.interfaces.log_task_repository import LogTaskRepository
+
+
+class TestLogTaskRepository:
+    """Test cases for the append-only log repository."""
+
+    @pytest.fixture(autouse=True)
+    def setup_path(self, tmp_path):
+        """Point each test at a fresh log file."""
+        self.path = str(tmp_path / "todo.log")
+
+    def _reopen(self, repository):
+        """Close the repository and replay its log into a new one."""
+        repository.close()
+        return LogTaskRepository(self.path)
+
+    def test_tasks_survive_reopen(self):
+        """Test that added tasks are replayed from the log."""
+        repository = LogTaskRepository(self.path)
+        repository.add(Task(id="1", title="Task 1", description="Description 1"))
+        repository.add(Task(id="2", title="Task 2"))
+
+        reopened = self._reopen(repository)
+
+        assert reopened.get_by_id("1").description == "Description 1"
+        assert reopened.get_by_id("2").title == "Task 2"
+        reopened.close()
+
+    def test_updates_and_deletes_are_replayed(self):
+        """Test that the latest state wins and deleted tasks stay deleted."""
+        repository = LogTaskRepository(self.path)
+        task = repository.add(Task(id="1", title="Task 1"))
+        repository.add(Task(id="2", title="Task 2"))
+        task.mark_complete()
+        repository.update(task)
+        repository.delete("2")
+
+        reopened = self._reopen(repository)
+
+        assert reopened.get_by_id("1").status == TaskStatus.COMPLETE
+        assert reopened.get_by_id("2") is None
+        reopened.close()
+
+    def test_page_keys_survive_reopen(self):
+        """Test that a page cursor taken before a restart resumes at the same task."""
+        repository = LogTaskRepository(self.path)
+        for i in range(4):
+            repository.add(Task(id=str(i), title=f"Task {i}"))
+        repository.delete("1")
+        _, after = repository.get_page(1)
+
+        reopened = self._reopen(repository)
+        page, _ = reopened.get_page(5, after)
+
+        assert [task.id for task in page] == ["2", "3"]
+        reopened.close()
+
+    def test_torn_final_record_is_ignored(self):
+        """Test that a partially written last record does not break replay."""
+        repository = LogTaskRepository(self.path)
+        repository.add(Task(id="1", title="Task 1"))
+        repository.close()
+        with open(self.path, "a", encoding="utf-8") as log:
+            log.write('{"op":"put","task":{"id":"2"')
+
+        reopened = LogTaskRepository(self.path)
+        assert [task.id for task in reopened.get_all()] == ["1"]
+        reopened.add(Task(id="3", title="Task 3"))
+
+        again = self._reopen(reopened)
+        assert [task.id for task in again.get_all()] == ["1", "3"]
+        again.close()
+
+    def test_torn_record_is_cut_before_new_records_are_appended(self):
+        """Test that replay truncates a torn record, so the next write starts on a line of its own."""
+        repository = LogTaskRepository(self.path)
+        repository.add(Task(id="1", title="Task 1"))
+        repository.close()
+        with open(self.path, "a", encoding="utf-8") as log:
+            log.write('{"op":"put","task":{"id":"2"')
+
+        reopened = LogTaskRepository(self.path)
+        reopened.add(Task(id="3", title="Task 3"))
+        reopened.update(Task(id="1", title="Renamed"))
+        reopened.close()
+
+        with open(self.path, encoding="utf-8") as log:
+            lines = log.read().split("\n")
+        assert lines[-1] == "" and all(line.startswith('{"op":"put"') and line.endswith("}") for line in lines[:-1])
+        again = LogTaskRepository(self.path)
+        assert [(task.id, task.title) for task in again.get_all()] == [("1", "Renamed"), ("3", "Task 3")]
+        again.close()
+
+    def test_torn_record_after_checkpoint_is_cut(self):
+        """Test that a torn record in the log written since a snapshot is cut off like any other."""
+        repository = LogTaskRepository(self.path)
+        repository.add(Task(id="1", title="Task 1"))
+        repository.checkpoint()
+        repository.close()
+        with open(self.path, "a", encoding="utf-8") as log:
+            log.write('{"op":"del","id":"1"')
+
+        reopened = LogTaskRepository(self.path)
+        reopened.add(Task(id="2", title="Task 2"))
+        again = self._reopen(reopened)
+
+        assert [task.id for task in again.get_all()] == ["1", "2"]
+        again.close()
+
+    def test_group_commit_syncs_after_batch_size(self):
+        """Test that pending records are synced once the batch fills up."""
+        repository = LogTaskRepository(self.path, group_commit_size=3, group_commit_interval=60)
+        repository.add(Task(id="1", title="Task 1"))
+        repository.add(Task(id="2", title="Task 2"))
+        assert repository._pending == 2
+
+        repository.add(Task(id="3", title="Task 3"))
+
+        assert repository._pending == 0
+        repository.close()
+
+    def test_checkpoint_replaces_log_with_snapshot(self):
+        """Test that a checkpoint leaves an empty log and a snapshot holding only live tasks."""
+        repository = LogTaskRepository(self.path)
+        task = repository.add(Task(id="1", title="Task 1", description="Description 1"))
+        repository.add(Task(id="2", title="Task 2"))
+        repository.add(Task(id="3", title="Task 3"))
+        for i in range(10):
+            task.title = f"Title {i}"
+            repository.update(task)
+        repository.delete("3")
+
+        repository.checkpoint()
+
+        assert os.path.getsize(self.path) == 0
+        assert sorted(os.listdir(os.path.dirname(self.path))) == ["todo.log", "todo.log.snapshot"]
+        reopened = self._reopen(repository)
+        restored = reopened.get_by_id("1")
+        assert (restored.title, restored.description, restored.version) == ("Title 9", "Description 1", 11)
+        assert [task.id for task in reopened.get_all()] == ["1", "2"]
+        reopened.add(Task(id="4", title="Task 4"))
+        # Sequence numbers of deleted tasks are not handed out again.
+        assert reopened.get_page(5, 3)[0] == [reopened.get_by_id("4")]
+        reopened.close()
+
+    def test_records_after_checkpoint_replay_over_snapshot(self):
+        """Test that writes logged after a checkpoint are applied on top of the snapshot."""
+        repository = LogTaskRepository(self.path)
+        repository.add(Task(id="1", title="Task 1"))
+        repository.add(Task(id="2", title="Task 2"))
+        repository.checkpoint()
+        repository.update(Task(id="1", title="Task 1", status=TaskStatus.COMPLETE))
+        repository.delete("2")
+        repository.add(Task(id="3", title="Task 3"))
+
+        reopened = self._reopen(repository)
+
+        assert [task.id for task in reopened.get_all()] == ["1", "3"]
+        assert reopened.get_by_id("1").status == TaskStatus.COMPLETE
+        assert reopened.get_by_id("1").version == 2
+        reopened.close()
+
+    def test_background_checkpoint_triggers_on_threshold(self):
+        """Test that logging past the checkpoint threshold snapshots the store."""
+        repository = LogTaskRepository(self.path, checkpoint_threshold=20)
+        task = repository.add(Task(id="1", title="Task 1"))
+        for i in range(25):
+            task.title = f"Title {i}"
+            repository.update(task)
+
+        reopened = self._reopen(repository)
+
+        assert os.path.exists(self.path + ".snapshot")
+        with open(self.path, encoding="utf-8") as log:
+            assert len(log.readlines()) < 26
+        assert reopened.get_by_id("1").title == "Title 24"
+        reopened.close()
+
+    def test_writers_continue_while_snapshot_is_written(self, monkeypatch):
+        """Test that writes are accepted while a checkpoint is still writing its snapshot."""
+        writing = threading.Event()
+        release = threading.Event()
+        original = log_task_repository.write_snapshot
+
+        def slow_write_snapshot(*args):
+            writing.set()
+            release.wait(5)
+            original(*args)
+
+        monkeypatch.setattr(log_task_repository, "write_snapshot", slow_write_snapshot)
+        repository = LogTaskRepository(self.path)
+        repository.add(Task(id="1", title="Task 1"))
+        checkpoint = threading.Thread(target=repository.checkpoint)
+        checkpoint.start()
+        assert writing.wait(5)
+
+        repository.add(Task(id="2", title="Task 2"))
+        repository.update(Task(id="1", title="Renamed"))
+        repository.flush()
+        release.set()
+        checkpoint.join()
+
+        reopened = self._reopen(repository)
+        assert [(task.id, task.title) for task in reopened.get_all()] == [("1", "Renamed"), ("2", "Task 2")]
+        reopened.close()
+
+    def test_checkpoint_keeps_lone_surrogates(self):
+        """Test that tasks with lone surrogates in their texts survive a checkpoint and reopen."""
+        repository = LogTaskRepository(self.path)
+        repository.add(Task(id="1", title="Bad \udce9 byte"))
+        repository.checkpoint()
+
+        reopened = self._reopen(repository)
+
+        assert reopened.get_by_id("1").title == "Bad \udce9 byte"
+        assert not os.path.exists(self.path + ".snapshot.tmp")
+        reopened.close()
+
+    def test_failed_background_checkpoint_is_reported_and_retried(self, monkeypatch, capsys):
+        """Test that a background checkpoint failure is reported, keeps the log replayable and is retried later."""
+        original = log_task_repository.write_snapshot
+        calls = []
+
+        def failing_once(*args):
+            calls.append(args[1])
+            if len(calls) == 1:
+                raise OSError("disk full")
+            original(*args)
+
+        monkeypatch.setattr(log_task_repository, "write_snapshot", failing_once)
+        repository = LogTaskRepository(self.path, checkpoint_threshold=10)
+        task = repository.add(Task(id="1", title="Task 1"))
+        for i in range(10):
+            task.title = f"Title {i}"
+            repository.update(task)
+        repository._wait_for_checkpoint()
+
+        assert "Checkpoint of" in capsys.readouterr().err
+        assert repository._tail_records == 11
+        for i in range(9):
+            task.title = f"Retry {i}"
+            repository.update(task)
+        repository._wait_for_checkpoint()
+        assert len(calls) == 1
+
+        for i in range(10):
+            task.title = f"Again {i}"
+            repository.update(task)
+        repository._wait_for_checkpoint()
+        assert len(calls) == 2
+        reopened = self._reopen(repository)
+        assert reopened.get_by_id("1").title == "Again 9"
+        assert not os.path.exists(self.path + ".1")
+        reopened.close()
+
+    def test_interrupted_checkpoints_recover(self):
+        """Test that segments left by interrupted checkpoints are replayed or discarded by generation."""
+        repository = LogTaskRepository(self.path)
+        repository.add(Task(id="1", title="Task 1"))
+        repository.checkpoint()
+        repository.add(Task(id="2", title="Task 2"))
+        repository.close()
+        # A checkpoint that renamed the log but stopped before writing its snapshot.
+        os.replace(self.path, self.path + ".2")
+        # One that wrote its snapshot but stopped before removing the segment it covers.
+        with open(self.path + ".1", "w", encoding="utf-8") as stale:
+            stale.write('{"op":"del","id":"1"}\n')
+
+        reopened = LogTaskRepository(self.path)
+        reopened.add(Task(id="3", title="Task 3"))
+
+        assert [task.id for task in reopened.get_all()] == ["1", "2", "3"]
+        assert not os.path.exists(self.path + ".1")
+        reopened.checkpoint()
+        assert not os.path.exists(self.path + ".2")
+        again = self._reopen(reopened)
+        assert [task.id for task in again.get_all()] == ["1", "2", "3"]
+        again.close()
+
+    def test_bulk_operations_share_one_commit(self):
+        """Test that a bulk call appends all records and syncs them together."""
+        repository = LogTaskRepository(self.path, group_commit_size=3, group_commit_interval=60)
+        tasks = repository.add_many([Task(id=str(i), title=f"Task {i}") for i in range(5)])
+        assert repository._pending == 0
+
+        for task in tasks:
+            task.mark_complete()
+        assert repository.update_many(tasks + [Task(id="missing", title="Task")])[-1] is None
+        assert repository.delete_many(["0", "1", "missing"]) == [True, True, False]
+
+        reopened = self._reopen(repository)
+        assert [task.id for task in reopened.get_all()] == ["2", "3", "4"]
+        assert all(task.status == TaskStatus.COMPLETE for task in reopened.get_all())
+        reopened.close()
@@ -0,0 +1,160 @@
+"""
+Unit tests for the MmapTaskRepository.
+"""
+import os
+import pytest
+from src.entities.task import Task, TaskStatus
+from src.interfaces.mmap_task_repository import MmapTaskRepository
+
+
+class TestMmapTaskRepository:
+    """Test cases for the memory-mapped record repository."""
+
+    @pytest.fixture(autouse=True)
+    def setup_repository(self, tmp_path):
+        """Open a repository on a fresh record file."""
+        self.path = str(tmp_path / "todo.mmap")
+        self.repository = MmapTaskRepository(self.path, initial_capacity=2)
+        yield
+        self.repository.close()
+
+    def _reopen(self):
+        """Close the repository and map the same file again."""
+        self.repository.close()
+        self.repository = MmapTaskRepository(self.path)
+
+    def test_tasks_survive_reopen(self):
+        """Test that records are read back after the file is remapped."""
+        self.repository.add(Task(id="1", title="Task 1", description="Description 1"))
+        self.repository.add(Task(id="2", title="Task 2", status=TaskStatus.COMPLETE))
+
+        self._reopen()
+
+        assert self.repository.get_by_id("1") == Task(id="1", title="Task 1", description="Description 1")
+        assert self.repository.get_by_id("2").status == TaskStatus.COMPLETE
+        assert self.repository.get_by_id("2").description is None
+
+    def test_long_texts_round_trip_through_heap(self):
+        """Test that texts longer than the inline head are loaded from the overflow heap."""
+        title = "Ä long title " * 10
+        description = "Ü long description " * 10
+        self.repository.add(Task(id="1", title=title, description=description))
+
+        self._reopen()
+
+        task = self.repository.get_by_id("1")
+        assert task.title == title
+        assert task.description == description
+
+    def test_summaries_are_read_from_records(self):
+        """Test that listing summaries are truncated like the table output."""
+        self.repository.add(Task(id="1", title="x" * 40, description="short"))
+
+        summary = next(self.repository.iter_summaries())
+
+        assert summary.id == "1"
+        assert summary.title == "x" * 27 + "..."
+        assert summary.description == "short"
+        assert summary.status == TaskStatus.INCOMPLETE
+
+    def test_file_grows_past_initial_capacity(self):
+        """Test that adding beyond the initial capacity remaps a larger file."""
+        for i in range(50):
+            self.repository.add(Task(id=str(i), title=f"Task {i}"))
+
+        self._reopen()
+
+        assert [task.id for task in self.repository.get_all()] == [str(i) for i in range(50)]
+
+    def test_deleted_records_are_skipped(self):
+        """Test that tombstoned records disappear from lookups and listings."""
+        self.repository.add(Task(id="1", title="Task 1"))
+        self.repository.add(Task(id="2", title="Task 2"))
+
+        assert self.repository.delete("1") is True
+        self._reopen()
+
+        assert self.repository.get_by_id("1") is None
+        assert [summary.id for summary in self.repository.iter_summaries()] == ["2"]
+        assert self.repository.delete("1") is False
+
+    def test_overlong_id_is_rejected(self):
+        """Test that IDs wider than the fixed record field are refused."""
+        with pytest.raises(ValueError):
+            self.repository.add(Task(id="x" * 37, title="Task"))
+
+        assert self.repository.get_all() == []
+
+    def _heap_size(self):
+        """Size of the overflow heap file in bytes."""
+        return os.path.getsize(self.path + ".heap")
+
+    def test_unchanged_long_texts_are_not_rewritten(self):
+        """Test that completing a task with long texts reuses their heap bytes."""
+        task = self.repository.add(Task(id="1", title="T" * 100, description="D" * 100))
+        size = self._heap_size()
+
+        task.status = TaskStatus.COMPLETE
+        self.repository.update(task)
+        task.status = TaskStatus.INCOMPLETE
+        self.repository.update(task)
+
+        assert self._heap_size() == size
+        assert self.repository.get_by_id("1") == Task(id="1", title="T" * 100, description="D" * 100)
+
+    def test_heap_is_compacted_past_the_garbage_threshold(self):
+        """Test that replaced texts are dropped from the heap once the garbage outweighs live texts."""
+        self.repository.close()
+        self.repository = MmapTaskRepository(self.path, heap_compact_threshold=1000)
+        self.repository.add(Task(id="keep", title="K" * 100))
+        for i in range(20):
+            self.repository.add(Task(id="1", title=f"{i:02d}" + "x" * 98))
+
+        assert self._heap_size() < 1000 + 2 * 100
+        self._reopen()
+        assert self.repository.get_by_id("keep").title == "K" * 100
+        assert self.repository.get_by_id("1").title == "19" + "x" * 98
+
+    def test_close_compacts_a_heap_that_is_mostly_garbage(self):
+        """Test that closing drops deleted texts once they outweigh the live ones."""
+        self.repository.add(Task(id="1", title="A" * 100))
+        self.repository.add(Task(id="2", title="B" * 100, description="C" * 100))
+        self.repository.delete("2")
+
+        self._reopen()
+
+        assert self._heap_size() == 100
+        assert self.repository.get_by_id("1").title == "A" * 100
+
+    def test_writes_are_visible_before_close(self):
+        """Test that a second repository reads records and heap texts written by one still open."""
+        self.repository.add(Task(id="1", title="L" * 100))
+
+        other = MmapTaskRepository(self.path)
+        try:
+            assert other.get_by_id("1").title == "L" * 100
+        finally:
+            other.close()
+
+    def test_texts_that_are_not_valid_utf8_round_trip(self):
+        """Test that lone surrogates, as from undecodable arguments, are stored and keep the store readable."""
+        title = "Bad \udcff byte"
+        description = "Long \udce9 " * 10
+        self.repository.add(Task(id="1", title=title, description=description))
+        self.repository.add(Task(id="2", title="Next"))
+
+        assert [task.title for task in self.repository.get_all()] == [title, "Next"]
+        assert next(self.repository.iter_summaries()).title == title
+        self._reopen()
+        assert self.repository.get_by_id("1") == Task(id="1", title=title, description=description)
+
+    def test_task_that_cannot_be_encoded_leaves_no_record(self):
+        """Test that a failed add claims no slot, so the rest of the store stays readable."""
+        task = Task(id="1", title="Valid")
+        task.title = None
+
+        with pytest.raises(AttributeError):
+            self.repository.add(task)
+
+        assert self.repository.get_by_id("1") is None
+        assert self.repository.get_all() == []
@@ -0,0 +1,57 @@
+"""
+Unit tests for the SearchIndex.
+"""
+from src.entities.task import Task
+from src.use_cases.search_index import SearchIndex, tokenize
+
+
+class TestSearchIndex:
+    """Test cases for the inverted full-text index."""
+
+    def setup_method(self):
+        """Set up an index with a few tasks."""
+        self.index = SearchIndex()
+        self.index.add_many([
+            Task(id="1", title="Buy groceries", description="Milk, bread, eggs"),
+            Task(id="2", title="Bake bread", description="Sourdough"),
+            Task(id="3", title="Call plumber", description="Kitchen sink leaks"),
+        ])
+
+    def _ids(self, query):
+        """Return the matching task IDs in rank order."""
+        return [task_id for task_id, _ in self.index.search(query)]
+
+    def test_tokenize_lowercases_and_strips_punctuation(self):
+        """Test that tokens are lowercase words."""
+        assert tokenize("Milk, Bread & EGGS!") == ["milk", "bread", "eggs"]
+
+    def test_terms_are_and_ed_by_default(self):
+        """Test that every term must match."""
+        assert self._ids("bread milk") == ["1"]
+
+    def test_or_matches_either_group(self):
+        """Test that OR returns tasks matching any group."""
+        assert sorted(self._ids("plumber OR sourdough")) == ["2", "3"]
+
+    def test_title_matches_rank_above_description_matches(self):
+        """Test that a title hit outranks a description hit."""
+        assert self._ids("bread") == ["2", "1"]
+
+    def test_reindexing_replaces_old_terms(self):
+        """Test that re-adding a task drops terms it no longer contains."""
+        self.index.add(Task(id="3", title="Call electrician"))
+
+        assert self._ids("plumber") == []
+        assert self._ids("electrician") == ["3"]
+
+    def test_removed_tasks_are_not_found(self):
+        """Test that removed tasks disappear from results and postings."""
+        self.index.remove("3")
+
+        assert self._ids("plumber") == []
+        assert "plumber" not in self.index._postings
+        assert len(self.index) == 2
+
+    def test_limit_caps_results(self):
+        """Test that only the best results up to the limit are returned."""
+        assert len(self.index.search("bread", limit=1)) == 1
@@ -0,0 +1,131 @@
+"""
+Unit tests for the SqliteTaskRepository.
+"""
+import sqlite3
+import pytest
+from src.entities.task import Task, TaskStatus
+from src.interfaces.change_feed import ChangeKind
+from src.interfaces.sqlite_task_repository import SqliteTaskRepository
+
+
+class TestSqliteTaskRepository:
+    """Test cases for the SQLite repository."""
+
+    @pytest.fixture(autouse=True)
+    def setup_repository(self, tmp_path):
+        """Open a repository on a fresh database file."""
+        self.path = str(tmp_path / "todo.db")
+        self.repository = SqliteTaskRepository(self.path)
+        yield
+        self.repository.close()
+
+    def test_database_uses_wal_journal(self):
+        """Test that connections are opened in WAL mode."""
+        with self.repository._connection() as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+
+        assert mode == "wal"
+
+    def test_tasks_persist_across_instances(self):
+        """Test that tasks are readable from a second repository on the same file."""
+        self.repository.add(Task(id="1", title="Task 1", description="Description 1"))
+
+        other = SqliteTaskRepository(self.path)
+        task = other.get_by_id("1")
+        other.close()
+
+        assert task.title == "Task 1"
+        assert task.description == "Description 1"
+        assert task.status == TaskStatus.INCOMPLETE
+
+    def test_seqs_of_deleted_last_tasks_are_not_reused(self):
+        """Test that a cursor still resumes at new tasks after the tasks at the end of the table are deleted."""
+        self.repository.add_many([Task(id=str(i), title=f"Task {i}") for i in range(1, 4)])
+        _, after = self.repository.get_page(2)
+        self.repository.delete_many(["2", "3"])
+        added = self.repository.add(Task(id="3", title="Task 3"))
+
+        page, _ = self.repository.get_page(5, after)
+
+        assert [task.id for task in page] == [added.id]
+
+    def test_database_without_autoincrement_is_migrated(self, tmp_path):
+        """Test that a database whose seq reused rowids is upgraded with its rows and order intact."""
+        path = str(tmp_path / "old.db")
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE tasks (seq INTEGER PRIMARY KEY, id TEXT NOT NULL UNIQUE, title TEXT NOT NULL,"
+                     " description TEXT, status TEXT NOT NULL, version INTEGER NOT NULL DEFAULT 1)")
+        conn.executemany("INSERT INTO tasks (seq, id, title, status) VALUES (?, ?, ?, 'incomplete')",
+                         [(1, "a", "Task a"), (5, "b", "Task b")])
+        conn.commit()
+        conn.close()
+
+        repository = SqliteTaskRepository(path)
+        repository.delete("b")
+        repository.add(Task(id="c", title="Task c"))
+        page, _ = repository.get_page(5, 5)
+        tasks = repository.get_all()
+        repository.close()
+
+        assert [task.id for task in page] == ["c"]
+        assert [task.id for task in tasks] == ["a", "c"]
+
+    def test_add_many_preserves_insertion_order(self):
+        """Test that bulk inserts are returned in insertion order."""
+        tasks = [Task(id=str(i), title=f"Task {i}") for i in range(100)]
+
+        self.repository.add_many(tasks)
+
+        assert [task.id for task in self.repository.get_all()] == [str(i) for i in range(100)]
+
+    def test_readding_existing_id_keeps_position(self):
+        """Test that re-adding an ID overwrites it in place, like the in-memory store."""
+        self.repository.add(Task(id="1", title="Task 1"))
+        self.repository.add(Task(id="2", title="Task 2"))
+
+        self.repository.add(Task(id="1", title="Replaced"))
+
+        assert [task.title for task in self.repository.get_all()] == ["Replaced", "Task 2"]
+
+    def test_add_many_reads_back_versions_of_existing_ids(self):
+        """Test that bulk re-adding an ID reports its stored version and publishes it as updated."""
+        self.repository.add(Task(id="1", title="Task 1"))
+        subscription = self.repository.changes.subscribe()
+
+        added = self.repository.add_many([Task(id="1", title="Replaced"), Task(id="2", title="Task 2")])
+
+        assert [task.version for task in added] == [2, 1]
+        assert self.repository.get_by_id("1").version == 2
+        assert [event.kind for event in subscription.poll()] == [ChangeKind.UPDATED, ChangeKind.ADDED]
+
+    def test_update_and_delete_report_missing_tasks(self):
+        """Test that update and delete signal when the task does not exist."""
+        assert self.repository.update(Task(id="missing", title="Title")) is None
+        assert self.repository.delete("missing") is False
+
+    def test_pool_never_exceeds_configured_size(self):
+        """Test that nested borrows reuse at most pool_size connections."""
+        repository = SqliteTaskRepository(self.path, pool_size=2)
+        with repository._connection():
+            with repository._connection():
+                pass
+        with repository._connection():
+            pass
+
+        assert len(repository._connections) == 2
+        repository.close()
+
+    def test_bulk_update_and_delete(self):
+        """Test that bulk update and delete report missing tasks per entry."""
+        self.repository.add_many([Task(id=str(i), title=f"Task {i}") for i in range(3)])
+
+        results = self.repository.update_many([
+            Task(id="0", title="Changed", status=TaskStatus.COMPLETE),
+            Task(id="missing", title="Task")
+        ])
+        deleted = self.repository.delete_many(["1", "missing"])
+
+        assert results[0].title == "Changed" and results[1] is None
+        assert deleted == [True, False]
+        assert self.repository.get_many(["0", "1", "2"]).keys() == {"0", "2"}
+        assert self.repository.get_by_id("0").status == TaskStatus.COMPLETE
@@ -34,6 +34,13 @@ class TestTask:
         with pytest.raises(ValueError):
             Task(id="1", title="")
 
+    def test_task_with_non_string_fields_raises_error(self):
+        """Test that titles and descriptions of other types are rejected."""
+        with pytest.raises(ValueError, match="title must be a string"):
+            Task(id="1", title=["a"])
+        with pytest.raises(ValueError, match="description must be a string"):
+            Task(id="1", title="Test Task", description=5)
+
     def test_mark_complete_changes_status(self):
         """Test that marking a task as complete changes its status."""
         task = Task(id="1", title="Test Task", status=TaskStatus.INCOMPLETE)
@@ -55,4 +62,9 @@ class TestTask:
             "description": "Test Description",
             "status": "complete"
         }
-        assert task.to_dict() == expected_dict
\ No newline at end of file
+        assert task.to_dict() == expected_dict
+
+    def test_task_uses_slots(self):
+        """Test that tasks do not carry a per-instance __dict__."""
+        task = Task(id="1", title="Test Task")
+        assert not hasattr(task, "__dict__")
\ No newline at end of file
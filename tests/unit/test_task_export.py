@@ -0,0 +1,63 @@
+"""
+Unit tests for the streaming export writers.
+"""
+from io import StringIO
+import csv
+import json
+from src.entities.task import Task, TaskStatus
+from src.interfaces import task_render
+from src.interfaces.task_export import write_csv, write_json, write_ndjson
+
+
+TASKS = [
+    Task(id="1", title="Task \"one\"", description="Line\nbreak"),
+    Task(id="2", title="Task, two", status=TaskStatus.COMPLETE),
+]
+
+
+class TestExportWriters:
+    """Test cases for the NDJSON, CSV and JSON writers."""
+
+    def test_write_ndjson_matches_to_dict(self):
+        """Test that each line decodes to the task's dictionary form plus its version."""
+        out = StringIO()
+
+        assert write_ndjson(iter(TASKS), out) == 2
+
+        assert [json.loads(line) for line in out.getvalue().splitlines()] == [dict(task.to_dict(), version=task.version) for task in TASKS]
+
+    def test_write_json_produces_one_array(self):
+        """Test that the JSON writer emits a valid array, including when empty."""
+        out = StringIO()
+        empty = StringIO()
+
+        assert write_json(iter(TASKS), out) == 2
+        assert write_json(iter([]), empty) == 0
+
+        assert json.loads(out.getvalue()) == [dict(task.to_dict(), version=task.version) for task in TASKS]
+        assert json.loads(empty.getvalue()) == []
+
+    def test_write_csv_quotes_fields(self):
+        """Test that CSV output round-trips commas, quotes and newlines."""
+        out = StringIO()
+
+        assert write_csv(iter(TASKS), out) == 2
+
+        rows = list(csv.DictReader(StringIO(out.getvalue())))
+        assert rows[0]["title"] == 'Task "one"'
+        assert rows[0]["description"] == "Line\nbreak"
+        assert rows[1]["title"] == "Task, two"
+        assert rows[1]["status"] == "complete"
+
+    def test_output_is_written_in_chunks(self, monkeypatch):
+        """Test that output is flushed in several writes once it passes the chunk size."""
+        monkeypatch.setattr(task_render, "CHUNK_SIZE", 100)
+        writes = []
+
+        class Recorder:
+            def write(self, data):
+                writes.append(data)
+
+        write_ndjson((Task(id=str(i), title=f"Task {i}") for i in range(50)), Recorder())
+
+        assert 1 < len(writes) < 50
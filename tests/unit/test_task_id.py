@@ -0,0 +1,108 @@
+"""
+Unit tests for task ID generators and the binary ID form.
+"""
+import threading
+import uuid
+import pytest
+from src.entities.task_id import (
+    TimeOrderedIdGenerator, create_id_generator, id_from_bytes, id_to_bytes, random_id
+)
+
+
+class TestTimeOrderedIdGenerator:
+    """Test cases for version 7 UUID generation."""
+
+    def test_ids_are_valid_version_7_uuids(self):
+        """Test that IDs are canonical UUID strings with the version and variant set."""
+        task_id = TimeOrderedIdGenerator()()
+
+        parsed = uuid.UUID(task_id)
+
+        assert str(parsed) == task_id
+        assert parsed.version == 7
+        assert parsed.variant == uuid.RFC_4122
+
+    def test_ids_start_with_the_timestamp(self):
+        """Test that the first 48 bits hold the clock's time in milliseconds."""
+        generator = TimeOrderedIdGenerator(clock=lambda: 1_700_000_000_123_456_789)
+
+        assert uuid.UUID(generator()).int >> 80 == 1_700_000_000_123
+
+    def test_ids_sort_in_creation_order(self):
+        """Test that many IDs generated in a tight loop, mostly within one millisecond, keep increasing."""
+        generator = TimeOrderedIdGenerator()
+
+        ids = [generator() for _ in range(10_000)]
+
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+
+    def test_clock_going_backwards_keeps_order(self):
+        """Test that IDs keep increasing when the clock steps back."""
+        times = iter([5_000_000_000, 4_000_000_000, 3_000_000_000])
+        generator = TimeOrderedIdGenerator(clock=lambda: next(times))
+
+        ids = [generator() for _ in range(3)]
+
+        assert ids == sorted(ids)
+        assert {uuid.UUID(task_id).int >> 80 for task_id in ids} == {5000}
+
+    def test_counter_overflow_moves_to_the_next_millisecond(self):
+        """Test that exhausting the counter within one millisecond carries into the timestamp."""
+        generator = TimeOrderedIdGenerator(clock=lambda: 5_000_000_000)
+        first = generator()
+        generator._counter = (1 << 42) - 1
+
+        second = generator()
+
+        assert second > first
+        assert uuid.UUID(second).int >> 80 == 5001
+
+    def test_ids_are_unique_across_threads(self):
+        """Test that a generator shared between threads never repeats or reorders an ID within a thread."""
+        generator = TimeOrderedIdGenerator()
+        results = [[] for _ in range(4)]
+
+        def generate(ids):
+            for _ in range(2000):
+                ids.append(generator())
+
+        threads = [threading.Thread(target=generate, args=(ids,)) for ids in results]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert all(ids == sorted(ids) for ids in results)
+        assert len({task_id for ids in results for task_id in ids}) == 8000
+
+
+class TestIdHelpers:
+    """Test cases for the generator factory and the 16-byte ID form."""
+
+    def test_create_id_generator(self):
+        """Test that formats map to generators and unknown formats are rejected."""
+        assert create_id_generator("uuid4") is random_id
+        assert uuid.UUID(create_id_generator("uuid7")()).version == 7
+        assert uuid.UUID(random_id()).version == 4
+        with pytest.raises(ValueError, match="Unknown ID format"):
+            create_id_generator("sequential")
+
+    def test_binary_form_round_trips_and_keeps_order(self):
+        """Test that IDs pack into 16 bytes that sort like the strings."""
+        generator = TimeOrderedIdGenerator()
+        ids = [generator() for _ in range(100)] + [random_id() for _ in range(100)]
+
+        packed = [id_to_bytes(task_id) for task_id in ids]
+
+        assert all(len(raw) == 16 for raw in packed)
+        assert [id_from_bytes(raw) for raw in packed] == ids
+        assert sorted(packed) == [id_to_bytes(task_id) for task_id in sorted(ids)]
+        assert id_to_bytes(ids[0]) == uuid.UUID(ids[0]).bytes
+
+    def test_binary_form_rejects_other_ids(self):
+        """Test that IDs that are not UUID strings cannot be packed."""
+        for task_id in ("1", "not-a-uuid", "0" * 36, "0000000g-0000-0000-0000-000000000000",
+                        "00000000-0000-0000-0000-00000000000 "):
+            with pytest.raises(ValueError):
+                id_to_bytes(task_id)
@@ -0,0 +1,55 @@
+"""
+Unit tests for the streaming import parsers.
+"""
+from io import StringIO
+import pytest
+from src.entities.task import TaskStatus
+from src.interfaces.task_import import parse_csv, parse_ndjson
+
+
+class TestImportParsers:
+    """Test cases for the NDJSON and CSV parsers."""
+
+    def test_parse_ndjson_skips_blank_lines(self):
+        """Test that each non-blank line becomes one entry."""
+        stream = StringIO('{"title": "Task 1", "description": "D", "status": "done"}\n\n{"title": "Task 2"}\n')
+
+        entries = list(parse_ndjson(stream))
+
+        assert entries == [("Task 1", "D", TaskStatus.COMPLETE), ("Task 2", None, TaskStatus.INCOMPLETE)]
+
+    def test_parse_csv_treats_empty_description_as_missing(self):
+        """Test that CSV rows map columns by header and empty cells to None."""
+        stream = StringIO("title,description,status\nTask 1,,complete\nTask 2,Details,todo\n")
+
+        entries = list(parse_csv(stream))
+
+        assert entries == [("Task 1", None, TaskStatus.COMPLETE), ("Task 2", "Details", TaskStatus.INCOMPLETE)]
+
+    def test_parsers_are_lazy(self):
+        """Test that records are parsed only as they are consumed."""
+        stream = StringIO('{"title": "Task 1"}\nnot json\n')
+
+        entries = parse_ndjson(stream)
+
+        assert next(entries)[0] == "Task 1"
+        with pytest.raises(ValueError):
+            next(entries)
+
+    def test_unknown_status_is_rejected(self):
+        """Test that unrecognised statuses raise ValueError."""
+        with pytest.raises(ValueError):
+            list(parse_ndjson(StringIO('{"title": "Task", "status": "blocked"}\n')))
+
+    def test_fields_of_other_types_are_rejected_with_their_line(self):
+        """Test that non-string titles, descriptions and statuses raise ValueError naming the line."""
+        for record in ('{"title": "x", "description": 5}', '{"title": ["x"]}', '{"title": "x", "status": true}'):
+            with pytest.raises(ValueError, match=r"must be a string.* \(line 3\)$"):
+                list(parse_ndjson(StringIO('{"title": "Fine"}\n\n' + record + '\n')))
+
+    def test_csv_errors_name_their_line(self):
+        """Test that CSV errors count the header and quoted line breaks."""
+        stream = StringIO('title,status\n"Two\nlines",todo\nBad,blocked\n')
+
+        with pytest.raises(ValueError, match=r"Unknown status: blocked \(line 4\)"):
+            list(parse_csv(stream))
@@ -0,0 +1,120 @@
+"""
+Unit tests for operation metrics and TaskService instrumentation.
+"""
+import pytest
+from src.interfaces.task_repository import TaskRepository
+from src.use_cases.task_metrics import LATENCY_BUCKETS, NOT_FOUND, MetricsSink, OperationMetrics
+from src.use_cases.task_service import TaskService
+
+
+class RecordingSink(MetricsSink):
+    """Sink that keeps every record it receives."""
+
+    def __init__(self):
+        self.records = []
+
+    def record(self, operation, seconds, error=None):
+        self.records.append((operation, error))
+
+
+class TestOperationMetrics:
+    """Test cases for the in-memory metrics sink."""
+
+    def setup_method(self):
+        """Create an empty sink."""
+        self.metrics = OperationMetrics()
+
+    def test_calls_errors_and_latency_are_aggregated(self):
+        """Test that records are counted per operation, with errors by name and latency by bucket."""
+        self.metrics.record("add_task", 0.00004)
+        self.metrics.record("add_task", 0.003)
+        self.metrics.record("delete_task", 0.0001, NOT_FOUND)
+        self.metrics.record("delete_task", 100.0, "OSError")
+
+        snapshot = self.metrics.snapshot()
+
+        assert list(snapshot) == ["add_task", "delete_task"]
+        add = snapshot["add_task"]
+        assert add.calls == 2 and add.errors == {}
+        assert add.total_seconds == pytest.approx(0.00304)
+        assert add.buckets[0] == 1 and add.buckets[LATENCY_BUCKETS.index(0.005)] == 1
+        delete = snapshot["delete_task"]
+        assert delete.errors == {NOT_FOUND: 1, "OSError": 1}
+        assert delete.buckets[-1] == 1
+
+    def test_quantiles_are_bucket_bounds(self):
+        """Test that quantiles report the bound of the bucket they fall in."""
+        for _ in range(99):
+            self.metrics.record("list_tasks", 0.0002)
+        self.metrics.record("list_tasks", 0.2)
+
+        stats = self.metrics.snapshot()["list_tasks"]
+
+        assert stats.quantile(0.5) == 0.00025
+        assert stats.quantile(0.99) == 0.00025
+        assert stats.quantile(1.0) == 0.25
+
+    def test_snapshots_are_copies_and_reset_clears(self):
+        """Test that a snapshot does not change with later records, and reset forgets everything."""
+        self.metrics.record("add_task", 0.001)
+        snapshot = self.metrics.snapshot()
+        self.metrics.record("add_task", 0.001, "ValueError")
+
+        assert snapshot["add_task"].calls == 1 and snapshot["add_task"].errors == {}
+        self.metrics.reset()
+        assert self.metrics.snapshot() == {}
+
+
+class TestServiceInstrumentation:
+    """Test cases for TaskService reporting its operations to a sink."""
+
+    def setup_method(self):
+        """Create a service that reports to a recording sink."""
+        self.sink = RecordingSink()
+        self.task_service = TaskService(TaskRepository(), metrics=self.sink)
+
+    def test_successful_calls_are_recorded(self):
+        """Test that each operation is recorded once under its name."""
+        task = self.task_service.add_task("Measured")
+        self.task_service.update_task(task.id, title="Renamed")
+        self.task_service.list_tasks()
+
+        assert self.sink.records == [("add_task", None), ("update_task", None), ("list_tasks", None)]
+
+    def test_missing_tasks_count_as_not_found(self):
+        """Test that updating or deleting a missing task, alone or in a batch, records not_found."""
+        task = self.task_service.add_task("Present")
+        self.sink.records.clear()
+
+        assert self.task_service.update_task("missing", title="New") is None
+        assert self.task_service.delete_task("missing") is False
+        self.task_service.delete_tasks([task.id, "missing"])
+
+        assert self.sink.records == [
+            ("update_task", NOT_FOUND), ("delete_task", NOT_FOUND), ("delete_tasks", NOT_FOUND)
+        ]
+
+    def test_exceptions_are_recorded_by_type_and_raised(self):
+        """Test that a failing call records its exception's class name and still raises."""
+        with pytest.raises(ValueError):
+            self.task_service.add_task("")
+
+        assert self.sink.records == [("add_task", "ValueError")]
+
+    def test_iterators_are_recorded_when_consumed(self):
+        """Test that an operation returning an iterator is recorded once it is exhausted."""
+        self.task_service.add_task("Streamed")
+        self.sink.records.clear()
+
+        summaries = self.task_service.list_summaries()
+        assert self.sink.records == []
+        assert len(list(summaries)) == 1
+        assert self.sink.records == [("list_summaries", None)]
+
+    def test_uninstrumented_service_has_no_wrappers(self):
+        """Test that without a sink the service's operations are its plain methods."""
+        task_service = TaskService(TaskRepository())
+
+        assert task_service.metrics is None
+        assert "add_task" not in vars(task_service)
+        assert "add_task" in vars(self.task_service)
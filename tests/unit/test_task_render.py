@@ -0,0 +1,63 @@
+"""
+Unit tests for the buffered list renderers.
+"""
+from io import StringIO
+from src.entities.task import Task, TaskStatus
+from src.interfaces.task_render import render_table, render_tsv
+
+
+TASKS = [
+    Task(id="1", title="Tab\there", description="Line\nbreak \\ slash"),
+    Task(id="2", title="A" * 40, status=TaskStatus.COMPLETE, version=3),
+]
+
+
+class TestRenderers:
+    """Test cases for the table and TSV renderers."""
+
+    def test_render_table_pads_and_labels_rows(self):
+        """Test that the table has a header, padded columns and status labels."""
+        out = StringIO()
+
+        assert render_table((task.to_summary() for task in TASKS), out) == 2
+
+        lines = out.getvalue().splitlines()
+        assert lines[0].startswith("ID" + " " * 35 + "Status")
+        assert set(lines[1]) == {"-"}
+        assert lines[2].startswith("1" + " " * 36 + "TODO")
+        assert "DONE" in lines[-1] and "A" * 27 + "..." in lines[-1]
+
+    def test_render_table_writes_nothing_when_empty(self):
+        """Test that an empty listing writes no header."""
+        out = StringIO()
+
+        assert render_table(iter([]), out) == 0
+        assert out.getvalue() == ""
+
+    def test_render_table_uses_short_ids(self):
+        """Test that short IDs replace full IDs and narrow the ID column."""
+        out = StringIO()
+
+        render_table([TASKS[0].to_summary()], out, {"1": "1"})
+
+        assert out.getvalue().splitlines()[2].startswith("1  TODO")
+
+    def test_render_table_with_no_short_ids(self):
+        """Test that an empty listing with short IDs requested writes nothing instead of failing."""
+        out = StringIO()
+
+        assert render_table(iter([]), out, {}) == 0
+        assert out.getvalue() == ""
+
+    def test_render_tsv_escapes_and_keeps_full_text(self):
+        """Test that TSV rows stay on one line and are not truncated."""
+        out = StringIO()
+
+        assert render_tsv(iter(TASKS), out) == 2
+
+        lines = out.getvalue().splitlines()
+        assert lines == [
+            "id\tstatus\ttitle\tdescription\tversion",
+            "1\tincomplete\tTab\\there\tLine\\nbreak \\\\ slash\t0",
+            "2\tcomplete\t" + "A" * 40 + "\t\\N\t3",
+        ]
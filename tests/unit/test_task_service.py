@@ -3,6 +3,8 @@ Unit tests for the TaskService.
 """
 import pytest
 from src.entities.task import Task, TaskStatus
+from src.entities.task_id import create_id_generator
+from src.interfaces.id_index import AmbiguousIdError, PrefixTooShortError
 from src.interfaces.task_repository import TaskRepository
 from src.use_cases.task_service import TaskService
 
@@ -33,6 +35,24 @@ class TestTaskService:
         assert task.description is None
         assert task.status == TaskStatus.INCOMPLETE
 
+    def test_new_tasks_take_ids_from_the_configured_generator(self):
+        """Test that single, batch and imported tasks all get IDs from the service's generator."""
+        ids = iter(f"id-{i}" for i in range(10))
+        service = TaskService(TaskRepository(), id_generator=lambda: next(ids))
+
+        service.add_task("First")
+        service.add_tasks([("Second", None), ("Third", None)])
+        list(service.import_tasks([("Fourth", None, TaskStatus.COMPLETE)]))
+
+        assert [task.id for task in service.list_tasks()] == ["id-0", "id-1", "id-2", "id-3"]
+
+    def test_time_ordered_ids_list_in_creation_order(self):
+        """Test that with uuid7 IDs, sorted ID order matches the order tasks were added."""
+        service = TaskService(TaskRepository(), id_generator=create_id_generator("uuid7"))
+        added = [service.add_task(f"Task {i}").id for i in range(50)]
+
+        assert list(service.task_repository.iter_sorted_ids()) == added
+
     def test_list_tasks_returns_empty_list_when_no_tasks(self):
         """Test that listing tasks returns an empty list when there are no tasks."""
         tasks = self.task_service.list_tasks()
@@ -70,6 +90,18 @@ class TestTaskService:
 
         assert result is None
 
+    def test_update_task_validates_the_changed_task(self):
+        """Test that an update leaving the task invalid raises and stores nothing."""
+        task = self.task_service.add_task("Valid")
+
+        with pytest.raises(ValueError, match="title cannot be empty"):
+            self.task_service.update_task(task.id, title="")
+        with pytest.raises(ValueError, match="description must be a string"):
+            self.task_service.update_task(task.id, description=["a"])
+
+        stored = self.task_service.list_tasks()[0]
+        assert (stored.title, stored.description, stored.version) == ("Valid", None, 1)
+
     def test_update_task_with_all_fields(self):
         """Test that updating a task with all fields works correctly."""
         original_task = self.task_service.add_task("Original Title", "Original Description")
@@ -132,7 +164,7 @@ class TestTaskService:
         task = self.task_service.add_task("Test Title")
         # First mark as complete
         self.task_service.mark_task_complete(task.id)
-        assert task.status == TaskStatus.COMPLETE
+        assert self.task_repository.get_by_id(task.id).status == TaskStatus.COMPLETE
 
         incomplete_task = self.task_service.mark_task_incomplete(task.id)
 
@@ -142,4 +174,177 @@ class TestTaskService:
         """Test that marking a non-existent task as incomplete returns None."""
         result = self.task_service.mark_task_incomplete("non-existent-id")
 
-        assert result is None
\ No newline at end of file
+        assert result is None
+
+    def test_list_tasks_filters_by_status(self):
+        """Test that listing by status returns only matching tasks."""
+        task1 = self.task_service.add_task("Task 1")
+        task2 = self.task_service.mark_task_complete(self.task_service.add_task("Task 2").id)
+
+        assert self.task_service.list_tasks(status=TaskStatus.INCOMPLETE) == [task1]
+        assert self.task_service.list_tasks(status=TaskStatus.COMPLETE) == [task2]
+
+    def test_status_index_follows_status_changes_and_deletes(self):
+        """Test that the repository status index is kept current incrementally."""
+        task = self.task_service.add_task("Task")
+        self.task_service.mark_task_complete(task.id)
+        self.task_service.mark_task_incomplete(task.id)
+
+        assert self.task_service.list_tasks(status=TaskStatus.COMPLETE) == []
+        assert self.task_service.list_tasks(status=TaskStatus.INCOMPLETE) == [task]
+
+        self.task_service.delete_task(task.id)
+
+        assert self.task_service.list_tasks(status=TaskStatus.INCOMPLETE) == []
+
+    def test_search_tasks_reflects_adds_updates_and_deletes(self):
+        """Test that the search index follows service mutations after it is built."""
+        task = self.task_service.add_task("Write report", "Quarterly numbers")
+        assert self.task_service.search_tasks("report") == [task]
+
+        later = self.task_service.add_task("Review report")
+        self.task_service.update_task(task.id, title="Write summary")
+        assert self.task_service.search_tasks("report") == [later]
+
+        self.task_service.delete_task(later.id)
+        assert self.task_service.search_tasks("report") == []
+
+    def test_resolve_task_id_accepts_unique_prefix(self):
+        """Test that a unique prefix resolves to the full ID."""
+        task = self.task_service.add_task("Task")
+
+        assert self.task_service.resolve_task_id(task.id[:8]) == task.id
+        assert self.task_service.resolve_task_id(task.id) == task.id
+        assert self.task_service.resolve_task_id("zzzz") is None
+
+    def test_resolve_task_id_rejects_ambiguous_prefix(self):
+        """Test that a prefix shared by several tasks raises AmbiguousIdError."""
+        self.task_repository.add(Task(id="abcd1", title="Task 1"))
+        self.task_repository.add(Task(id="abcd2", title="Task 2"))
+
+        with pytest.raises(AmbiguousIdError):
+            self.task_service.resolve_task_id("abcd")
+        assert self.task_service.resolve_task_id("abcd2") == "abcd2"
+
+    def test_resolve_task_ids_reject_short_prefixes(self):
+        """Test that empty and too-short prefixes are refused even when unique, but short full IDs resolve."""
+        task = self.task_service.add_task("Only task")
+        # Not a hex digit, so no prefix of the UUID can be this exact ID.
+        self.task_repository.add(Task(id="x", title="Short ID"))
+
+        for prefix in ("", task.id[:1], task.id[:3]):
+            with pytest.raises(PrefixTooShortError):
+                self.task_service.resolve_task_id(prefix)
+            with pytest.raises(PrefixTooShortError):
+                self.task_service.resolve_task_ids([task.id, prefix])
+        assert self.task_service.resolve_task_id(task.id[:4]) == task.id
+        assert self.task_service.resolve_task_ids(["x"]) == ["x"]
+
+    def test_add_tasks_adds_all_entries(self):
+        """Test that bulk add creates one task per entry."""
+        tasks = self.task_service.add_tasks([("Task 1", "Description 1"), ("Task 2", None)])
+
+        assert [task.title for task in self.task_service.list_tasks()] == ["Task 1", "Task 2"]
+        assert tasks[0].description == "Description 1"
+        assert tasks[1].description is None
+
+    def test_add_tasks_is_all_or_nothing_on_invalid_entry(self):
+        """Test that an invalid entry prevents the whole batch from being stored."""
+        with pytest.raises(ValueError):
+            self.task_service.add_tasks([("Task 1", None), ("", None)])
+
+        assert self.task_service.list_tasks() == []
+
+    def test_update_tasks_validates_before_writing(self):
+        """Test that one invalid change in a bulk update leaves every task unchanged."""
+        tasks = self.task_service.add_tasks([("Task 1", None), ("Task 2", None)])
+
+        with pytest.raises(ValueError):
+            self.task_service.update_tasks([(tasks[0].id, "Renamed", None), (tasks[1].id, None, 5)])
+
+        assert [task.title for task in self.task_service.list_tasks()] == ["Task 1", "Task 2"]
+
+    def test_update_tasks_reports_missing_tasks(self):
+        """Test that bulk update changes existing tasks and returns None for missing ones."""
+        task = self.task_service.add_task("Old title", "Old description")
+
+        results = self.task_service.update_tasks([(task.id, "New title", None), ("missing", "Title", None)])
+
+        assert results[0].title == "New title"
+        assert results[0].description == "Old description"
+        assert results[1] is None
+
+    def test_mark_complete_many_and_incomplete_many(self):
+        """Test that bulk status changes apply to every found task."""
+        tasks = self.task_service.add_tasks([("Task 1", None), ("Task 2", None)])
+        ids = [task.id for task in tasks]
+
+        completed = self.task_service.mark_complete_many(ids + ["missing"])
+
+        assert [task.status for task in completed[:2]] == [TaskStatus.COMPLETE] * 2
+        assert completed[2] is None
+        assert self.task_service.list_tasks(status=TaskStatus.COMPLETE) == completed[:2]
+
+        self.task_service.mark_incomplete_many(ids[:1])
+        assert self.task_service.list_tasks(status=TaskStatus.INCOMPLETE) == tasks[:1]
+
+    def test_delete_tasks_removes_from_search_index(self):
+        """Test that bulk delete removes tasks from the repository and search index."""
+        tasks = self.task_service.add_tasks([("Alpha report", None), ("Beta report", None)])
+        assert len(self.task_service.search_tasks("report")) == 2
+
+        assert self.task_service.delete_tasks([tasks[0].id, "missing"]) == [True, False]
+
+        assert self.task_service.search_tasks("report") == [tasks[1]]
+        assert self.task_service.list_tasks() == [tasks[1]]
+
+    def test_import_tasks_writes_in_batches(self):
+        """Test that imported entries are stored in batches of the given size."""
+        entries = ((f"Task {i}", None, TaskStatus.COMPLETE if i % 2 else TaskStatus.INCOMPLETE) for i in range(5))
+
+        batches = list(self.task_service.import_tasks(entries, batch_size=2))
+
+        assert batches == [2, 2, 1]
+        assert len(self.task_service.list_tasks()) == 5
+        assert len(self.task_service.list_tasks(status=TaskStatus.COMPLETE)) == 2
+
+    def test_import_tasks_stops_at_invalid_record(self):
+        """Test that an invalid entry names its record and keeps the valid ones before it."""
+        entries = [("Task 1", None, TaskStatus.INCOMPLETE), ("", None, TaskStatus.INCOMPLETE)]
+
+        with pytest.raises(ValueError, match="Record 2"):
+            list(self.task_service.import_tasks(entries, batch_size=10))
+
+        assert [task.title for task in self.task_service.list_tasks()] == ["Task 1"]
+
+    def test_list_tasks_page_walks_all_tasks_with_cursors(self):
+        """Test that following next cursors visits every task once, in insertion order."""
+        tasks = self.task_service.add_tasks([(f"Task {i}", None) for i in range(7)])
+        self.task_service.delete_task(tasks[2].id)
+
+        seen = []
+        page = self.task_service.list_tasks_page(3)
+        while True:
+            seen.extend(page.tasks)
+            if page.next_cursor is None:
+                break
+            page = self.task_service.list_tasks_page(3, page.next_cursor)
+
+        assert seen == [task for i, task in enumerate(tasks) if i != 2]
+
+    def test_list_tasks_page_filters_by_status(self):
+        """Test that a status filter applies across pages."""
+        tasks = self.task_service.add_tasks([(f"Task {i}", None) for i in range(5)])
+        self.task_service.mark_complete_many([tasks[1].id, tasks[3].id, tasks[4].id])
+
+        first = self.task_service.list_tasks_page(2, status=TaskStatus.COMPLETE)
+        second = self.task_service.list_tasks_page(2, first.next_cursor, TaskStatus.COMPLETE)
+
+        assert [task.id for task in first.tasks] == [tasks[1].id, tasks[3].id]
+        assert [task.id for task in second.tasks] == [tasks[4].id]
+        assert second.next_cursor is None
+
+    def test_list_tasks_page_rejects_invalid_cursor(self):
+        """Test that a malformed cursor raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            self.task_service.list_tasks_page(10, "not a cursor!")
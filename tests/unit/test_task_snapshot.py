@@ -0,0 +1,73 @@
+"""
+Unit tests for binary task snapshots.
+"""
+import os
+import pytest
+from src.entities.task import Task, TaskStatus
+from src.interfaces.task_snapshot import read_snapshot, write_snapshot
+
+
+class TestTaskSnapshot:
+    """Test cases for writing and reading snapshot files."""
+
+    @pytest.fixture(autouse=True)
+    def setup_path(self, tmp_path):
+        """Point each test at a fresh snapshot file."""
+        self.path = str(tmp_path / "todo.snapshot")
+
+    def test_round_trip_preserves_every_field(self):
+        """Test that tasks, sequence numbers and versions are read back unchanged."""
+        tasks = [
+            (1, Task(id="1", title="Plain", version=3)),
+            (4, Task(id="2", title="Ünïcode ✓", description="", status=TaskStatus.COMPLETE, version=1)),
+            (9, Task(id="3", title="Described", description="Line one\nline two 🚀", version=7)),
+        ]
+
+        write_snapshot(self.path, 5, 12, tasks)
+        generation, next_seq, entries = read_snapshot(self.path)
+        restored = list(entries)
+
+        assert (generation, next_seq) == (5, 12)
+        assert restored == tasks
+        assert [task.version for _, task in restored] == [3, 1, 7]
+        assert restored[0][1].description is None and restored[1][1].description == ""
+
+    def test_lone_surrogates_round_trip(self):
+        """Test that texts holding lone surrogates are written and read back unchanged."""
+        tasks = [(1, Task(id="1", title="Bad \udce9 byte", description="\ud800 alone"))]
+
+        write_snapshot(self.path, 1, 2, tasks)
+        _, _, entries = read_snapshot(self.path)
+
+        assert list(entries) == tasks
+
+    def test_failed_write_keeps_previous_snapshot(self, monkeypatch):
+        """Test that a snapshot that cannot be written leaves the previous one and no temporary file."""
+        write_snapshot(self.path, 1, 2, [(1, Task(id="1", title="Kept"))])
+
+        def failing_fsync(fd):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "fsync", failing_fsync)
+        with pytest.raises(OSError):
+            write_snapshot(self.path, 2, 3, [(1, Task(id="1", title="Lost"))])
+
+        assert not os.path.exists(self.path + ".tmp")
+        generation, _, entries = read_snapshot(self.path)
+        assert generation == 1 and [task.title for _, task in entries] == ["Kept"]
+
+    def test_empty_store(self):
+        """Test that a snapshot of an empty store reads back no tasks."""
+        write_snapshot(self.path, 1, 1, [])
+
+        generation, next_seq, entries = read_snapshot(self.path)
+
+        assert (generation, next_seq, list(entries)) == (1, 1, [])
+
+    def test_other_files_are_rejected(self):
+        """Test that a file that is not a snapshot raises ValueError."""
+        with open(self.path, "wb") as other:
+            other.write(b'{"op":"put"}\n' * 4)
+
+        with pytest.raises(ValueError):
+            read_snapshot(self.path)